@@ -2070,6 +2070,7 @@ class CaseLL(object):
                 *x*-coordinate of MRP divided by reference length
         :Versions:
             * 2017-02-02 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; compute MRP offsets once
         """
         # Get the current loads
         CN0  = np.trapz(self.CN,  self.x)
@@ -2102,13 +2103,15 @@ class CaseLL(object):
             sig = np.ones(n)
         # Weights
         w = mxCN / sig
+        # Offset of each station from MRP
+        dx = self.x - xMRP
         # Calculate the increment from each mode
         dCN = np.zeros(n)
         dCLM = np.zeros(n)
         # Loop through modes
         for i in range(n):
             dCN[i]  = np.trapz(UCN[:,i], self.x)
-            dCLM[i] = np.trapz(UCN[:,i]*(xMRP-self.x), self.x)
+            dCLM[i] = np.trapz(-UCN[:,i]*dx, self.x)
         # Form matrix for linear system
         dC = np.array([dCN, dCLM])
         # First two equations: equality constraints on *CN* and *CLM*
@@ -2125,7 +2128,7 @@ class CaseLL(object):
         phi = np.dot(UCN, x[:n])
         # Apply increment
         self.CN  = self.CN + phi
-        self.CLM = self.CLM + (self.x-xMRP)*phi
+        self.CLM = self.CLM + dx*phi
 
 
 
@@ -2175,6 +2178,7 @@ class CaseLL(object):
                 *x*-coordinate of MRP divided by reference length
         :Versions:
             * 2017-02-02 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; compute MRP offsets once
         """
         # Get the current loads
         CY0  = np.trapz(self.CY,  self.x)
@@ -2207,13 +2211,15 @@ class CaseLL(object):
             sig = np.ones(n)
         # Weights
         w = mxCY / sig
+        # Offset of each station from MRP
+        dx = self.x - xMRP
         # Calculate the increment from each mode
         dCY = np.zeros(n)
         dCLN = np.zeros(n)
         # Loop through modes
         for i in range(n):
             dCY[i]  = np.trapz(UCY[:,i], self.x)
-            dCLN[i] = np.trapz(UCY[:,i]*(self.x-xMRP), self.x)
+            dCLN[i] = np.trapz(UCY[:,i]*dx, self.x)
         # Form matrix for linear system
         dC = np.array([dCY, dCLN])
         # First two equations: equality constraints on *CN* and *CLM*
@@ -2230,7 +2236,7 @@ class CaseLL(object):
         phi = np.dot(UCY, x[:n])
         # Apply increment
         self.CY  = self.CY + phi
-        self.CLN = self.CLN - (self.x-xMRP)*phi
+        self.CLN = self.CLN - dx*phi
 
 
     # Correct *CN* and *CLM* given two functions
@@ -2264,6 +2270,7 @@ class CaseLL(object):
                 *x*-coordinate of MRP divided by reference length
         :Versions:
             * 2016-12-27 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; compute MRP offsets once
         """
         # Get the current loads
         CN0  = np.trapz(self.CN,  self.x)
@@ -2283,9 +2290,11 @@ class CaseLL(object):
         if np.abs(dCN2)>1e-4:
             CN2 = CN2/dCN2
             dCN2 = 1.0
+        # Offset of each station from MRP
+        dx = xMRP - self.x
         # Get moment correction functions
-        CLM1 = (xMRP - self.x) * CN1
-        CLM2 = (xMRP - self.x) * CN2
+        CLM1 = dx * CN1
+        CLM2 = dx * CN2
         # Integrated values of $\Delta C_{LM}$
         dCLM1 = np.trapz(CLM1, self.x)
         dCLM2 = np.trapz(CLM2, self.x)
@@ -2334,6 +2343,7 @@ class CaseLL(object):
                 *x*-coordinate of MRP divided by reference length
         :Versions:
             * 2016-12-27 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; compute MRP offsets once
         """
         # Get the current loads
         CY0  = np.trapz(self.CY,  self.x)
@@ -2353,9 +2363,11 @@ class CaseLL(object):
         if np.abs(dCY2)>1e-4:
             CY2 = CY2/dCY2
             dCY2 = 1.0
+        # Offset of each station from MRP
+        dx = xMRP - self.x
         # Get moment correction functions
-        CLN1 = (xMRP - self.x) * CY1
-        CLN2 = (xMRP - self.x) * CY2
+        CLN1 = dx * CY1
+        CLN2 = dx * CY2
         # Integrated values of $\Delta C_{LM}$
         dCLN1 = np.trapz(-CLN1, self.x)
         dCLN2 = np.trapz(-CLN2, self.x)
@@ -2483,6 +2495,18 @@ class CaseSeam(object):
     :Versions:
         * 2016-06-09 ``@ddalle``: First version
     """
+    # Attributes
+    __slots__ = (
+        "fname",
+        "proj",
+        "comp",
+        "n",
+        "ax",
+        "x",
+        "y",
+        "z",
+    )
+
     # Initialization method
     def __init__(self, fname, comp='entire', proj='LineLoad'):
         """Initialization method
@@ -168,6 +168,9 @@ follow. The options listed on this page are top-level options of the main JSON
 file that are not part of any section.
     """
 
+    # No attributes beyond those of OptionsDict
+    __slots__ = ()
+
     # Accepted options/sections
     _optlist = {
         "BatchPBS",
@@ -307,6 +310,7 @@ file that are not part of any section.
                 Options interface
         :Versions:
             * 2014-10-08 ``@ddalle``: Version 1.0
+            * 2026-10-17 ``@agent``: Version 1.1; use isinstance()
         """
         # Get the "PythonPath" option
         lpath = self.get("PythonPath", [])
@@ -314,7 +318,7 @@ file that are not part of any section.
         if (not lpath):
             return
         # Ensure list.
-        if type(lpath).__name__ != "list":
+        if not isinstance(lpath, list):
             lpath = [lpath]
         # Loop through elements.
         for fdir in lpath:
@@ -616,11 +620,12 @@ file that are not part of any section.
                 List of initialization commands
         :Versions:
             * 2015-11-08 ``@ddalle``: Moved to "RunControl"
+            * 2026-10-17 ``@agent``: Version 1.1; use isinstance()
         """
         # Get the commands.
         cmds = self.get('ShellCmds', [])
         # Turn to a list if not.
-        if type(cmds).__name__ != 'list':
+        if not isinstance(cmds, list):
             cmds = cmds.split(';')
         # Check type
         if typ in ["batch"]:
@@ -633,7 +638,7 @@ file that are not part of any section.
             # No additional commands
             cmds_a = []
         # Turn to a list if necessary
-        if type(cmds_a).__name__ != 'list':
+        if not isinstance(cmds_a, list):
             cmds_a = cmds_a.split(';')
         # Output
         return cmds + cmds_a
@@ -670,9 +675,13 @@ file that are not part of any section.
         :Versions:
             * 2014-10-06 ``@ddalle``: Version 1.0
             * 2022-10-23 ``@ddalle``: Version 1.1; hard-code default
+            * 2026-10-17 ``@agent``: Version 1.2; no temporary ``{}``
         """
         # Safely get the trajectory.
-        x = self.get('RunMatrix', {})
+        x = self.get('RunMatrix')
+        # Default if no run matrix section
+        if x is None:
+            return False
         return x.get('GroupMesh', False)
 
     # Method to specify that meshes do or do not use the same mesh
@@ -710,6 +719,7 @@ file that are not part of any section.
                 File permissions mask (``None`` only if *sys* is ``False``)
         :Versions:
             * 2015-09-27 ``@ddalle``: Version 1.0
+            * 2026-10-17 ``@agent``: Version 1.1; use isinstance()
         """
         # Read the option.
         umask = self.get('umask')
@@ -717,16 +727,15 @@ file that are not part of any section.
         if umask is None:
             # Check for system defaults
             if sys and os.name != "nt":
-                # Get the value.
-                umask = os.popen('umask', 'r').read()
-                # Convert to value.
-                umask = eval('0o' + umask.strip())
+                # Get the process's mask by setting and restoring it
+                umask = os.umask(0)
+                os.umask(umask)
             else:
                 # No setting
                 return None
-        elif type(umask).__name__ in ['str', 'unicode']:
+        elif isinstance(umask, str):
             # Convert to octal
-            umask = eval('0o' + str(umask).strip().lstrip('0o'))
+            umask = int(umask.strip().lstrip('0o'), 8)
         # Output
         return umask
 
@@ -19,10 +19,17 @@ import io
 import json
 import os
 import re
+from collections import deque
 
 # Third-party imports
 import numpy as np
 
+# Optional third-party imports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Local imports
 from ...optdict import OptionsDict, BOOL_TYPES
 
@@ -42,6 +49,9 @@ CapeFolder = os.path.split(_CFDXFolder)[0]
 # Parent folder
 BaseFolder = os.path.split(CapeFolder)[0]
 
+# Defaults already read: absolute path -> (mtime, size, defs)
+_DEFAULTS_CACHE = {}
+
 # Backup default settings
 rc = {
     "NSubmit": 10,
@@ -525,6 +535,35 @@ def expandJSONFile(fname):
     return txt, fnames, linenos
 
 
+# Parse JSON text, using fast parser if available
+def _loads(txt):
+    r"""Parse JSON text, using :mod:`orjson` if it is installed
+
+    Text that :mod:`orjson` rejects (for example ``NaN``) is passed to
+    :func:`json.loads`, which also gives the usual error messages.
+
+    :Call:
+        >>> d = _loads(txt)
+    :Inputs:
+        *txt*: :class:`str`
+            JSON text with comments already removed
+    :Outputs:
+        *d*: :class:`dict`
+            JSON contents in Python form
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Try the compiled parser first
+    if orjson is not None:
+        try:
+            return orjson.loads(txt)
+        except orjson.JSONDecodeError:
+            # Fall back to standard library
+            pass
+    # Standard library parser
+    return json.loads(txt)
+
+
 # Function to read JSON file with all the works
 def loadJSONFile(fname):
     r"""Read JSON file w/ helpful error handling and comment stripping
@@ -539,13 +578,14 @@ def loadJSONFile(fname):
             JSON contents in Python form
     :Versions:
         * 2015-12-15 ``@ddalle``: Version 1.0
+        * 2026-10-17 ``@agent``: Version 1.1; use :mod:`orjson` if avail
     """
     # Read the input file
     txt, fnames, linenos = expandJSONFile(fname)
     # Process into dictionary
     try:
         # Process into dictionary
-        d = json.loads(txt)
+        d = _loads(txt)
     except Exception as e:
         # Get the line number
         try:
@@ -608,9 +648,18 @@ def getDefaults(fname):
     :Versions:
         * 2014-06-03 ``@ddalle``: Version 1.0
         * 2014-07-28 ``@ddalle``: Version 1.1; in options module
+        * 2026-10-17 ``@agent``: Version 1.2; reuse unchanged file
     """
-    # Process the default input file.
-    return loadJSONFile(fname)
+    # Absolute path and status to check for previous read
+    fabs = os.path.abspath(fname)
+    st = os.stat(fabs)
+    mtime, size, defs = _DEFAULTS_CACHE.get(fabs, (None, None, None))
+    # Process the default input file unless unchanged since last read
+    if (mtime, size) != (st.st_mtime_ns, st.st_size):
+        defs = loadJSONFile(fabs)
+        _DEFAULTS_CACHE[fabs] = (st.st_mtime_ns, st.st_size, defs)
+    # Copy so callers can modify the result
+    return copy.deepcopy(defs)
 
 
 # Function to get the default CAPE settings
@@ -667,16 +716,21 @@ def applyDefaults(opts, defs):
     :Versions:
         * 2014-06-17 ``@ddalle``: Version 1.0
         * 2014-07-28 ``@ddalle``: Version 1.1; move to options module
+        * 2026-10-17 ``@agent``: Version 1.2; iterative, w/o recursion
     """
-    # Loop through the keys in the options dict.
-    for k in defs:
-        # Check if the key is non-default.
-        if k not in opts:
-            # Assign the key.
-            opts[k] = defs[k]
-        elif (type(opts[k]) is dict) and (not k.startswith("Ref")):
-            # Recurse for dictionaries.
-            opts[k] = applyDefaults(opts[k], defs[k])
+    # Queue of (options, defaults) pairs to merge
+    queue = deque([(opts, defs)])
+    # Loop until all nested dicts are merged
+    while queue:
+        # Get next pair
+        optsj, defsj = queue.popleft()
+        # Loop through the keys in the defaults dict
+        for k, vdef in defsj.items():
+            # Assign the key if missing, else get current value
+            v = optsj.setdefault(k, vdef)
+            # Merge dictionaries (other than reference quantities) later
+            if v is not vdef and type(v) is dict and not k.startswith("Ref"):
+                queue.append((v, vdef))
     # Output the modified defaults.
     return opts
 
@@ -8,6 +8,8 @@ applications.
 
 """
 
+# Third-party modules
+import numpy as np
     
 # Volume of a pyramid
 def VOLPYM(XP,YP,ZP, XA,YA,ZA, XB,YB,ZB, XC,YC,ZC, XD,YD,ZD):
@@ -231,3 +233,83 @@ def VolTriPrism(X1,Y1,Z1, X2,Y2,Z2, X3,Y3,Z3, X4,Y4,Z4, X5,Y5,Z5, X6,Y6,Z6):
     # Output total volume
     return V1 + V2 + V3 + V4 + V5
 
+
+
+# Volume of triangular prisms from arrays of vertices
+def VolTriPrismArray(XB, XT):
+    r"""Compute the volume of triangular prisms from vertex arrays
+
+    This is the same calculation as :func:`VolTriPrism`, but the
+    coordinates of the three base vertices and three top vertices are
+    given as two arrays instead of 18 separate coordinates.
+
+    :Call:
+        >>> V = VolTriPrismArray(XB, XT)
+    :Inputs:
+        *XB*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 3, 3)
+            Coordinates of points 1, 2, 3 at base of each prism
+        *XT*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 3, 3)
+            Coordinates of points 4, 5, 6 at top of each prism
+    :Outputs:
+        *V*: :class:`np.ndarray`\ [:class:`float`], shape=(n,)
+            Volume of each prism
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Vertices
+    P1, P2, P3 = XB[:, 0], XB[:, 1], XB[:, 2]
+    P4, P5, P6 = XT[:, 0], XT[:, 1], XT[:, 2]
+    # Middle of the prism
+    P7 = (1.0/6.0) * (np.sum(XB, axis=1) + np.sum(XT, axis=1))
+    # Compute volumes of the three pyramids and two tetrahedra
+    V1 = _volpym(P7, P1, P4, P5, P2)
+    V2 = _volpym(P7, P1, P3, P6, P4)
+    V3 = _volpym(P7, P2, P5, P6, P3)
+    V4 = _voltet(P7, P1, P2, P3)
+    V5 = _voltet(P7, P6, P5, P4)
+    # Output total volume
+    return V1 + V2 + V3 + V4 + V5
+
+
+# Volume of pyramids from (n, 3) arrays
+def _volpym(P, A, B, C, D):
+    r"""Compute volume of pentahedral pyramids; see :func:`VOLPYM`
+
+    :Call:
+        >>> V = _volpym(P, A, B, C, D)
+    :Inputs:
+        *P*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 3)
+            Coordinates of vertex points
+        *A*, *B*, *C*, *D*: :class:`np.ndarray`, shape=(n, 3)
+            Coordinates of base points
+    :Outputs:
+        *V*: :class:`np.ndarray`\ [:class:`float`], shape=(n,)
+            Volume of each pyramid
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Cross product of base diagonals
+    S = np.cross(A - C, B - D)
+    # Vertex relative to base center
+    R = P - 0.25*(A + B + C + D)
+    # Calculate volume
+    return (1.0/6.0) * np.einsum("ij,ij->i", R, S)
+
+
+# Volume of tetrahedra from (n, 3) arrays
+def _voltet(A, B, C, D):
+    r"""Compute volume of tetrahedra; see :func:`VOLTET`
+
+    :Call:
+        >>> V = _voltet(A, B, C, D)
+    :Inputs:
+        *A*, *B*, *C*, *D*: :class:`np.ndarray`, shape=(n, 3)
+            Coordinates of vertices
+    :Outputs:
+        *V*: :class:`np.ndarray`\ [:class:`float`], shape=(n,)
+            Volume of each tetrahedron
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Calculate volume
+    return (1.0/6.0) * np.einsum("ij,ij->i", A - D, np.cross(B - D, C - D))
@@ -1420,20 +1420,20 @@ class ConfigMIXSUR(object):
                 Name of so-numbered component, if any
         :Versions:
             * 2017-03-30 ``@ddalle``: Version 1.0
+            * 2026-10-17 ``@agent``: Version 1.1; cached lookup table
         """
-        # Make sure there is a list of CompIDs
+        # Make sure there is a map from CompID to name
         try:
-            self.CompIDs
+            self._compid_names
         except AttributeError:
             # Make the list
             self.CompIDs = [self.faces[comp] for comp in self.comps]
-        # Check if CompID is present
-        if compID in self.CompIDs:
-            # Get the component name
-            return self.comps[self.CompIDs.index(compID)]
-        else:
-            # CompID not found
-            return None
+            # Map each CompID to the first component that uses it
+            self._compid_names = {}
+            for comp, cID in zip(self.comps, self.CompIDs):
+                self._compid_names.setdefault(cID, comp)
+        # Get the component name (``None`` if CompID not found)
+        return self._compid_names.get(compID)
 # class ConfigMIXSUR
 
 
@@ -1576,20 +1576,20 @@ class ConfigJSON(object):
                 Name of so-numbered component, if any
         :Versions:
             * 2017-03-30 ``@ddalle``: Version 1.0
+            * 2026-10-17 ``@agent``: Version 1.1; cached lookup table
         """
-        # Make sure there is a list of CompIDs
+        # Make sure there is a map from CompID to name
         try:
-            self.CompIDs
+            self._compid_names
         except AttributeError:
             # Make the list
             self.CompIDs = [self.faces[comp] for comp in self.comps]
-        # Check if CompID is present
-        if compID in self.CompIDs:
-            # Get the component name
-            return self.comps[self.CompIDs.index(compID)]
-        else:
-            # CompID not found
-            return None
+            # Map each CompID to the first component that uses it
+            self._compid_names = {}
+            for comp, cID in zip(self.comps, self.CompIDs):
+                self._compid_names.setdefault(cID, comp)
+        # Get the component name (``None`` if CompID not found)
+        return self._compid_names.get(compID)
 
     # Method to copy a configuration
     def Copy(self):
@@ -1746,6 +1746,8 @@ class ConfigJSON(object):
             raise TypeError(
                 ("List of relevant component ID numbers must be made ") +
                 ("up of integers; received type '%s'" % t))
+        # Reset CompID -> name lookup table
+        self.__dict__.pop("_compid_names", None)
         # Loop through all keys
         for face in list(self.faces.keys()):
             # Get the current parameters
@@ -2095,6 +2097,8 @@ class ConfigJSON(object):
         """
         # Get the current component number
         compi = self.faces[face]
+        # Reset CompID -> name lookup table
+        self.__dict__.pop("_compid_names", None)
         # Reset it
         if isinstance(compi, (list, np.ndarray)):
             # Extract the original component ID from singleton list
@@ -248,7 +248,7 @@ class FileCntl(object):
         :Inputs:
             *fc*: :class:`cape.filecntl.FileCntl`
                 File control instance
-            *reg*: {``"\$__([\w_]+)"``} | :class:`str`
+            *reg*: {``"\$__([\w_]+)"``} | :class:`str` | :class:`re.Pattern`
                 Regular expression for recognizing the start of a new
                 section. By default this looks for sections that start
                 with ``"$__"`` as in Cart3D ``input.cntl`` files. The
@@ -279,6 +279,7 @@ class FileCntl(object):
         :Versions:
             * 2014-06-03 ``@ddalle``: v1.0
             * 2024-01-02 ``@ddalle``: v1.1; save regex used
+            * 2026-10-17 ``@agent``: v1.2; accept compiled *reg*
         """
         # Initial section name
         sec = "_header"
@@ -287,12 +288,12 @@ class FileCntl(object):
         self.Section = {sec: []}
         # Save regular expression
         self._section_regex = reg
-        # Compile regular expression
+        # Compile regular expression (no-op if already compiled)
         regexa = re.compile(reg)
+        # Search from beginning of line or anywhere in line
+        matchfunc = regexa.match if begin else regexa.search
         # Loop through lines
         for line in self.lines:
-            # Search from beginning of line or anywhere in line
-            matchfunc = regexa.match if begin else regexa.search
             # Search for the new-section regular expression
             m = matchfunc(line.strip())
             # Check if there was a match.
@@ -34,10 +34,10 @@ def RotatePoints(X, v1, v2, theta):
             List of rotated node coordinates
     :Versions:
         * 2014-10-07 ``@ddalle``: Version 1.0, from :class:`TriBase`
+        * 2026-10-17 ``@agent``: Version 1.1; use :func:`RotationMatrix`
     """
     # Convert points to NumPy.
-    v1 = np.array(v1)
-    v2 = np.array(v2)
+    v1 = np.array(v1, dtype="float")
     # Ensure array.
     if type(X).__name__ != 'ndarray':
         X = np.array(X)
@@ -47,25 +47,44 @@ def RotatePoints(X, v1, v2, theta):
     # Ensure list of points.
     if len(X.shape) == 1:
         X = np.array([X])
-    # Extract the coordinates and shift origin.
-    x = X[:,0] - v1[0]
-    y = X[:,1] - v1[1]
-    z = X[:,2] - v1[2]
-    # Make the rotation vector
-    v = (v2-v1) / np.linalg.linalg.norm(v2-v1)
-    # Dot product of points with rotation vector
-    k1 = v[0]*x + v[1]*y + v[2]*z
+    # Rotation matrix
+    R = RotationMatrix(v1, v2, theta)
+    # Shift origin, rotate, and shift back
+    return np.dot(X - v1, R.T) + v1
+
+
+# Rotation matrix about an arbitrary vector
+def RotationMatrix(v1, v2, theta):
+    r"""Get the matrix for a rotation about an arbitrary vector
+
+    :Call:
+        >>> R = RotationMatrix(v1, v2, theta)
+    :Inputs:
+        *v1*: :class:`numpy.ndarray`\ [:class:`float`]
+            Start point of rotation vector, *shape*: (3,)
+        *v2*: :class:`numpy.ndarray`\ [:class:`float`]
+            End point of rotation vector, *shape*: (3,)
+        *theta*: :class:`float`
+            Rotation angle in degrees
+    :Outputs:
+        *R*: :class:`numpy.ndarray`\ [:class:`float`], *shape*: (3,3)
+            Rotation matrix; rotated point is ``v1 + R @ (x - v1)``
+    :Versions:
+        * 2026-10-17 ``@agent``: Version 1.0
+    """
+    # Make the unit rotation vector
+    v = np.asarray(v2, dtype="float") - np.asarray(v1, dtype="float")
+    v = v / np.linalg.norm(v)
     # Trig functions
     c_th = np.cos(theta*np.pi/180.)
     s_th = np.sin(theta*np.pi/180.)
-    # Initialize output.
-    Y = X.copy()
-    # Apply Rodrigues' rotation formula to get the rotated coordinates.
-    Y[:,0] = x*c_th+(v[1]*z-v[2]*y)*s_th+v[0]*k1*(1-c_th)+v1[0]
-    Y[:,1] = y*c_th+(v[2]*x-v[0]*z)*s_th+v[1]*k1*(1-c_th)+v1[1]
-    Y[:,2] = z*c_th+(v[0]*y-v[1]*x)*s_th+v[2]*k1*(1-c_th)+v1[2]
-    # Output
-    return Y
+    # Cross-product matrix of rotation vector
+    K = np.array([
+        [0.0, -v[2], v[1]],
+        [v[2], 0.0, -v[0]],
+        [-v[1], v[0], 0.0]])
+    # Rodrigues' rotation formula
+    return c_th*np.eye(3) + s_th*K + (1-c_th)*np.outer(v, v)
 
 
 # Function to rotate a triangulation about an arbitrary vector
@@ -196,6 +215,52 @@ def DistancePointToCurve(x, X):
     return D
 
 
+# Distance from several points to a group of line segments
+def DistancePointsToCurve(x, X):
+    r"""Get distance from several points to segments of a curve
+
+    :Call:
+        >>> D = DistancePointsToCurve(x, X)
+    :Inputs:
+        *x*: :class:`np.ndarray`\ [:class:`float`]
+            Test points, *shape*: (m,3)
+        *X*: :class:`np.ndarray`\ [:class:`float`]
+            Array of curve break points, *shape*: (n,3)
+    :Outputs:
+        *D*: :class:`np.ndarray`\ [:class:`float`]
+            Distance from each *x* to each segment, *shape*: (m,n-1)
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Vector segments
+    dX = X[1:,:] - X[:-1,:]
+    # Vector to each point from each break point, *shape*: (m,n)
+    dx = x[:,[0]] - X[:,0]
+    dy = x[:,[1]] - X[:,1]
+    dz = x[:,[2]] - X[:,2]
+    # Dot products of end-to-end and end-to-*x* vectors
+    c1 = dX[:,0]*dx[:,:-1] + dX[:,1]*dy[:,:-1] + dX[:,2]*dz[:,:-1]
+    c2 = dX[:,0]*dx[:,1:]  + dX[:,1]*dy[:,1:]  + dX[:,2]*dz[:,1:]
+    # Distance from each *x* to each vertex
+    di = np.sqrt(dx*dx + dy*dy + dz*dz)
+    # Initialize with distance to nearer end point
+    D = np.fmin(di[:,:-1], di[:,1:])
+    # Test for interior points
+    I = np.logical_and(c1>0, c2<0)
+    # Segment index of each interior pair
+    J = np.where(I)[1]
+    # Compute cross products for those segments
+    A0 = dX[J,1]*dz[:,:-1][I] - dX[J,2]*dy[:,:-1][I]
+    A1 = dX[J,2]*dx[:,:-1][I] - dX[J,0]*dz[:,:-1][I]
+    A2 = dX[J,0]*dy[:,:-1][I] - dX[J,1]*dx[:,:-1][I]
+    # Arc lengths
+    ds = np.sqrt(np.sum(dX[J,:]**2, axis=1))
+    # Apply interior distances
+    D[I] = np.sqrt(A0*A0 + A1*A1 + A2*A2) / ds
+    # Output
+    return D
+
+
 # Check for intersection between lines
 def lines_int_line(X1, Y1, X2, Y2, x1, y1, x2, y2, **kw):
     r"""Check if a set of line segments intersects another line segment
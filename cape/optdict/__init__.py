@@ -1198,6 +1198,7 @@ class OptionsDict(dict):
         :Versions:
             * 2019-05-10 ``@ddalle``: v1.0 (:class:`odict`)
             * 2022-10-03 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; copy slots of all bases
         """
         # Initialize copy
         opts = self.__class__()
@@ -1210,9 +1211,19 @@ class OptionsDict(dict):
             else:
                 # Recurse
                 opts[k] = v.copy()
-        # Copy all slots
-        for attr in self.__slots__:
-            setattr(opts, attr, copy.copy(getattr(self, attr)))
+        # Copy all slots, including those declared by base classes
+        for cls in type(self).__mro__:
+            # Get slots declared by this class
+            slots = cls.__dict__.get("__slots__", ())
+            # Single slot may be given as a string
+            if isinstance(slots, str):
+                slots = (slots,)
+            # Loop through slots
+            for attr in slots:
+                # Skip slots that were never set
+                if not hasattr(self, attr):
+                    continue
+                setattr(opts, attr, copy.copy(getattr(self, attr)))
         # Output
         return opts
 
@@ -4459,6 +4470,7 @@ def subsec_func(cls, sec=None, parent=None, init=True):
     :Versions:
         * 2019-01-10 ``@ddalle``: v1.0
         * 2021-10-18 ``@ddalle``: v1.1; default *sec*
+        * 2026-10-17 ``@agent``: v1.2; skip init if already *cls*
     """
     # Default *sec*
     if sec is None:
@@ -4470,9 +4482,10 @@ def subsec_func(cls, sec=None, parent=None, init=True):
         @functools.wraps(func)
         # The before and after function
         def wrapper(self, *a, **kw):
-            # Initialize the section
+            # Initialize the section unless already converted
             if init and (cls is not None):
-                self.init_section(cls, sec, parent=parent)
+                if not isinstance(self.get(sec), cls):
+                    self.init_section(cls, sec, parent=parent)
             # Get the function from the subsection
             f = getattr(self[sec], func.__name__)
             # Call the function from the subsection
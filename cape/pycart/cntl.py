@@ -528,6 +528,7 @@ class Cntl(capecntl.Cntl):
             * :func:`cape.pycart.prespecfile.PreSpecCntl.AddXLev`
         :Versions:
             * 2014-10-08 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; add all BBoxes at once
         """
         # Get options
         BBoxs = self.opts.get_BBox()
@@ -537,6 +538,9 @@ class Cntl(capecntl.Cntl):
             BBoxs = []
         if XLevs is None:
             XLevs = []
+        # Refinement levels and limits of BBoxes
+        ns = []
+        xlims = []
         # Loop through BBoxes
         for BBox in BBoxs:
             # Safely get number of refinements
@@ -546,8 +550,11 @@ class Cntl(capecntl.Cntl):
             # Check for degeneracy.
             if (not n) or (xlim is None):
                 continue
-            # Add the bounding box.
-            self.PreSpecCntl.AddBBox(n, xlim)
+            # Save the bounding box.
+            ns.append(n)
+            xlims.append(xlim)
+        # Add the bounding boxes.
+        self.PreSpecCntl.AddBBoxes(ns, xlims)
         # Loop through the XLevs
         for XLev in XLevs:
             # Safely extract info from the XLev.
@@ -362,19 +362,22 @@ class DataBook(databook.DataBook):
                 conf=conf, RootDir=self.RootDir, targ=targ)
 
     # Update point sensor group
-    def UpdatePointSensor(self, name, I=None):
+    def UpdatePointSensor(self, name, I=None, nthreads=1):
         r"""Update a point sensor group data book for a list of cases
 
         :Call:
             >>> DB.UpdatePointSensorGroup(name)
-            >>> DB.UpdatePointSensorGroup(name, I)
+            >>> DB.UpdatePointSensorGroup(name, I, nthreads=1)
         :Inputs:
             *DB*: :class:`cape.pycart.databook.DataBook`
                 Instance of the pyCart data book class
             *I*: :class:`list`\ [:class:`int`] or ``None``
                 List of trajectory indices or update all cases in trajectory
+            *nthreads*: {``1``} | :class:`int`
+                Number of threads used to read case histories
         :Versions:
             * 2015-10-04 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; add *nthreads*
         """
         # Default case list
         if I is None:
@@ -382,10 +385,8 @@ class DataBook(databook.DataBook):
             I = range(self.x.nCase)
         # Read the point sensors if necessary
         self.ReadPointSensor(name)
-        # Loop through cases.
-        for i in I:
-            # Update the point sensors for that case
-            self.PointSensors[name].UpdateCase(i)
+        # Update the point sensors for each case
+        self.PointSensors[name].UpdateCases(I, nthreads=nthreads)
 
     # Function to delete entries by index
     def Delete(self, I):
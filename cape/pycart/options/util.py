@@ -28,109 +28,119 @@ the value of a given parameter should be is below.
     * :mod:`cape.pycart.options`
 """
 
+# Standard library
+import copy
+import os
+
 # Import CAPE options utilities
-from ...cfdx.options.util import *
+from ...cfdx.options.util import applyDefaults, rc, getel, loadJSONFile
 
 
 # Local folders
 PYCART_OPTS_FOLDER = os.path.dirname(os.path.abspath(__file__))
 PYCART_FOLDER = os.path.dirname(PYCART_OPTS_FOLDER)
+# Fixed default settings file
+PYCART_DEFAULTS_FILE = os.path.join(PYCART_OPTS_FOLDER, "pyCart.default.json")
+
+# Parsed contents of ``pyCart.default.json`` (read on first use)
+_PYCART_DEFAULTS = None
 
 
 # Backup default settings (in case deleted from :file:`pyCart.defaults.json`)
-rc["InputCntl"] = "input.cntl"
-rc["Adaptive"] = False
-rc["AeroCsh"] = "aero.csh"
-rc["GroupMesh"] = False
-rc["ConfigFile"] = "Config.xml"
-rc["RefArea"] = 1.0
-rc["RefLength"] = 1.0
-rc["RefPoint"] = [0.0, 0.0, 0.0]
-rc["Xslices"] = [0.0]
-rc["Yslices"] = [0.0]
-rc["Zslices"] = [0.0]
-rc["PhaseSequence"] = [0]
-rc["PhaseIters"] = [200]
-rc["first_order"] = 0
-rc["robust_mode"] = 0
-rc["it_fc"] = 200
-rc["clic"] = True
-rc["cfl"] = 1.1
-rc["cflmin"] = 0.8
-rc["nOrders"] = 12
-rc["mg_fc"] = 3
-rc["RKScheme"] = None # This means don't change it.
-rc["dt"] = 0.1
-rc["unsteady"] = False
-rc["it_avg"] = 0
-rc["it_start"] = 100
-rc["it_sub"] = 10
-rc["jumpstart"] = False
-rc["limiter"] = 2
-rc["y_is_spanwise"] = True
-rc["checkptTD"] = None
-rc["vizTD"] = None
-rc["fc_clean"] = False
-rc["fc_stats"] = 0
-rc["db_stats"] = 0
-rc["db_min"] = 0
-rc["db_max"] = 0
-rc["db_dir"] = "data"
-rc["db_nCut"] = 200
-rc["Delimiter"] = ","
-rc["binaryIO"] = True
-rc["tecO"] = True
-rc["fmg"] = True
-rc["pmg"] = False
-rc["nProc"] = 8
-rc["tm"] = False
-rc["buffLim"] = False
-rc["mpicmd"] = "mpiexec"
-rc["it_ad"] = 120
-rc["mg_ad"] = 3
-rc["adj_first_order"] = False
-rc["n_adapt_cycles"] = 0
-rc["etol"] = 1.0e-6
-rc["max_nCells"] = 5e6
-rc["ws_it"] = [50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 100]
-rc["mesh_growth"] = [1.5, 1.5, 2.0, 2.0, 2.0, 2.0, 2.5]
-rc["apc"] = ["p", "a"]
-rc["buf"] = 1
-rc["final_mesh_xref"] = 0
-rc["TriFile"] = "Components.i.tri"
-rc["mesh2d"] = False
-rc["pre"] = "preSpec.c3d.cntl"
-rc["inputC3d"] = "input.c3d"
-rc["BBox"] = []
-rc["XLev"] = []
-rc["r"] = 30.0
-rc["verify"] = False
-rc["intersect"] = False
-rc["nDiv"] = 4
-rc["maxR"] = 11
-rc["pre"] = "preSpec.c3d.cntl"
-rc["cubes_a"] = 10
-rc["cubes_b"] = 2
-rc["sf"] = 0
-rc["reorder"] = True
-rc["dC"] = 0.01
-rc["nAvg"] = 100
-rc["nPlot"] = None
-rc["nRow"] = 2
-rc["nCol"] = 2
-rc["FigWidth"] = 8
-rc["FigHeight"] = 6
-rc["ulimit_s"] = 4194304
-rc["ArchiveFolder"] = ""
-rc["ArchiveFormat"] = "tar"
-rc["ArchiveAction"] = "skeleton"
-rc["ArchiveType"] = "full"
-rc["ArchiveTemplate"] = "full"
-rc["RemoteCopy"] = "scp"
-rc["nCheckPoint"] = 2
-rc["TarViz"] = "tar"
-rc["TarAdapt"] = "tar"
-rc["TarPBS"] = "tar"
+rc.update({
+    "InputCntl": "input.cntl",
+    "Adaptive": False,
+    "AeroCsh": "aero.csh",
+    "GroupMesh": False,
+    "ConfigFile": "Config.xml",
+    "RefArea": 1.0,
+    "RefLength": 1.0,
+    "RefPoint": [0.0, 0.0, 0.0],
+    "Xslices": [0.0],
+    "Yslices": [0.0],
+    "Zslices": [0.0],
+    "PhaseSequence": [0],
+    "PhaseIters": [200],
+    "first_order": 0,
+    "robust_mode": 0,
+    "it_fc": 200,
+    "clic": True,
+    "cfl": 1.1,
+    "cflmin": 0.8,
+    "nOrders": 12,
+    "mg_fc": 3,
+    "RKScheme": None,  # This means don't change it.
+    "dt": 0.1,
+    "unsteady": False,
+    "it_avg": 0,
+    "it_start": 100,
+    "it_sub": 10,
+    "jumpstart": False,
+    "limiter": 2,
+    "y_is_spanwise": True,
+    "checkptTD": None,
+    "vizTD": None,
+    "fc_clean": False,
+    "fc_stats": 0,
+    "db_stats": 0,
+    "db_min": 0,
+    "db_max": 0,
+    "db_dir": "data",
+    "db_nCut": 200,
+    "Delimiter": ",",
+    "binaryIO": True,
+    "tecO": True,
+    "fmg": True,
+    "pmg": False,
+    "nProc": 8,
+    "tm": False,
+    "buffLim": False,
+    "mpicmd": "mpiexec",
+    "it_ad": 120,
+    "mg_ad": 3,
+    "adj_first_order": False,
+    "n_adapt_cycles": 0,
+    "etol": 1.0e-6,
+    "max_nCells": 5e6,
+    "ws_it": [50, 50, 50, 50, 50, 50, 50, 50, 50, 50, 100],
+    "mesh_growth": [1.5, 1.5, 2.0, 2.0, 2.0, 2.0, 2.5],
+    "apc": ["p", "a"],
+    "buf": 1,
+    "final_mesh_xref": 0,
+    "TriFile": "Components.i.tri",
+    "mesh2d": False,
+    "pre": "preSpec.c3d.cntl",
+    "inputC3d": "input.c3d",
+    "BBox": [],
+    "XLev": [],
+    "r": 30.0,
+    "verify": False,
+    "intersect": False,
+    "nDiv": 4,
+    "maxR": 11,
+    "cubes_a": 10,
+    "cubes_b": 2,
+    "sf": 0,
+    "reorder": True,
+    "dC": 0.01,
+    "nAvg": 100,
+    "nPlot": None,
+    "nRow": 2,
+    "nCol": 2,
+    "FigWidth": 8,
+    "FigHeight": 6,
+    "ulimit_s": 4194304,
+    "ArchiveFolder": "",
+    "ArchiveFormat": "tar",
+    "ArchiveAction": "skeleton",
+    "ArchiveType": "full",
+    "ArchiveTemplate": "full",
+    "RemoteCopy": "scp",
+    "nCheckPoint": 2,
+    "TarViz": "tar",
+    "TarAdapt": "tar",
+    "TarPBS": "tar",
+})
 
 
 # Function to ensure scalar from above
@@ -190,11 +200,15 @@ def get_pycart_defaults():
             - local JSON file
             - :mod:`setuptools` compatible
             - was :func:`getPyCartDefaults`
+        * 2026-10-17 ``@agent``: Version 1.3; parse file only once
     """
-    # Fixed default file
-    fname = os.path.join(PYCART_OPTS_FOLDER, "pyCart.default.json")
-    # Process the default input file
-    return loadJSONFile(fname)
+    global _PYCART_DEFAULTS
+    # Read the file on first call
+    if _PYCART_DEFAULTS is None:
+        # Process the default input file
+        _PYCART_DEFAULTS = loadJSONFile(PYCART_DEFAULTS_FILE)
+    # Return a copy that callers are free to modify
+    return copy.deepcopy(_PYCART_DEFAULTS)
 
 
 # Function to get a template file name
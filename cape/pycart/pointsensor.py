@@ -26,15 +26,17 @@ surface solution file (``"TriqPoint"`` data book type).
 
 # Standard library
 import os
+import re
 import glob
+from concurrent.futures import ThreadPoolExecutor
 
 # Third party
 import numpy as np
 
 # Local imports
 from .util import readline, GetTotalHistIter, GetWorkingFolder
-from .cmdrun import tail
 from .inputcntlfile import InputCntl
+from .. import fileutils
 from ..cfdx import databook
 from ..cfdx import pointsensor
 
@@ -42,6 +44,36 @@ from ..cfdx import pointsensor
 # Placeholder variables for plotting functions.
 plt = 0
 
+# Scalar types for point sensor arithmetic
+INT_TYPES = (int, np.integer)
+SCALAR_TYPES = (int, float, np.integer, np.floating)
+
+# Time-accurate point sensor output file names
+REGEX_PS_ITER = re.compile(r"pointSensors\.([0-9]{2,})\.dat")
+
+# Adaptation folder names, matching glob ``adapt??``
+REGEX_ADAPT = re.compile(r"adapt..")
+
+# Phase-numbered ``input.cntl`` file names
+REGEX_INPUT_CNTL = re.compile(r"input\.([0-9]{2,})\.cntl")
+
+# Variable names header for 2D and 3D point sensor files
+HEADER_VARS_2D = (
+    "# VARIABLES = X Y (P-Pinf)/Pinf RHO U V P RefLev mgCycle/Time\n")
+HEADER_VARS_3D = (
+    "# VARIABLES = X Y Z (P-Pinf)/Pinf RHO U V W P RefLev mgCycle/Time\n")
+
+# Row formats for single-iteration point sensor files
+FMT_PS_2D = 7*' %15.8e' + ' %i %7.3f'
+FMT_PS_3D = 9*' %15.8e' + ' %i %7.3f'
+
+# Row formats for point sensor history files
+FMT_HIST_2D = '%4i' + (' %15.8e'*7) + ' %2i %9.3f'
+FMT_HIST_3D = '%4i' + (' %15.8e'*9) + ' %2i %9.3f'
+
+# Parsed ``input.cntl`` files: absolute path -> (mod time, interface)
+_INPUT_CNTL_CACHE = {}
+
 
 # Dedicated function to load Matplotlib only when needed.
 def ImportPyPlot():
@@ -67,30 +99,53 @@ def ImportPyPlot():
 
 
 # Read best input.cntl file.
-def get_InputCntl():
+def get_InputCntl(cwd=None):
     """Read the best ``input.cntl`` or ``input.??.cntl`` file
 
     :Call:
-        >>> IC = get_InputCntl()
+        >>> IC = get_InputCntl(cwd=None)
+    :Inputs:
+        *cwd*: {``None``} | :class:`str`
+            Case folder, defaults to current working directory
     :Outputs:
         *IC*: :class:`pyCart.inputcntlfile.InputCntl`
             File interface to Cart3D input file ``input.cntl``
     :Versions:
         * 2015-12-04 ``@ddalle``: First version
+        * 2026-10-17 ``@agent``: v1.1; reuse parsed file if unchanged
     """
+    # Case folder
+    fdir = "" if cwd is None else cwd
     # Look for numbered input files
-    fglob = glob.glob("input.[0-9][0-9]*.cntl")
+    fglob = glob.glob(os.path.join(fdir, "input.[0-9][0-9]*.cntl"))
+    # Unmarked input file
+    fcntl = os.path.join(fdir, 'input.cntl')
     # Safety catch.
     try:
         # No phases?
-        if len(fglob) == 0 and os.path.isfile('input.cntl'):
+        if len(fglob) == 0 and os.path.isfile(fcntl):
             # Read the unmarked file
-            return InputCntl('input.cntl')
+            fname = fcntl
         else:
             # Get phase numbers
-            iglob = [int(f.split('.')[1]) for f in fglob]
+            iglob = np.fromiter(
+                (int(m.group(1)) for m in
+                    map(REGEX_INPUT_CNTL.fullmatch,
+                        map(os.path.basename, fglob)) if m),
+                dtype=int)
             # Maximum phase
-            return InputCntl('input.%02i.cntl' % max(iglob))
+            fname = os.path.join(fdir, 'input.%02i.cntl' % max(iglob))
+        # Absolute path and modification time identify the contents
+        fabs = os.path.abspath(fname)
+        mtime = os.path.getmtime(fabs)
+        # Check for previous read of the same file
+        tic, IC = _INPUT_CNTL_CACHE.get(fabs, (None, None))
+        if tic != mtime:
+            # Read the file and save it
+            IC = InputCntl(fname)
+            _INPUT_CNTL_CACHE[fabs] = (mtime, IC)
+        # Output
+        return IC
     except Exception:
         # No handle.
         return None
@@ -109,13 +164,14 @@ def get_iter(fname):
             Iteration number or time
     :Versions:
         * 2015-11-30 ``@ddalle``: First version
+        * 2026-10-17 ``@agent``: v1.1; read last line w/o subprocess
     """
     # Check for file.
     if not os.path.isfile(fname): return 0
     # Safely check the last line of the file.
     try:
-        # Get the last line.
-        line = tail(fname, n=1)
+        # Get the last line (seek from end of file)
+        line = fileutils.tail(fname, n=1)
         # Read the time step/iteration
         return float(line.split()[-1])
     except Exception:
@@ -136,9 +192,8 @@ def get_mach(IC=None):
             Mach number as determined from Cart3D input file
     :Versions:
         * 2015-12-01 ``@ddalle``: First version
+        * 2026-10-17 ``@agent``: v1.1; drop unused :func:`glob.glob`
     """
-    # Look for numbered input files
-    fglob = glob.glob("input.[0-9][0-9]*.cntl")
     # Safety catch.
     try:
         # Read ``input.cntl`` if necessary.
@@ -171,6 +226,32 @@ def get_DataBookNStatsPS():
     line = readline(f)
     # Output
     return nStats
+
+
+# Sort point sensors by coordinates
+def _argsort_coords(X):
+    r"""Get indices that sort points by *x*, then *y*, then *z*
+
+    :Call:
+        >>> I = _argsort_coords(X)
+    :Inputs:
+        *X*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 2 | 3)
+            Coordinates of each point
+    :Outputs:
+        *I*: :class:`slice` | :class:`np.ndarray`\ [:class:`int`]
+            ``slice(None)`` if *X* is already sorted, else sort order
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0; split from PointSensor()
+    """
+    # Change in each coordinate from each point to the next
+    dX = np.diff(X, axis=0)
+    # First coordinate that changes between each pair of points
+    j = np.argmax(dX != 0, axis=1)
+    # Already sorted if that change is never negative
+    if np.all(dX[np.arange(dX.shape[0]), j] >= 0):
+        return slice(None)
+    # Sort by *x*, then *y*, then *z* (last key is primary)
+    return np.lexsort(X.T[::-1])
 # end functions
 
 # Data book for group of point sensors
@@ -230,6 +311,7 @@ class DBPointSensorGroup(pointsensor.DBPointSensorGroup):
                 Case index
         :Versions:
             * 2015-12-04 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; split :func:`_SaveCase`
         """
         # Reference point
         pt = self.pts[0]
@@ -238,11 +320,68 @@ class DBPointSensorGroup(pointsensor.DBPointSensorGroup):
         q, P = DBP._UpdateCase(i)
         # Exit if no return necessary
         if not q: return
+        # Save statistics
+        self._SaveCase(i, P)
+
+    # Process several cases
+    def UpdateCases(self, I, nthreads=1):
+        """Update several point sensor cases if necessary
+
+        Case histories are read in parallel if *nthreads* is greater
+        than ``1``; the data book is updated serially in the order of
+        *I*.
+
+        :Call:
+            >>> DBPG.UpdateCases(I, nthreads=1)
+        :Inputs:
+            *DBPG*: :class:`pyCart.pointsensor.DBPointSensorGroup`
+                A point sensor group data book
+            *I*: :class:`list`\ [:class:`int`]
+                Case indices
+            *nthreads*: {``1``} | :class:`int`
+                Number of threads used to read case histories
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Serial update
+        if nthreads <= 1:
+            for i in I:
+                self.UpdateCase(i)
+            return
+        # Reference point
+        DBP = self[self.pts[0]]
+        # Read histories; NumPy releases the GIL for reads and reductions
+        with ThreadPoolExecutor(nthreads) as pool:
+            R = list(pool.map(DBP._UpdateCase, I))
+        # Save statistics in order
+        for i, (q, P) in zip(I, R):
+            if q:
+                self._SaveCase(i, P)
+
+    # Save statistics for a case
+    def _SaveCase(self, i, P):
+        """Save statistics from one case point sensor history
+
+        :Call:
+            >>> DBPG._SaveCase(i, P)
+        :Inputs:
+            *DBPG*: :class:`pyCart.pointsensor.DBPointSensorGroup`
+                A point sensor group data book
+            *i*: :class:`int`
+                Case index
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Individual case point sensor history
+        :Versions:
+            * 2015-12-04 ``@ddalle``: First version (:func:`UpdateCase`)
+            * 2026-10-17 ``@agent``: v1.1; split from :func:`UpdateCase`
+        """
+        # Reference point
+        pt = self.pts[0]
         # Try to find a match existing in the data book
         j = self[pt].FindMatch(i)
         # Determine ninimum number of iterations required
         nStats = self.opts.get_DataBookNStats(self.name)
-        nLast  = self.opts.get_nLastStats(self.name)
+        nLast  = self.opts.get_DataBookOpt(self.name, "NLastStats")
         # Get list of iterations
         iIter = P.i
 
@@ -321,6 +460,8 @@ class DBPointSensor(pointsensor.DBPointSensor):
         else:
             # Specified name
             self.comp = name
+        # Name used to look up data book options
+        self.name = self.comp
 
         # Save root directory
         self.RootDir = kw.get('RootDir', os.getcwd())
@@ -356,22 +497,70 @@ class DBPointSensor(pointsensor.DBPointSensor):
                 Case index
         :Versions:
             * 2015-12-04 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; no :func:`os.chdir`
         """
         # Check update status.
         q, P = self._UpdateCase(i)
         # Exit if no return necessary
         if not q: return
+        # Save statistics
+        self._SaveCase(i, P)
+
+    # Process several cases
+    def UpdateCases(self, I, nthreads=1):
+        """Update several point sensor cases if necessary
+
+        Case histories are read in parallel if *nthreads* is greater
+        than ``1``; the data book is updated serially in the order of
+        *I*.
+
+        :Call:
+            >>> DBP.UpdateCases(I, nthreads=1)
+        :Inputs:
+            *DBP*: :class:`pyCart.pointsensor.DBPointSensor`
+                An individual point sensor data book
+            *I*: :class:`list`\ [:class:`int`]
+                Case indices
+            *nthreads*: {``1``} | :class:`int`
+                Number of threads used to read case histories
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Serial update
+        if nthreads <= 1:
+            for i in I:
+                self.UpdateCase(i)
+            return
+        # Read histories; NumPy releases the GIL for reads and reductions
+        with ThreadPoolExecutor(nthreads) as pool:
+            R = list(pool.map(self._UpdateCase, I))
+        # Save statistics in order
+        for i, (q, P) in zip(I, R):
+            if q:
+                self._SaveCase(i, P)
+
+    # Save statistics for a case
+    def _SaveCase(self, i, P):
+        """Save statistics from one case point sensor history
+
+        :Call:
+            >>> DBP._SaveCase(i, P)
+        :Inputs:
+            *DBP*: :class:`pyCart.pointsensor.DBPointSensor`
+                An individual point sensor data book
+            *i*: :class:`int`
+                Case index
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Individual case point sensor history
+        :Versions:
+            * 2015-12-04 ``@ddalle``: First version (:func:`UpdateCase`)
+            * 2026-10-17 ``@agent``: v1.1; split from :func:`UpdateCase`
+        """
         # Try to find a match existing in the data book
         j = self.FindMatch(i)
-        # Get the name of the folder.
-        frun = self.x.GetFullFolderNames(i)
-        # Go to the case folder (it exists due to above tests).
-        fpwd = os.getcwd()
-        os.chdir(self.RootDir)
-        os.chdir(frun)
         # Determine ninimum number of iterations required
         nStats = self.opts.get_DataBookNStats(self.name)
-        nLast  = self.opts.get_nLastStats(self.name)
+        nLast  = self.opts.get_DataBookOpt(self.name, "NLastStats")
         # Get list of iterations
         iIter = P.i
         # Find the point.
@@ -401,8 +590,6 @@ class DBPointSensor(pointsensor.DBPointSensor):
             # Update the other statistics.
             self['nIter'][j]   = iIter[-1]
             self['nStats'][j]  = nStats
-        # Go back.
-        os.chdir(fpwd)
 
     # Process a case
     def _UpdateCase(self, i):
@@ -422,6 +609,7 @@ class DBPointSensor(pointsensor.DBPointSensor):
                 Individual case point sensor history
         :Versions:
             * 2015-12-04 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; no :func:`os.chdir`
         """
         # Try to find a match existing in the data book
         j = self.FindMatch(i)
@@ -429,26 +617,22 @@ class DBPointSensor(pointsensor.DBPointSensor):
         frun = self.x.GetFullFolderNames(i)
         # Status update
         print(frun)
-        # Go home
-        fpwd = os.getcwd()
-        os.chdir(self.RootDir)
+        # Absolute path to case folder
+        fdir = os.path.join(self.RootDir, frun)
         # Check if the folder exists.
-        if not os.path.isdir(frun):
-            os.chdir(fpwd)
+        if not os.path.isdir(fdir):
             return False, None
-        # Go to the case folder.
-        os.chdir(frun)
         # Determine ninimum number of iterations required
         nStats = self.opts.get_DataBookNStats(self.name)
         nMin   = self.opts.get_DataBookNMin(self.name)
-        nLast  = self.opts.get_nLastStats(self.name)
+        nLast  = self.opts.get_DataBookOpt(self.name, "NLastStats")
         # Get last potential iteration
-        nIter = int(GetTotalHistIter())
+        nIter = int(GetTotalHistIter(fdir))
         # Decide whether or not to update.
         if (not nIter) or (nIter < nMin + nStats):
             # Not enough iterations
             print("  Not enough iterations (%s) for analysis." % nIter)
-            os.chdir(fpwd); return False, None
+            return False, None
         elif np.isnan(j):
             # No current history
             print("  Adding new databook entry.")
@@ -458,26 +642,27 @@ class DBPointSensor(pointsensor.DBPointSensor):
         elif self['nIter'][j] == nIter:
             # Up-to-date
             print("  Databook up-to-date.")
-            os.chdir(fpwd); return False, None
-        elif self['nIter'][j] == get_iter('pointSensors.hist.dat'):
+            return False, None
+        elif self['nIter'][j] == get_iter(
+                os.path.join(fdir, 'pointSensors.hist.dat')):
             # Up-to-date
             print("  Databook up-to-date.")
-            os.chdir(fpwd); return False, None
+            return False, None
         # Read the point sensor history.
-        P = CasePointSensor()
+        P = CasePointSensor(cwd=fdir)
         # Get minimum iteration that would be included if we compute stats now
         if P.nIter < nStats:
             # Not enough samples
             print("  Not enough point samples (%s) for analysis." % P.nIter)
-            os.chdir(fpwd); return False, None
+            return False, None
         elif P.nPoint < 1:
             # No points?
             print("  Point sensor history contains no points.")
-            os.chdir(fpwd); return False, None
+            return False, None
         # Get list of iterations
         iIter = P.i
         # Downselect if *nLast* in use
-        if nLast > 0: iIter = iIter[iIter<=nLast]
+        if nLast: iIter = iIter[iIter<=nLast]
         # Minimum iteration that will be included in stats
         if nStats == 0:
             # No averaging; just use last iteration
@@ -489,9 +674,9 @@ class DBPointSensor(pointsensor.DBPointSensor):
         if iStats0 < nMin:
             # Too early
             print("  Not enough samples after min iteration %i." % nMin)
-            os.chdir(fpwd); return False, None
+            return False, None
         else:
-            os.chdir(fpwd); return True, P
+            return True, P
 
 
 # class DBPointSensor
@@ -502,7 +687,13 @@ class CasePointSensor(databook.CaseData):
     """Individual case point sensor history
 
     :Call:
-        >>> P = CasePointSensor()
+        >>> P = CasePointSensor(dtype="float", cwd=None)
+    :Inputs:
+        *dtype*: {``"float"``} | ``"float32"``
+            Storage type for *P.data*, e.g. ``"float32"`` to halve
+            memory; statistics still use :class:`float64` accumulators
+        *cwd*: {``None``} | :class:`str`
+            Case folder, defaults to current working directory
     :Outputs:
         *P*: :class:`pyCart.pointsensor.CasePointSensor`
             Case point sensor
@@ -518,31 +709,62 @@ class CasePointSensor(databook.CaseData):
             Maximum steady-state iteration number
         *P.data*: :class:`numpy.ndarray` (*nPoint*, *nIter*, 10 | 12)
             Data array
+        *P.i*: :class:`numpy.ndarray` (*nIter*)
+            Iteration or time of each sample (always :class:`float64`)
     :Versions:
         * 2015-12-01 ``@ddalle``: First version
+        * 2026-10-17 ``@agent``: v1.1; add *dtype*
     """
     # Initialization method
-    def __init__(self):
+    def __init__(self, dtype="float", cwd=None):
         """Initialization method"""
+        # Storage type for data
+        self.dtype = np.dtype(dtype)
+        # Case folder
+        self.cwd = cwd
+        # History file
+        fhist = self.get_case_file('pointSensors.hist.dat')
         # Check for history file
-        if os.path.isfile('pointSensors.hist.dat'):
+        if os.path.isfile(fhist):
             # Read the file
-            self.ReadHist()
+            self.ReadHist(fhist)
         else:
             # Initialize empty data
             self.nPoint = None
             self.nIter = 0
             self.nd = None
             self.iSteady = 0
-            self.data = np.zeros((0,0,12))
+            self.data = np.zeros((0,0,12), dtype=self.dtype)
             self.i = np.array([])
         # Read iterations if necessary.
         self.UpdateIterations()
         # Input file
-        self.InputCntl = get_InputCntl()
+        self.InputCntl = get_InputCntl(cwd)
         # Save the Mach number
         self.mach = get_mach(self.InputCntl)
 
+    # Path to file in case folder
+    def get_case_file(self, fname):
+        """Get path to a file in the case folder
+
+        :Call:
+            >>> fabs = P.get_case_file(fname)
+        :Inputs:
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Iterative point sensor history
+            *fname*: :class:`str`
+                Name of file relative to case folder
+        :Outputs:
+            *fabs*: :class:`str`
+                Name of file relative to current working directory
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for explicit case folder
+        if self.cwd is None:
+            return fname
+        else:
+            return os.path.join(self.cwd, fname)
 
     # Read the steady-state output file
     def UpdateIterations(self):
@@ -555,18 +777,27 @@ class CasePointSensor(databook.CaseData):
                 Iterative point sensor history
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; append all files at once
         """
         # Get latest iteration.
         if self.nPoint is None:
             return
+        # History file
+        fhist = self.get_case_file('pointSensors.hist.dat')
+        # Exit if no output files since history was written
+        if os.path.isfile(fhist):
+            if not self._CheckNewFiles(os.path.getmtime(fhist)):
+                return
         if self.nPoint > 0:
             imax = self.data[0,-1,-1]
         else:
             imax = 0
         # Check for steady-state outputs.
-        fglob = glob.glob('adapt??/pointSensors.dat')
-        fglob += glob.glob('pointSensors.dat')
+        fglob = glob.glob(self.get_case_file('adapt??/pointSensors.dat'))
+        fglob += glob.glob(self.get_case_file('pointSensors.dat'))
         fglob.sort()
+        # Point sensors to append
+        PSs = []
         # Loop through steady-state iterations
         for f in fglob:
             # Check if it's up-to-date
@@ -574,28 +805,76 @@ class CasePointSensor(databook.CaseData):
             # Read the file.
             PS = PointSensor(f)
             # Save the iterations
-            self.AppendIteration(PS)
+            PSs.append(PS)
             # Update the steady-state iteration count
-            if self.nPoint > 0:
+            if PS.nPoint > 0:
                 self.iSteady = PS.data[0,-1]
                 imax = self.iSteady
         # Check for time-accurate iterations.
-        fglob = glob.glob('pointSensors.[0-9][0-9]*.dat')
-        iglob = np.array([int(f.split('.')[1]) for f in fglob])
+        with os.scandir(self.get_case_file('.')) as dirents:
+            # Iteration number of each matching file name
+            iglob = np.fromiter(
+                (int(m.group(1)) for m in
+                    map(REGEX_PS_ITER.fullmatch, (d.name for d in dirents))
+                    if m),
+                dtype=int)
         iglob.sort()
         # Time-accurate results only; filter on *imax*
         iglob = iglob[iglob > imax-self.iSteady]
         # Read the time-accurate iterations
         for i in iglob:
             # File name
-            fi = "pointSensors.%06i.dat" % i
+            fi = self.get_case_file("pointSensors.%06i.dat" % i)
             # Read the file.
             PS = PointSensor(fi)
             # Increase time-accurate iteration number
             PS.i += self.iSteady
             # Save the data.
-            self.AppendIteration(PS)
+            PSs.append(PS)
+        # Add all new iterations to the history in one copy
+        self.AppendIterations(PSs)
+
+
+    # Check for new output files
+    def _CheckNewFiles(self, tic):
+        """Check for point sensor output files modified after a time
 
+        :Call:
+            >>> q = P._CheckNewFiles(tic)
+        :Inputs:
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Iterative point sensor history
+            *tic*: :class:`float`
+                Reference modification time, usually of history file
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether any ``pointSensors.dat``,
+                ``adapt??/pointSensors.dat``, or
+                ``pointSensors.??????.dat`` is not older than *tic*
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Loop through case folder
+        with os.scandir(self.get_case_file('.')) as dirents:
+            for d in dirents:
+                # Check type of entry
+                if d.name == 'pointSensors.dat' or (
+                        REGEX_PS_ITER.fullmatch(d.name)):
+                    # Steady-state or time-accurate output file
+                    fi = d.path
+                elif REGEX_ADAPT.fullmatch(d.name) and d.is_dir():
+                    # Adaptation cycle output file
+                    fi = os.path.join(d.path, 'pointSensors.dat')
+                    # Check if it exists
+                    if not os.path.isfile(fi):
+                        continue
+                else:
+                    continue
+                # Check modification time
+                if os.path.getmtime(fi) >= tic:
+                    return True
+        # No new files
+        return False
 
     # Read history file
     def ReadHist(self, fname='pointSensors.hist.dat'):
@@ -608,46 +887,127 @@ class CasePointSensor(databook.CaseData):
                 Name of point sensor history file
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; contiguous *P.i*
         """
         # Check for the file
         if not os.path.isfile(fname):
             raise SystemError("File '%s' does not exist." % fname)
+        # Binary copy written by :func:`WriteHist`
+        fbin = os.path.splitext(fname)[0] + ".bin"
+        # Use it if it is at least as new as the text file
+        if os.path.isfile(fbin) and (
+                os.path.getmtime(fbin) >= os.path.getmtime(fname)):
+            # Read binary file (falls back to text if invalid)
+            if self.ReadHistBin(fbin):
+                return
+        # Open the file (binary mode; no decoding before data parse)
+        with open(fname, 'rb') as f:
+            # Read the first line, which contains identifiers.
+            line = f.readline()
+            # Skip blank lines and comments
+            while line and (not line.strip() or line.lstrip()[:1] == b'#'):
+                line = f.readline()
+            # Split the line
+            V = line.split()
+            # Get the values
+            if len(V) < 4:
+                # Null history
+                self.nPoint = 0
+                self.nIter = 0
+                self.nd = 3
+                self.iSteady = 0
+                # Null data
+                self.data = np.zeros((0, 0, 12), dtype=self.dtype)
+                self.i = np.zeros(0)
+                return
+            # Read the values from the file
+            nPoint, nIter, nd, iSteady = [int(v) for v in V[:4]]
+            # Number of data columns
+            nCol = 10 if nd == 2 else 12
+            # Read data lines
+            A = np.fromfile(f, dtype=float, count=nPoint*nIter*nCol, sep=" ")
+        # Save
+        self._set_hist(nPoint, nIter, nd, iSteady, A)
+
+    # Read binary history file
+    def ReadHistBin(self, fname='pointSensors.hist.bin'):
+        """Read binary copy of point sensor iterative history
+
+        The file contains four little-endian 64-bit integers (*nPoint*,
+        *nIter*, *nd*, *iSteady*) followed by the data as little-endian
+        64-bit floats.
+
+        :Call:
+            >>> q = P.ReadHistBin(fname='pointSensors.hist.bin')
+        :Inputs:
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Iterative point sensor history
+            *fname*: :class:`str`
+                Name of binary point sensor history file
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not file was complete and was read
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
         # Open the file.
-        f = open(fname, 'r')
-        # Read the first line, which contains identifiers.
-        line = readline(f)
-        # Split the line
-        V = line.split()
-        # Get the values
-        if len(V) < 4:
-            # Null history
-            self.nPoint = 0
-            self.nIter = 0
-            self.nd = 3
-            self.iSteady = 0
-            # Null data
-            self.data = np.zeros((0, 0, 12))
-            return
-        # Read the values from the file
-        nPoint, nIter, nd, iSteady = [int(v) for v in line.split()]
+        with open(fname, 'rb') as f:
+            # Read the header
+            hdr = np.fromfile(f, dtype="<i8", count=4)
+            # Check for truncated file
+            if hdr.size < 4:
+                return False
+            # Unpack header
+            nPoint, nIter, nd, iSteady = [int(v) for v in hdr]
+            # Number of values
+            n = nPoint * nIter * (10 if nd == 2 else 12)
+            # Read data
+            A = np.fromfile(f, dtype="<f8", count=n)
+        # Check for truncated file
+        if A.size < n:
+            return False
+        # Save
+        self._set_hist(nPoint, nIter, nd, iSteady, A)
+        return True
+
+    # Save history data
+    def _set_hist(self, nPoint, nIter, nd, iSteady, A):
+        """Save point sensor history read from file
+
+        :Call:
+            >>> P._set_hist(nPoint, nIter, nd, iSteady, A)
+        :Inputs:
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Iterative point sensor history
+            *nPoint*: :class:`int`
+                Number of point sensors
+            *nIter*: :class:`int`
+                Number of iterations in history
+            *nd*: ``2`` | ``3``
+                Number of dimensions
+            *iSteady*: :class:`int`
+                Maximum steady-state iteration number
+            *A*: :class:`np.ndarray`\ [:class:`float`]
+                Flat history data
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0; split from :func:`ReadHist`
+        """
         # Save
         self.nPoint  = nPoint
         self.nIter   = nIter
         self.nd      = nd
         self.iSteady = iSteady
         # Number of data columns
-        if nd == 2:
-            # Two-dimensional data
-            nCol = 10
-        else:
-            # Three-dimensional data
-            nCol = 12
-        # Read data lines
-        A = np.fromfile(f, dtype=float, count=nPoint*nIter*nCol, sep=" ")
+        nCol = 10 if nd == 2 else 12
         # Reshape
-        self.data = A.reshape((nPoint, nIter, nCol))
+        A = A.reshape((nPoint, nIter, nCol))
         # Save the iterations at which samples are recoreded
-        self.i = self.data[0,:,-1]
+        if nPoint > 0:
+            self.i = A[0,:,-1].copy()
+        else:
+            self.i = np.zeros(0)
+        # Save data using storage type
+        self.data = A.astype(self.dtype, copy=False)
 
     # Write history file
     def WriteHist(self, fname='pointSensors.hist.dat'):
@@ -660,38 +1020,54 @@ class CasePointSensor(databook.CaseData):
                 Name of point sensor history file
         :Versions:
             * 2015-12-01 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; use :func:`np.savetxt`
         """
-        # Open the file
-        f = open(fname, 'w')
-        # Write column names
-        f.write('# nPoint, nIter, nd, iSteady\n')
-        # Write variable names
-        if self.nd == 2:
-            # Two-dimensional data
-            f.write("# VARIABLES = X Y (P-Pinf)/Pinf RHO U V P ")
-            f.write("RefLev mgCycle/Time\n")
-        else:
-            # Three-dimensional data
-            f.write("# VARIABLES = X Y Z (P-Pinf)/Pinf RHO U V W P ")
-            f.write("RefLev mgCycle/Time\n")
-        # Write header.
-        f.write('%i %i %i %i\n' %
-            (self.nPoint, self.nIter, self.nd, self.iSteady))
-        # Write flag
+        # Write flag and variable names
         if self.nd == 2:
             # Point, 2 coordinates, 5 states, refinements, iteration
-            fflag = '%4i' + (' %15.8e'*7) + ' %2i %9.3f\n'
+            fflag = FMT_HIST_2D
+            hvars = HEADER_VARS_2D
         else:
             # Point, 3 coordinates, 6 states, refinements, iteration
-            fflag = '%4i' + (' %15.8e'*9) + ' %2i %9.3f\n'
-        # Loop through points
-        for k in range(self.nPoint):
-            # Loop through iterations
-            for i in range(self.nIter):
-                # Write the info.
-                f.write(fflag % tuple(self.data[k,i,:]))
-        # Close the file.
-        f.close()
+            fflag = FMT_HIST_3D
+            hvars = HEADER_VARS_3D
+        # Open the file
+        with open(fname, 'w') as f:
+            # Write column names
+            f.write('# nPoint, nIter, nd, iSteady\n')
+            # Write variable names
+            f.write(hvars)
+            # Write header.
+            f.write('%i %i %i %i\n' %
+                (self.nPoint, self.nIter, self.nd, self.iSteady))
+            # Write all points and iterations (point-major order)
+            np.savetxt(f, self.data.reshape((-1, self.data.shape[-1])),
+                fmt=fflag)
+        # Write binary copy for faster reading
+        self.WriteHistBin(os.path.splitext(fname)[0] + ".bin")
+
+    # Write binary history file
+    def WriteHistBin(self, fname='pointSensors.hist.bin'):
+        """Write binary copy of point sensor iterative history
+
+        :Call:
+            >>> P.WriteHistBin(fname='pointSensors.hist.bin')
+        :Inputs:
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Iterative point sensor history
+            *fname*: :class:`str`
+                Name of binary point sensor history file
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Header
+        hdr = np.array(
+            [self.nPoint, self.nIter, self.nd, self.iSteady], dtype="<i8")
+        # Open the file
+        with open(fname, 'wb') as f:
+            # Write header and data
+            hdr.tofile(f)
+            self.data.astype("<f8", copy=False).tofile(f)
 
     # Add another point sensor
     def AppendIteration(self, PS):
@@ -706,36 +1082,67 @@ class CasePointSensor(databook.CaseData):
                 Point sensor
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; use :func:`AppendIterations`
+        """
+        self.AppendIterations([PS])
+
+    # Add several point sensors
+    def AppendIterations(self, PSs):
+        """Add several single-iteration point sensors to the history
+
+        The history array is reallocated once for all new iterations
+        instead of once per iteration.
+
+        :Call:
+            >>> P.AppendIterations(PSs)
+        :Inputs:
+            *P*: :class:`pyCart.pointsensor.CasePointSensor`
+                Iterative point sensor history
+            *PSs*: :class:`list`\ [:class:`PointSensor`]
+                Point sensors, in iteration order
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0; from :func:`AppendIteration`
         """
         # Check compatibility
-        if self.nPoint is None:
-            # Use the point count from the individual file.
-            self.nPoint = PS.nPoint
-            self.nd = PS.nd
-            self.nIter = 0
-            # Initialize
-            if self.nd == 2:
-                self.data = np.zeros((self.nPoint, 0, 10))
-            else:
-                self.data = np.zeros((self.nPoint, 0, 12))
-        elif self.nPoint != PS.nPoint:
-            # Wrong number of points
-            raise IndexError(
-                "History has %i points; point sensor has %i points."
-                % (self.nPoint, PS.nPoint))
-        elif self.nd != PS.nd:
-            # Wrong number of dimensions
-            raise IndexError(
-                "History is %-D; point sensor is %i-D." % (self.nd, PS.nd))
-        # Get data from point sensor and add point number
-        A = np.hstack((np.array([range(self.nPoint)]).transpose(), PS.data))
-        # Number of columns
-        nCol = A.shape[1]
+        for PS in PSs:
+            if self.nPoint is None:
+                # Use the point count from the individual file.
+                self.nPoint = PS.nPoint
+                self.nd = PS.nd
+                self.nIter = 0
+                # Initialize
+                if self.nd == 2:
+                    self.data = np.zeros((self.nPoint, 0, 10), self.dtype)
+                else:
+                    self.data = np.zeros((self.nPoint, 0, 12), self.dtype)
+            elif self.nPoint != PS.nPoint:
+                # Wrong number of points
+                raise IndexError(
+                    "History has %i points; point sensor has %i points."
+                    % (self.nPoint, PS.nPoint))
+            elif self.nd != PS.nd:
+                # Wrong number of dimensions
+                raise IndexError(
+                    "History is %-D; point sensor is %i-D." % (self.nd, PS.nd))
+        # Check for no new iterations
+        if len(PSs) == 0:
+            return
+        # Number of columns (point number and point sensor data)
+        nCol = PSs[0].data.shape[1] + 1
+        # Initialize new iterations
+        A = np.empty((self.nPoint, len(PSs), nCol), dtype=self.data.dtype)
+        # Add point number
+        A[:, :, 0] = np.arange(self.nPoint)[:, None]
+        # Copy data from each point sensor
+        for j, PS in enumerate(PSs):
+            A[:, j, 1:] = PS.data
         # Append to history.
-        self.data = np.hstack(
-            (self.data, A.reshape((self.nPoint,1,nCol))))
+        self.data = np.concatenate((self.data, A), axis=1)
         # Increase iteration count.
-        self.nIter += 1
+        self.nIter += len(PSs)
+        # Add iterations at which samples recorded (before type cast)
+        if self.nPoint > 0:
+            self.i = np.hstack((self.i, [PS.data[0,-1] for PS in PSs]))
 
 
     # Get point sensor by name
@@ -789,66 +1196,56 @@ class CasePointSensor(databook.CaseData):
                 Dictionary of mean, min, max, std for each variable
         :Versions:
             * 2015-12-04 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; slice samples w/o copying
         """
         # Last iteration to use.
         if nLast:
-            # Attempt to use requested iter.
-            if nLast < self.i[0]:
-                # No earlier iterative histories
-                I = np.array([])
-            else:
-                # Apply filter.
-                I = np.where(self.i <= nLast)[0]
-            # Check for sufficient samples
-            if I.size < nStats:
-                raise RuntimeError("Less than %i samples before iteration %i"
-                    % (nStats, nLast))
-            # Filter last *nStats* samples.
-            I = I[-nStats:]
+            # Number of samples at or before *nLast* (iters are sorted)
+            i1 = np.searchsorted(self.i, nLast, side="right")
         else:
-            # Initialize to all samples included
-            I = np.arange(self.nIter)
-            # Check for number of iterations
-            if I.size < nStats:
-                raise RuntimeError("Less than %i samples before iteration %i"
-                    % (nStats, nLast))
-            # Filter last *nStats* samples.
-            I = I[-nStats:]
+            # Use all samples
+            i1 = self.nIter
+        # Check for sufficient samples
+        if i1 < nStats:
+            raise RuntimeError("Less than %i samples before iteration %i"
+                % (nStats, nLast))
+        # Filter last *nStats* samples (all samples if *nStats* is 0)
+        I = slice(i1 - nStats if nStats else 0, i1)
         # Initialize output
         s = {}
-        # Extract data for this point.
-        A = self.data[k, :, 1:]
-        # Insert Z, Cp, and W as appropriate
+        # Save coordinates from first sample
+        s['X'] = self.data[k, 0, 1]
+        s['Y'] = self.data[k, 0, 2]
+        s['Z'] = self.data[k, 0, 3] if self.nd == 3 else 0.0
+        # Extract sampled data for this point (view)
+        A = self.data[k, I, 1:]
+        # Column of *dp*, after coordinates
+        j = self.nd
+        # Pressure coefficient
+        Cp = A[:, j] / (0.7*self.mach**2)
+        # Stack states: Cp, dp, rho, U, V, W, P
         if self.nd == 2:
-            # Calculate Cp
-            Cp = A[:,2:3] / (0.7*self.mach**2)
-            # Insert zeros for Z and W
-            Z = np.zeros_like(A[:,:1])
-            B = np.hstack((A[:,:2], Z, Cp, A[:,2:5], Z, A[:,5:]))
+            # Insert zeros for *W*
+            V = np.column_stack(
+                (Cp, A[:, j:j+4], np.zeros_like(Cp), A[:, j+4]))
         else:
-            # Calculate Cp
-            Cp = A[:,3:4] / (0.7*self.mach**2)
-            # Insert *Cp*
-            B = np.hstack((A[:,:3], Cp, A[:,3:]))
-        # Save coordinates
-        s['X'] = B[0,0]
-        s['Y'] = B[0,1]
-        s['Z'] = B[0,2]
+            # States are contiguous
+            V = np.column_stack((Cp, A[:, j:j+6]))
         # Mean number of refinement levels
-        s['RefLev'] = np.mean(B[I,-2])
-        # List of states
-        fcols = ['Cp', 'dp', 'rho', 'U', 'V', 'W', 'P']
-        # Loop through columns
-        for i in range(len(fcols)):
-            # State name and values
-            c = fcols[i]
-            V = B[I,i+3]
+        s['RefLev'] = np.mean(A[:, -2])
+        # Statistics of all states at once (double-precision sums)
+        vmu = np.mean(V, axis=0, dtype="float")
+        vmin = np.min(V, axis=0)
+        vmax = np.max(V, axis=0)
+        vstd = np.std(V, axis=0, dtype="float")
+        # Loop through states
+        for i, c in enumerate(['Cp', 'dp', 'rho', 'U', 'V', 'W', 'P']):
             # Save mean value.
-            s[c] = np.mean(V)
+            s[c] = vmu[i]
             # Save statistics
-            s[c+'_min'] = np.min(V)
-            s[c+'_max'] = np.max(V)
-            s[c+'_std'] = np.std(V)
+            s[c+'_min'] = vmin[i]
+            s[c+'_max'] = vmax[i]
+            s[c+'_std'] = vstd[i]
         # Output,
         return s
 
@@ -1054,6 +1451,7 @@ class PointSensor(object):
             Number of iterations used to calculate the average
     :Versions:
         * 2015-11-30 ``@ddalle``: First version
+        * 2026-10-17 ``@agent``: v1.1; read w/o :func:`np.loadtxt`
     """
 
     # Initialization method
@@ -1061,13 +1459,54 @@ class PointSensor(object):
         """Initialization method"""
         # Check for data
         if data is None:
-            # Read the file.
-            data = np.loadtxt(fname, comments='#')
+            # Open the file.
+            with open(fname, 'r') as f:
+                # Skip header comments
+                while True:
+                    # Remember start of line
+                    pos = f.tell()
+                    line = f.readline()
+                    # Exit at first data line (or EOF)
+                    lstrp = line.strip()
+                    if line == '' or (lstrp and not lstrp.startswith('#')):
+                        break
+                # Number of columns from first data line
+                nCol = len(line.split())
+                # Go back and read all rows in one pass
+                f.seek(pos)
+                data = np.fromfile(f, dtype=float, sep=" ")
+            # Reshape (no copy)
+            data = data.reshape((-1, nCol))
+        else:
+            # Copy so that the caller's array is not shared
+            data = np.array(data, dtype=float)
+        # Number of coordinates
+        nd = 2 if data.shape[1] == 9 else 3
+        # Sort by coordinates (Cart3D files are usually sorted already)
+        i = _argsort_coords(data[:,:nd])
+        # Save data and column views
+        self._set_data(data[i,:])
+        # Number of averaged iterations
+        self.nIter = 1
+
+    # Save sorted data and column views
+    def _set_data(self, data):
+        """Save sorted data array and set views of each column
+
+        :Call:
+            >>> PS._set_data(data)
+        :Inputs:
+            *PS*: :class:`pyCart.pointsensor.PointSensor`
+                Point sensor
+            *data*: :class:`np.ndarray`\ [:class:`float`]
+                Sorted data array with either 9 (2-D) or 11 (3-D) columns
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0; split from :func:`__init__`
+        """
+        # Save the data
+        self.data = data
         # Check the dimensionality.
         if data.shape[1] == 9:
-            # Sort
-            i = np.lexsort((data[:,1], data[:,0]))
-            self.data = data[i,:]
             # Two-dimensional data
             self.nd = 2
             self.X = self.data[:,0]
@@ -1080,9 +1519,6 @@ class PointSensor(object):
             self.RefLev = self.data[:,7]
             self.i      = self.data[:,8]
         else:
-            # Sort
-            i = np.lexsort((data[:,2], data[:,1], data[:,0]))
-            self.data = data[i,:]
             # Three-dimensional data
             self.nd = 3
             self.X = self.data[:,0]
@@ -1096,11 +1532,8 @@ class PointSensor(object):
             self.P   = self.data[:,8]
             self.RefLev = self.data[:,9]
             self.i      = self.data[:,10]
-        # Sort
         # Save number of points
         self.nPoint = self.data.shape[0]
-        # Number of averaged iterations
-        self.nIter = 1
 
     # Representation method
     def __repr__(self):
@@ -1126,8 +1559,16 @@ class PointSensor(object):
                 Point sensor copied
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; skip re-sorting sorted data
         """
-        return PointSensor(data=self.data)
+        # Create instance without reading or sorting
+        P2 = self.__class__.__new__(self.__class__)
+        # Copy the (already sorted) data
+        P2._set_data(self.data.copy())
+        # Copy number of averaged iterations
+        P2.nIter = self.nIter
+        # Output
+        return P2
 
     # Write to file
     def Write(self, fname):
@@ -1142,27 +1583,23 @@ class PointSensor(object):
                 Name of Cart3D output point sensors file
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; use :func:`np.savetxt`
         """
-        # Open the file for writing.
-        f = open(fname, 'w')
-        # Write header
+        # Header and format string
         if self.nd == 2:
             # Two-dimensional data
-            f.write("# VARIABLES = X Y (P-Pinf)/Pinf RHO U V P ")
-            f.write("RefLev mgCycle/Time\n")
-            # Format string
-            fpr = (7*' %15.8e' + ' %i %7.3f\n')
+            hvars = HEADER_VARS_2D
+            fpr = FMT_PS_2D
         else:
             # Three-dimensional data
-            f.write("# VARIABLES = X Y Z (P-Pinf)/Pinf RHO U V W P ")
-            f.write("RefLev mgCycle/Time\n")
-            # Format string
-            fpr = (9*' %15.8e' + ' %i %7.3f\n')
-        # Write the points
-        for i in range(self.nPoint):
-            f.write(fpr % tuple(self.data[i,:]))
-        # Close the file.
-        f.close()
+            hvars = HEADER_VARS_3D
+            fpr = FMT_PS_3D
+        # Open the file for writing.
+        with open(fname, 'w') as f:
+            # Write header
+            f.write(hvars)
+            # Write the points
+            np.savetxt(f, self.data[:self.nPoint], fmt=fpr)
 
 
     # Extract value
@@ -1284,11 +1721,11 @@ class PointSensor(object):
                 Point sensor copied
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; fix type checks
         """
         # Check the input
-        t = type(c).__name__
-        if not (tc.startswith('int') or tc.startswith('float')):
-            return TypeError("Point sensors can only be multiplied by scalars.")
+        if not isinstance(c, SCALAR_TYPES):
+            raise TypeError("Point sensors can only be multiplied by scalars.")
         # Create a copy
         P2 = self.copy()
         # Multiply
@@ -1299,7 +1736,7 @@ class PointSensor(object):
             # Two-dimensional data
             P2.data[:,3:9] *= c
         # If integer, multiply number of iiterations included
-        if type(c).startswith('int'): P2.nIter*=c
+        if isinstance(c, INT_TYPES): P2.nIter*=c
         # Output
         return P2
 
@@ -1339,11 +1776,11 @@ class PointSensor(object):
                 Point sensor copied
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; fix type checks
         """
         # Check the input
-        t = type(c).__name__
-        if not (tc.startswith('int') or tc.startswith('float')):
-            return TypeError("Point sensors can only be multiplied by scalars.")
+        if not isinstance(c, SCALAR_TYPES):
+            raise TypeError("Point sensors can only be divided by scalars.")
         # Create a copy
         P2 = self.copy()
         # Multiply
@@ -1356,6 +1793,9 @@ class PointSensor(object):
         # Output
         return P2
 
+    # Division, Python 3 operator
+    __truediv__ = __div__
+
     # Addition method
     def __add__(self, P1):
         """Addition method
@@ -1372,18 +1812,19 @@ class PointSensor(object):
                 Point sensors added
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; fix type checks
         """
         # Check compatibility
-        if type(P1).__name__ != 'PointSensor':
+        if not isinstance(P1, PointSensor):
             # One addend is not a point sensor
-            return TypeError(
+            raise TypeError(
                 "Only point sensors can be added to point sensors.")
         elif self.nd != P1.nd:
             # Incompatible dimension
-            return IndexError("Cannot add 2D and 3D point sensors together.")
+            raise IndexError("Cannot add 2D and 3D point sensors together.")
         elif self.nPoint != P1.nPoint:
             # Mismatching number of points
-            return IndexError(
+            raise IndexError(
                 "Sensor 1 has %i points, and sensor 2 has %i points."
                 % (self.nPoint, P1.nPoint))
         # Create a copy.
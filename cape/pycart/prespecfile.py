@@ -18,11 +18,22 @@ additional refinement boxes and additional *XLev* surface refinements.
     * :mod:`cape.pycart.options.Mesh`
 """
 
+# Standard library
+import os
+import re
+
 # Local imports
 from ..filecntl.filecntl import FileCntl, _num, _float
 from ..tnakit.textutils.wrap import wrap_text
 
 
+# Regular expression for section titles, e.g. ``$__Prespecified...``
+REGEX_SECTION = re.compile(r"\$__([\w_]+)")
+
+# Lines of files already read: absolute path -> (mtime, size, lines)
+_PRESPEC_CACHE = {}
+
+
 # Base this class off of the main file control class.
 class PreSpecCntl(FileCntl):
     """File control class for :file:`preSpec.c3d.cntl` files
@@ -39,6 +50,7 @@ class PreSpecCntl(FileCntl):
             Name of CNTL file to read, defaults to ``'preSpec.c3d.cntl'``
     :Versions:
         * 2014-06-16 ``@ddalle``: First version
+        * 2026-10-17 ``@agent``: v1.1; split sections on first use
     """
 
     # Initialization method (not based off of FileCntl)
@@ -48,10 +60,44 @@ class PreSpecCntl(FileCntl):
         self.Read(fname)
         # Save the file name.
         self.fname = fname
-        # Split into sections.
-        self.SplitToSections(reg=r"\$__([\w_]+)")
+        # Split into sections when first needed (see UpdateSections)
+        self._section_regex = REGEX_SECTION
+        self._updated_lines = True
         return None
 
+    # Read the file, reusing lines if unchanged
+    def Read(self, fname: str):
+        r"""Read text from file, reusing lines from a previous read
+
+        :Call:
+            >>> preSpec.Read(fname)
+        :Inputs:
+            *preSpec*: :class:`pyCart.prespecfile.PreSpecCntl`
+                Instance of the :file:`preSpec.c3d.cntl` interface
+            *fname*: :class:`str`
+                Name of file to read from
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for file
+        if fname is None or not os.path.isfile(fname):
+            FileCntl.Read(self, fname)
+            return
+        # Absolute path, modification time, and size identify contents
+        fabs = os.path.abspath(fname)
+        st = os.stat(fabs)
+        # Check for previous read of the same file
+        mtime, size, lines = _PRESPEC_CACHE.get(fabs, (None, None, None))
+        if (mtime, size) == (st.st_mtime_ns, st.st_size):
+            # Initialize empty content, then copy saved lines
+            FileCntl.Read(self, None)
+            self.lines = list(lines)
+        else:
+            # Read the file and save its lines
+            FileCntl.Read(self, fname)
+            _PRESPEC_CACHE[fabs] = (
+                st.st_mtime_ns, st.st_size, tuple(self.lines))
+
     # Function to add an additional BBox
     def AddBBox(self, n, xlim):
         r"""
@@ -70,13 +116,48 @@ class PreSpecCntl(FileCntl):
             Adds a bounding box line to the existing boxes
         :Versions:
             * 2014-06-16 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; use :func:`_bbox_line`
         """
         # Compose the line.
-        line = "BBox: %-2i %10.4f %10.4f %10.4f %10.4f %10.4f %10.4f\n" % (
-            n, xlim[0], xlim[1], xlim[2], xlim[3], xlim[4], xlim[5])
+        line = _bbox_line(n, xlim)
         # Add the line
         self.PrependLineToSection('Prespecified_Adaptation_Regions', line)
 
+    # Function to add several BBoxes
+    def AddBBoxes(self, ns, xlims):
+        r"""Add several bounding boxes to the input control file
+
+        The result is the same as calling :func:`AddBBox` for each box
+        in order, but the section is only looked up once.
+
+        :Call:
+            >>> preSpec.AddBBoxes(ns, xlims)
+        :Inputs:
+            *preSpec*: :class:`pyCart.prespecfile.PreSpecCntl`
+                Instance of the :file:`preSpec.c3d.cntl` interface
+            *ns*: :class:`list`\ [:class:`int`]
+                Number of refinements to use in each box
+            *xlims*: :class:`list`\ [:class:`list`\ [:class:`float`]]
+                Limits *xmin*, *xmax*, *ymin*, *ymax*, *zmin*, *zmax*
+                of each box
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Section name
+        sec = 'Prespecified_Adaptation_Regions'
+        # Compose the lines
+        lines = [_bbox_line(n, xlim) for n, xlim in zip(ns, xlims)]
+        # Check for empty list
+        if len(lines) == 0:
+            return
+        # Set the update flags.
+        self.UpdateSections()
+        self._updated_sections = True
+        # Check for the section
+        self.AssertSection(sec)
+        # Prepend in reverse order, as repeated AddBBox() would
+        self.Section[sec][1:1] = lines[::-1]
+
     # Function to clear all existing bounding boxes.
     def ClearBBox(self):
         """Delete all existing bounding boxes
@@ -144,3 +225,26 @@ class PreSpecCntl(FileCntl):
             'Prespecified_Adaptation_Regions', 'XLev')
 
 
+# Format a BBox line
+def _bbox_line(n, xlim):
+    r"""Format a ``BBox:`` line for :file:`preSpec.c3d.cntl`
+
+    :Call:
+        >>> line = _bbox_line(n, xlim)
+    :Inputs:
+        *n*: :class:`int`
+            Number of refinements to use in the box
+        *xlim*: :class:`numpy.ndarray` or :class:`list`\ [:class:`float`]
+            List of *xmin*, *xmax*, *ymin*, *ymax*, *zmin*, *zmax*
+    :Outputs:
+        *line*: :class:`str`
+            Formatted line, including newline
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Convert limits to Python floats once
+    x1, x2, y1, y2, z1, z2 = map(float, xlim[:6])
+    # Compose the line
+    return (
+        f"BBox: {int(n):<2d} {x1:10.4f} {x2:10.4f} {y1:10.4f} "
+        f"{y2:10.4f} {z1:10.4f} {z2:10.4f}\n")
@@ -102,15 +102,16 @@ class Triq(capetri.Triq):
                 Freestream Mach number for updating *Cp*
         :Versions:
             * 2016-01-23 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; broadcast *xcg*
         """
         # Calculate area-averaged node normals
         self.GetNodeNormals()
-        # Make center of gravity vector
-        Xcg = np.repeat([xcg], self.nNode, axis=0)
+        # Position of each node relative to center of gravity
+        dX = self.Nodes - np.asarray(xcg, dtype="float")
         # Calculate angular velocities at each node
-        V = np.cross(self.Nodes-Xcg, w)
+        V = np.cross(dX, w)
         # Calculate dot product of surface normals and nodal velocities
-        Vn = np.sum(V*self.NodeNormals, 1)
+        Vn = np.einsum("ij,ij->i", V, self.NodeNormals)
         # Local speed of sound (with minimum pressure 0.001)
         an = np.sqrt(self.q[:, 1] / (1.4*np.fmax(self.q[:, 5], 0.001)))
         # Divide by local speed of sound
@@ -149,15 +150,16 @@ class Triq(capetri.Triq):
                 Freestream Mach number for updating *Cp*
         :Versions:
             * 2016-01-23 ``@ddalle``: First version
+            * 2026-10-17 ``@agent``: v1.1; broadcast *xcg*
         """
         # Calculate area-averaged node normals
         self.GetNodeNormals()
-        # Make center of gravity vector
-        Xcg = np.repeat([xcg], self.nNode, axis=0)
+        # Position of each node relative to center of gravity
+        dX = self.Nodes - np.asarray(xcg, dtype="float")
         # Calculate angular velocities at each node
-        V = np.cross(self.Nodes-Xcg, w*Lref)
+        V = np.cross(dX, np.asarray(w)*Lref)
         # Calculate dot product of surface normals and nodal velocities
-        Vn = np.sum(V*self.NodeNormals, 1)
+        Vn = np.einsum("ij,ij->i", V, self.NodeNormals)
         # Calculate pressure ratio
         dp = - np.sqrt(1.4*self.q[:, 1]*self.q[:, 5])*Vn
         # Save the updated state
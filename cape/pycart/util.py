@@ -146,21 +146,27 @@ def GetHistIter(fname='history.dat'):
 
 
 # Get steady-state history iteration
-def GetSteadyHistIter():
+def GetSteadyHistIter(cwd=None):
     r"""Get largest steady-state iteration number from ``history.dat``
 
     :Call:
-        >>> n = GetSteadyHistIter()
+        >>> n = GetSteadyHistIter(cwd=None)
+    :Inputs:
+        *cwd*: {``None``} | :class:`str`
+            Case folder, defaults to current working directory
     :Outputs:
         *n*: :class:`int`
             Iteration number of last line w/o decimal (integer)
     :Versions:
         * 2015-12-02 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; add *cwd*
     """
+    # Folder containing candidate history files
+    fdir = "" if cwd is None else cwd
     # Candidate history files
-    f1 = 'history.dat'
-    f2 = os.path.join('BEST', 'history.dat')
-    f3 = os.path.join('BEST', 'FLOW', 'history.dat')
+    f1 = os.path.join(fdir, 'history.dat')
+    f2 = os.path.join(fdir, 'BEST', 'history.dat')
+    f3 = os.path.join(fdir, 'BEST', 'FLOW', 'history.dat')
 
     # Get the history file.
     if os.path.isfile(f1):
@@ -209,21 +215,27 @@ def GetSteadyHistIter():
 
 
 # Get unsteady history iteration
-def GetUnsteadyHistIter():
+def GetUnsteadyHistIter(cwd=None):
     r"""Get largest time-accurate iteration number from ``history.dat``
 
     :Call:
-        >>> n = GetUnsteadyHistIter()
+        >>> n = GetUnsteadyHistIter(cwd=None)
+    :Inputs:
+        *cwd*: {``None``} | :class:`str`
+            Case folder, defaults to current working directory
     :Outputs:
         *n*: :class:`float`
             Most recent iteration number, including partial iterations
     :Versions:
         * 2015-12-02 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; add *cwd*
     """
+    # Folder containing candidate history files
+    fdir = "" if cwd is None else cwd
     # Candidate history files
-    f1 = 'history.dat'
-    f2 = os.path.join('BEST', 'history.dat')
-    f3 = os.path.join('BEST', 'FLOW', 'history.dat')
+    f1 = os.path.join(fdir, 'history.dat')
+    f2 = os.path.join(fdir, 'BEST', 'history.dat')
+    f3 = os.path.join(fdir, 'BEST', 'FLOW', 'history.dat')
 
     # Get the history file.
     if os.path.isfile(f1):
@@ -265,17 +277,21 @@ def GetUnsteadyHistIter():
 
 
 # Get total history iteration
-def GetTotalHistIter():
+def GetTotalHistIter(cwd=None):
     r"""Get current iteration from ``history.dat`` corrected by restart
 
     :Call:
-        >>> n = GetUnsteadyHistIter()
+        >>> n = GetTotalHistIter(cwd=None)
+    :Inputs:
+        *cwd*: {``None``} | :class:`str`
+            Case folder, defaults to current working directory
     :Outputs:
         *n*: :class:`float`
             Most recent iteration number, including partial iters
     :Versions:
         * 2015-12-02 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; add *cwd*
     """
     # Return history
-    return GetSteadyHistIter() + GetUnsteadyHistIter()
+    return GetSteadyHistIter(cwd) + GetUnsteadyHistIter(cwd)
 
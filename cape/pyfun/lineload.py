@@ -400,7 +400,8 @@ class CaseSeam(lineload.CaseSeam):
     :Versions:
         * 2016-06-09 ``@ddalle``: First version
     """
-    pass
+    # Attributes
+    __slots__ = ()
 # class CaseSeam
 
 
@@ -21,6 +21,7 @@ are available unless specifically overwritten by specific
 """
 
 # Standard library modules
+import fnmatch
 import glob
 import os
 import shutil
@@ -730,21 +731,52 @@ def EditSplitmqI(fin, fout, qin, qout):
     fo.close()
 
 
+# Match file names from a listing or the file system
+def _glob(pattern, fnames=None):
+    r"""Find files matching a glob, optionally from a folder listing
+
+    :Call:
+        >>> fglob = _glob(pattern, fnames=None)
+    :Inputs:
+        *pattern*: :class:`str`
+            File name glob
+        *fnames*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of files in current folder; use :func:`glob.glob`
+            if ``None``
+    :Outputs:
+        *fglob*: :class:`list`\ [:class:`str`]
+            Names of files matching *pattern*
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Check for listing
+    if fnames is None:
+        return glob.glob(pattern)
+    else:
+        return fnmatch.filter(fnames, pattern)
+
+
 # Get best Q file
-def GetQ():
+def GetQ(fnames=None):
     r"""Find most recent ``q.*`` file, with ``q.avg`` taking precedence
 
     :Call:
-        >>> fq = GetQ()
+        >>> fq = GetQ(fnames=None)
+    :Inputs:
+        *fnames*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of files in current folder, if already listed
     :Outputs:
         *fq*: ``None`` | :class:`str`
             Name of most recent averaged ``q`` file or newest ``q`` file
     :Versions:
         * 2016-12-29 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; add *fnames*
     """
     # Get the list of q files
-    qglob = glob.glob('q.save')+glob.glob('q.restart')+glob.glob('q.[0-9]*')
-    qavgb = glob.glob('q.avg*')
+    qglob = (
+        _glob('q.save', fnames) + _glob('q.restart', fnames) +
+        _glob('q.[0-9]*', fnames))
+    qavgb = _glob('q.avg*', fnames)
     # Check for averaged files
     if len(qavgb) > 0:
         qglob = qavgb
@@ -760,22 +792,25 @@ def GetQ():
 
 
 # Get best q file
-def GetLatest(glb):
+def GetLatest(glb, fnames=None):
     r"""Get the most recent file matching a glob or list of globs
 
     :Call:
-        >>> fq = GetLatest(glb)
-        >>> fq = GetLatest(lglb)
+        >>> fq = GetLatest(glb, fnames=None)
+        >>> fq = GetLatest(lglb, fnames=None)
     :Inputs:
         *glb*: :class:`str`
             File name glob
         *lblb*: :class:`list`\ [:class:`str`]
             List of file name globs
+        *fnames*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of files in current folder, if already listed
     :Outputs:
         *fq*: ``None`` | :class:`str`
             Name of most recent file matching glob(s)
     :Versions:
         * 2017-01-08 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; add *fnames*
     """
     # Check type
     if type(glb).__name__ in ['list', 'ndarray']:
@@ -784,10 +819,10 @@ def GetLatest(glb):
         # Loop through globs
         for g in glb:
             # Add the matches to this glob (don't worry about duplicates)
-            fglb += glob.glob(g)
+            fglb += _glob(g, fnames)
     else:
         # Single glob
-        fglb = glob.glob(glb)
+        fglb = _glob(glb, fnames)
     # Exit if none
     if len(fglb) == 0:
         return None
@@ -839,21 +874,29 @@ def LinkLatest(fsrc, fname):
 
 
 # Link best Q file
-def LinkQ():
+def LinkQ(fnames=None):
     r"""Link the most recent ``q.*`` file to a fixed file name
 
     :Call:
-        >>> LinkQ()
+        >>> LinkQ(fnames=None)
+    :Inputs:
+        *fnames*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of files in current folder, if already listed
     :Versions:
         * 2016-09-06 ``@ddalle``: v1.0
         * 2016-12-29 ``@ddalle``: Moved file search to :func:`GetQ`
+        * 2026-10-17 ``@agent``: v1.2; list folder once
     """
+    # List folder once for all searches
+    if fnames is None:
+        fnames = os.listdir('.')
     # Get the general best ``q`` file name
-    fq = GetQ()
+    fq = GetQ(fnames)
     # Get the best single-iter, ``q.avg``, and ``q.srf`` files
-    fqv = GetLatest(["q.[0-9]*[0-9]", "q.save", "q.restart"])
-    fqa = GetLatest(["q.[0-9]*.avg", "q.avg*"])
-    fqs = GetLatest(["q.[0-9]*.srf", "q.srf*", "q.[0-9]*.surf", "q.surf*"])
+    fqv = GetLatest(["q.[0-9]*[0-9]", "q.save", "q.restart"], fnames)
+    fqa = GetLatest(["q.[0-9]*.avg", "q.avg*"], fnames)
+    fqs = GetLatest(
+        ["q.[0-9]*.srf", "q.srf*", "q.[0-9]*.surf", "q.surf*"], fnames)
     # Create links (safely)
     LinkLatest(fq,  'q.pyover.p3d')
     LinkLatest(fqv, 'q.pyover.vol')
@@ -862,21 +905,25 @@ def LinkQ():
 
 
 # Get best Q file
-def GetX():
+def GetX(fnames=None):
     r"""Get the most recent ``x.*`` file
 
     :Call:
-        >>> fx = GetX()
+        >>> fx = GetX(fnames=None)
+    :Inputs:
+        *fnames*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of files in current folder, if already listed
     :Outputs:
         *fx*: ``None`` | :class:`str`
             Name of most recent ``x.save`` or similar file
     :Versions:
         * 2016-12-29 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; add *fnames*
     """
     # Get the list of q files
     xglob = (
-        glob.glob('x.save') + glob.glob('x.restart') +
-        glob.glob('x.[0-9]*') + glob.glob('grid.in'))
+        _glob('x.save', fnames) + _glob('x.restart', fnames) +
+        _glob('x.[0-9]*', fnames) + _glob('grid.in', fnames))
     # Exit if no files
     if len(xglob) == 0:
         return
@@ -889,18 +936,26 @@ def GetX():
 
 
 # Link best X file
-def LinkX():
+def LinkX(fnames=None):
     r"""Link the most recent ``x.*`` file to a fixed file name
 
     :Call:
-        >>> LinkX()
+        >>> LinkX(fnames=None)
+    :Inputs:
+        *fnames*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of files in current folder, if already listed
     :Versions:
         * 2016-09-06 ``@ddalle``: v1.0
+        * 2026-10-17 ``@agent``: v1.1; list folder once
     """
+    # List folder once for all searches
+    if fnames is None:
+        fnames = os.listdir('.')
     # Get the best file
-    fx = GetX()
+    fx = GetX(fnames)
     # Get the best surf grid if available
-    fxs = GetLatest(["x.[0-9]*.srf", "x.srf*", "x.[0-9]*.surf", "x.surf*"])
+    fxs = GetLatest(
+        ["x.[0-9]*.srf", "x.srf*", "x.[0-9]*.surf", "x.surf*"], fnames)
     # Create links (safely)
     LinkLatest(fx,  'x.pyover.p3d')
     LinkLatest(fxs, 'x.pyover.srf')
@@ -929,17 +984,20 @@ def GetQFile(fqi="q.pyover.p3d"):
     :Versions:
         * 2016-12-30 ``@ddalle``: v1.0
         * 2017-03-28 ``@ddalle``: v1.1; from ```lineload` to ``case``
+        * 2026-10-17 ``@agent``: v1.2; list folder once
     """
+    # List folder once for all file searches
+    fnames = os.listdir('.')
     # Link grid and solution files
-    LinkQ()
-    LinkX()
+    LinkQ(fnames)
+    LinkX(fnames)
     # Check for the input file
     if os.path.isfile(fqi):
         # Use the file (may be a link, in fact it usually is)
         fq = fqi
     else:
         # Best Q file available (usually "q.avg" or "q.save")
-        fq = GetQ()
+        fq = GetQ(fnames)
     # Check for q.avg iteration count
     n = checkqavg(fq)
     # Read the current "time" parameter
@@ -26,6 +26,8 @@ Finally, reading seam curves from individual cases utilizes the class
 # Standard library
 import os
 import shutil
+import subprocess as sp
+from functools import lru_cache
 
 # Local imports
 from . import casecntl
@@ -33,6 +35,178 @@ from .. import config
 from ..cfdx import lineload
 
 
+# Data book input files given relative to *RootDir*
+DATABOOK_INPUT_FILES = ("mixsur", "usurp", "splitmq", "fomo")
+
+
+# Whether to run (splitmq, splitmx) based on status of surface files:
+# (q.srf exists, q.srf is up-to-date, x.srf exists)
+SPLITMQ_ACTIONS = {
+    (False, False, False): (True, True),
+    (False, False, True): (True, True),
+    (True, False, False): (True, True),
+    (True, False, True): (True, True),
+    (True, True, False): (False, True),
+    (True, True, True): (False, False),
+}
+
+
+# Get absolute paths to input files
+def _get_input_files(DB):
+    r"""Get absolute paths of ``mixsur``, ``usurp``, etc. input files
+
+    :Call:
+        >>> files = _get_input_files(DB)
+    :Inputs:
+        *DB*: :class:`DBLineLoad`
+            TriqFM or line load data book
+    :Outputs:
+        *files*: :class:`dict`\ [:class:`str` | ``None``]
+            Absolute path for each option in *DATABOOK_INPUT_FILES*
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Initialize
+    files = {}
+    # Loop through options
+    for opt in DATABOOK_INPUT_FILES:
+        # Get file name
+        fname = getattr(DB.opts, "get_DataBook_" + opt)(DB.comp)
+        # Get absolute file path
+        if fname and not os.path.isabs(fname):
+            fname = os.path.join(DB.RootDir, fname)
+        # Save it
+        files[opt] = fname
+    # Output
+    return files
+
+
+# Get file status if it exists
+def _stat(fname):
+    r"""Get status of a file (following links), if it exists
+
+    :Call:
+        >>> st = _stat(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file
+    :Outputs:
+        *st*: :class:`os.stat_result` | ``None``
+            Status of file, or ``None`` if it does not exist
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    try:
+        return os.stat(fname)
+    except OSError:
+        return None
+
+
+# Read time from a ``q`` file header, cached by modification time
+@lru_cache(maxsize=256)
+def _checkqt_cached(fabs, mtime_ns):
+    r"""Cached version of :func:`casecntl.checkqt`
+
+    :Call:
+        >>> t = _checkqt_cached(fabs, mtime_ns)
+    :Inputs:
+        *fabs*: :class:`str`
+            Absolute path to OVERFLOW ``q`` file
+        *mtime_ns*: :class:`int`
+            Modification time of *fabs* in nanoseconds, used as key
+    :Outputs:
+        *t*: ``None`` | :class:`float`
+            Iteration number or time value
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    return casecntl.checkqt(fabs)
+
+
+# Check iteration number or time in a ``q`` file
+def _checkqt(fname):
+    r"""Check the iteration number or time in a ``q`` file
+
+    Results are reused until the file's modification time changes.
+
+    :Call:
+        >>> t = _checkqt(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of OVERFLOW ``q`` file
+    :Outputs:
+        *t*: ``None`` | :class:`float`
+            Iteration number or time value
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Absolute path so that cache survives changes of working folder
+    fabs = os.path.abspath(fname)
+    # Read header unless same version of file was already checked
+    return _checkqt_cached(fabs, os.stat(fabs).st_mtime_ns)
+
+
+# Link a file, preferring a hard link
+def _link(src, dst):
+    r"""Create a hard link to a file, or a symbolic link if that fails
+
+    Hard links fail across file systems or on file systems without
+    support for them, in which case a symbolic link is created instead.
+
+    :Call:
+        >>> _link(src, dst)
+    :Inputs:
+        *src*: :class:`str`
+            Name of existing file, relative to current folder
+        *dst*: :class:`str`
+            Name of link to create
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    try:
+        # Resolve links first; some systems hard-link the link itself
+        os.link(os.path.realpath(src), dst)
+    except OSError:
+        os.symlink(src, dst)
+
+
+# Run a preprocessing tool
+def _run(cmd, fin, fout, tool):
+    r"""Run a command with STDIN and STDOUT redirected to files
+
+    STDERR is written to the same file as STDOUT.
+
+    :Call:
+        >>> _run(cmd, fin, fout, tool)
+    :Inputs:
+        *cmd*: :class:`list`\ [:class:`str`]
+            Command and arguments, as for :func:`subprocess.call`
+        *fin*: :class:`str`
+            Name of file to use as STDIN
+        *fout*: :class:`str`
+            Name of file for STDOUT and STDERR
+        *tool*: :class:`str`
+            Name of tool to use in error message
+    :Raises:
+        :class:`SystemError` if command fails or is not found
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Status update
+    print("    %s < %s >& %s" % (" ".join(cmd), fin, fout))
+    # Open input and output files
+    with open(fin, 'rb') as fi, open(fout, 'wb') as fo:
+        # Run the command without a shell
+        try:
+            ierr = sp.call(cmd, stdin=fi, stdout=fo, stderr=sp.STDOUT)
+        except FileNotFoundError:
+            # Executable not found
+            ierr = 2
+    # Check for errors
+    if ierr:
+        raise SystemError("Failure while running ``%s``" % tool)
+
+
 # Create grid.itriq
 def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     """Perform any necessary preprocessing to create ``triq`` file
@@ -48,24 +222,19 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
         * 2016-12-20 ``@ddalle``: First version
         * 2016-12-21 ``@ddalle``: Added PBS
         * 2017-04-13 ``@ddalle``: Wrote single version for LL and TriqFM
+        * 2026-10-17 ``@agent``: v1.1; use :func:`_get_input_files`
     """
    # -------
    # Options
    # -------
-    # Get input files
-    fusurp   = DB.opts.get_DataBook_usurp(DB.comp)
-    fmixsur  = DB.opts.get_DataBook_mixsur(DB.comp)
-    fsplitmq = DB.opts.get_DataBook_splitmq(DB.comp)
-    ffomo    = DB.opts.get_DataBook_fomo(DB.comp)
-    # Get absolute file paths
-    if (fusurp) and (not os.path.isabs(fusurp)):
-        fusurp = os.path.join(DB.RootDir, fusurp)
-    if (fmixsur) and (not os.path.isabs(fmixsur)):
-        fmixsur = os.path.join(DB.RootDir, fmixsur)
-    if (fsplitmq) and (not os.path.isabs(fsplitmq)):
-        fsplitmq = os.path.join(DB.RootDir, fsplitmq)
-    if (ffomo) and (not os.path.isabs(ffomo)):
-        ffomo = os.path.join(DB.RootDir, ffomo)
+    # Name of component
+    comp = DB.comp
+    # Get input files as absolute paths
+    files = _get_input_files(DB)
+    fusurp   = files["usurp"]
+    fmixsur  = files["mixsur"]
+    fsplitmq = files["splitmq"]
+    ffomo    = files["fomo"]
     # Check for the files
     qfusurp  = (fusurp is not None) and os.path.isfile(fusurp)
     qfmixsur = (fmixsur is not None) and os.path.isfile(fmixsur)
@@ -73,19 +242,25 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     # Check for a folder we can copy MIXSUR/USURP files from 
     qfomo = (ffomo!=None) and os.path.isdir(ffomo)
     # Get Q/X files
-    fqi = DB.opts.get_DataBook_QIn(DB.comp)
-    fxi = DB.opts.get_DataBook_XIn(DB.comp)
-    fqo = DB.opts.get_DataBook_QOut(DB.comp)
-    fxo = DB.opts.get_DataBook_XOut(DB.comp)
+    fqi = DB.opts.get_DataBook_QIn(comp)
+    fxi = DB.opts.get_DataBook_XIn(comp)
+    fqo = DB.opts.get_DataBook_QOut(comp)
+    fxo = DB.opts.get_DataBook_XOut(comp)
     # If there's no mixsur file, there's nothing we can do
     if not (qfmixsur or qfusurp):
         raise RuntimeError(
             ("No 'mixsur' or 'overint' or 'usurp' input file found ") +
-            ("for component '%s'" % DB.comp))
+            ("for component '%s'" % comp))
     # Local names for input files
-    lsplitmq = 'splitmq.%s.i' % DB.comp
-    lsplitmx = 'splitmx.%s.i' % DB.comp
-    lmixsur  = 'mixsur.%s.i' % DB.comp
+    lsplitmq = 'splitmq.%s.i' % comp
+    lsplitmx = 'splitmx.%s.i' % comp
+    lmixsur  = 'mixsur.%s.i' % comp
+    # Local names for output logs
+    osplitmq = 'splitmq.%s.o' % comp
+    osplitmx = 'splitmx.%s.o' % comp
+    omixsur  = 'mixsur.%s.o' % comp
+    ousurp   = 'usurp.%s.o' % comp
+    ooverint = 'overint.%s.o' % comp
     # Source *q* file is in parent folder
     fqvol = fq
     # Source *x* file if needed
@@ -94,9 +269,14 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     if not os.path.isfile(fqvol):
         return
     # If we're in PreprocessTriq, all x/q files are out-of-date
-    for f in ["grid.in", "x.srf", "x.vol", "q.save", "q.srf", "q.vol"]:
-        # Check if file esists
-        if os.path.islink(f): os.remove(f)
+    flinks = {"grid.in", "x.srf", "x.vol", "q.save", "q.srf", "q.vol"}
+    # Volume inputs may be hard links, so always remove those
+    fvols = {"x.vol", "q.vol"}
+    # Remove any of them that are links, listing folder only once
+    with os.scandir('.') as dirents:
+        for d in dirents:
+            if d.name in fvols or (d.name in flinks and d.is_symlink()):
+                os.remove(d.name)
    # -------------------------------------
    # Determine MIXSUR output folder status
    # -------------------------------------
@@ -154,8 +334,8 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     # Use this while loop as a method to use ``break``
     if qfsplitm:
         # Source file option(s)
-        fqo = DB.opts.get_DataBook_QSurf(DB.comp)
-        fxo = DB.opts.get_DataBook_XSurf(DB.comp)
+        fqo = DB.opts.get_DataBook_QSurf(comp)
+        fxo = DB.opts.get_DataBook_XSurf(comp)
         
         # Get absolute path
         if fqo is None:
@@ -170,36 +350,23 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
         else:
             # Get path to parent folder
             fxsrf = os.path.join('..', fxo)
-        # Check for existing split surface file in lineload/
-        if not os.path.isfile(fxsrf) and os.path.isfile("grid.in"):
+        # Check for split surface grid, else use existing one in lineload/
+        has_xsrf = os.path.isfile(fxsrf)
+        if not has_xsrf and os.path.isfile("grid.in"):
             # Use the existing grid file in the lineload/ folder
             fxsrf = "grid.in"
-        # Check for existing split surface file in lineload/
-        if not os.path.isfile(fqsrf) and os.path.isfile("q.save"):
-            # Use the existing grid file in the lineload/ folder
+            has_xsrf = True
+        # Check for split surface solution, else use one in lineload/
+        has_qsrf = os.path.isfile(fqsrf)
+        if not has_qsrf and os.path.isfile("q.save"):
+            # Use the existing solution file in the lineload/ folder
             fqsrf = "q.save"
-        # Check for "q.srf" file
-        if fqsrf and os.path.isfile(fqsrf):
-            # Get iteration number
-            tvol = casecntl.checkqt(fqvol)
-            tsrf = casecntl.checkqt(fqsrf)
-            # Check if it's up to date
-            if tsrf < tvol:
-                # Exists but out-of-date
-                qsplitmq = True
-                qsplitmx = True
-            elif fxsrf and os.path.isfile(fxsrf):
-                # Up-to-date, and surface grid good too
-                qsplitmq = False
-                qsplitmx = False
-            else:
-                # Up-to-date; but need to create 'x.srf'
-                qspltimq = False
-                qsplitmx = True
-        else:
-            # No candidate "q.srf" file from parent directory
-            qsplitmq = True
-            qsplitmx = True
+            has_qsrf = True
+        # Check if "q.srf" is at least as new as the volume solution
+        fresh = has_qsrf and bool(
+            _checkqt(fqsrf) >= _checkqt(fqvol))
+        # Look up whether to run ``splitmq`` and ``splitmx``
+        qsplitmq, qsplitmx = SPLITMQ_ACTIONS[has_qsrf, fresh, has_xsrf]
     else:
         # Do not run splitmq
         qsplitmq = False
@@ -210,25 +377,22 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     # Whether or not to split
     qsplitq = qsplitmq or qsplitmx
     # Copy "splitmq"/"splitmx" input template
-    if qsplitq: shutil.copy(fsplitmq, "splitmq.i")
+    if qsplitq: shutil.copyfile(fsplitmq, "splitmq.i")
     # Copy "mixsur"/"overint" input file
-    shutil.copy(fmixsur, lmixsur)
-    shutil.copy(fmixsur, "mixsur.i")
+    shutil.copyfile(fmixsur, lmixsur)
+    shutil.copyfile(fmixsur, "mixsur.i")
     # Prepare files for ``splitmq``
     if qsplitmq:
         # Link parent Q volume
-        os.symlink(fqvol, "q.vol")
-        # Edit the SPLITMQ input file
-        casecntl.EditSplitmqI("splitmq.i", lsplitmq, "q.vol", "q.save")
-        # Command to run splitmq
-        cmd = "splitmq < %s >& splitmq.%s.o" % (lsplitmq, DB.comp)
-        # Status update
-        print("    %s" % cmd)
-        # Run ``splitmq``
-        ierr = os.system(cmd)
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``splitmq``")
+        _link(fqvol, "q.vol")
+        # Remove link when done so it doesn't hold on to volume file
+        try:
+            # Edit the SPLITMQ input file
+            casecntl.EditSplitmqI("splitmq.i", lsplitmq, "q.vol", "q.save")
+            # Run ``splitmq``
+            _run(["splitmq"], lsplitmq, osplitmq, "splitmq")
+        finally:
+            os.remove("q.vol")
     elif qfsplitm:
         # Link parent *q.srf* to "q.save" so OVERINT uses it
         if fqsrf != "q.save":
@@ -239,18 +403,15 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
     # Prepare files for ``splitmx``
     if qsplitmx:
         # Link parent X volume
-        os.symlink(fxvol, "x.vol")
-        # Edit the SPLITMX input file
-        casecntl.EditSplitmqI("splitmq.i", lsplitmx, "x.vol", "grid.in")
-        # Command to run splitmx
-        cmd = "splitmx < %s >& splitmx.%s.o" % (lsplitmx, DB.comp)
-        # Status update
-        print("    %s" % cmd)
-        # Run ``splitmx``
-        ierr = os.system(cmd)
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``splitmx``")
+        _link(fxvol, "x.vol")
+        # Remove link when done so it doesn't hold on to volume file
+        try:
+            # Edit the SPLITMX input file
+            casecntl.EditSplitmqI("splitmq.i", lsplitmx, "x.vol", "grid.in")
+            # Run ``splitmx``
+            _run(["splitmx"], lsplitmx, osplitmx, "splitmx")
+        finally:
+            os.remove("x.vol")
     elif qfsplitm:
         # Link parent *x.srf* to "x.save" so OVERINT uses it
         if fxsrf != "grid.in":
@@ -264,55 +425,30 @@ def PreprocessTriqOverflow(DB, fq, fdir="lineload"):
    # ----------------------
     # Check for ``mixsur`` or ``usurp``
     if qfusurp and (not qusurp):
-        # Command to usurp
-        cmd = ("usurp -v --watertight --disjoin=yes < %s >& usurp.%s.o"
-            % (fmixsur, DB.comp))
-        # Status update
-        print("    %s" % cmd)
         # Run ``usurp``
-        ierr = os.system(cmd)
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``usurp``")
+        _run(
+            ["usurp", "-v", "--watertight", "--disjoin=yes"],
+            fmixsur, ousurp, "usurp")
     elif (not qfusurp) and (not qusurp) and (not qmixsur):
-        # Command to mixsur
-        cmd = "mixsur < %s >& mixsur.%s.o" % (fmixsur, DB.comp)
-        # Status update
-        print("    %s" % cmd)
         # Run ``mixsur``
-        ierr = os.system(cmd)
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``mixsur``")
+        _run(["mixsur"], fmixsur, omixsur, "mixsur")
    # -----------------------
    # Prepare ``grid.i.triq``
    # -----------------------
-    # Check for ``mixsur`` or ``usurp``
-    if qfusurp or qusurp:
-        # Command to usurp
-        cmd = ("usurp -v --use-map < %s >& usurp.%s.o"
-            % (lmixsur, DB.comp))
-        # Status update
-        print("    %s" % cmd)
-        # Run ``usurp
-        ierr = os.system(cmd)
-        # Go back up
-        os.chdir("..")
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``usurp``")
-    else:
-        # Command to overint
-        cmd = "overint < %s >& overint.%s.o" % (lmixsur, DB.comp)
-        # Status update
-        print("    %s" % cmd)
-        # Run ``overint``
-        ierr = os.system(cmd)
+    # Return to run directory even if the tool fails
+    try:
+        # Check for ``mixsur`` or ``usurp``
+        if qfusurp or qusurp:
+            # Run ``usurp``
+            _run(
+                ["usurp", "-v", "--use-map"],
+                lmixsur, ousurp, "usurp")
+        else:
+            # Run ``overint``
+            _run(["overint"], lmixsur, ooverint, "overint")
+    finally:
         # Go back up to run directory
         os.chdir("..")
-        # Check for errors
-        if ierr:
-            raise SystemError("Failure while running ``overint``")
 # def PreprocessTriq
 
 
@@ -362,56 +498,92 @@ class DBLineLoad(lineload.DBLineLoad):
                 Instance of line load data book
         :Versions:
             * 2016-12-22 ``@ddalle``: First version, extracted from __init__
+            * 2026-10-17 ``@agent``: v1.1; use :func:`_get_input_files`
         """
-        # Figure out reference component
+        # Figure out reference component (expanded on first use)
         self.CompID = self.opts.get_DataBookCompID(self.comp)
-        # Get input files
-        fmixsur  = self.opts.get_DataBook_mixsur(self.comp)
-        fusurp   = self.opts.get_DataBook_usurp(self.comp)
-        fsplitmq = self.opts.get_DataBook_splitmq(self.comp)
-        ffomo    = self.opts.get_DataBook_fomo(self.comp)
-        # Get absolute file paths
-        if (fmixsur) and (not os.path.isabs(fmixsur)):
-            fmixsur = os.path.join(self.RootDir, fmixsur)
-        if (fusurp) and (not os.path.isabs(fusurp)):
-            fusurp = os.path.join(self.RootDir, fusurp)
-        if (fsplitmq) and (not os.path.isabs(fsplitmq)):
-            fsplitmq = os.path.join(self.RootDir, fsplitmq)
-        if (ffomo) and (not os.path.isabs(ffomo)):
-            ffomo = os.path.join(self.RootDir, ffomo)
+        # Get input files as absolute paths
+        files = _get_input_files(self)
         # Save files
-        self.mixsur  = fmixsur
-        self.usurp   = fusurp
-        self.splitmq = fsplitmq
-        self.fomodir = ffomo
+        self.mixsur  = files["mixsur"]
+        self.usurp   = files["usurp"]
+        self.splitmq = files["splitmq"]
+        self.fomodir = files["fomo"]
         # Get Q/X files
         self.fqi = self.opts.get_DataBook_QIn(self.comp)
         self.fxi = self.opts.get_DataBook_XIn(self.comp)
         self.fqo = self.opts.get_DataBook_QOut(self.comp)
         self.fxo = self.opts.get_DataBook_XOut(self.comp)
         # Make sure it's not a list
-        if type(self.CompID).__name__ == 'list':
+        if isinstance(self._compid_opt, list):
             # Take the first component
-            self.RefComp = self.CompID[0]
+            self.RefComp = self._compid_opt[0]
         else:
             # One component listed; use it
-            self.RefComp = self.CompID
-        # Try to read the configuration
-        try:
-            # Read the MIXSUR.I file
-            self.conf = config.ConfigMIXSUR(self.usurp)
-        except Exception:
-            # Try the MIXSUR input file
-            try:
-                self.conf = config.ConfigMIXSUR(self.mixsur)
-            except Exception:
-                pass
-        # Try to get all components
-        try:
-            # Use the configuration interface
-            self.CompID = self.conf.GetCompID(self.CompID)
-        except Exception:
-            pass
+            self.RefComp = self._compid_opt
+
+    # Surface configuration
+    @property
+    def conf(self):
+        r"""Surface configuration, read from ``usurp``/``mixsur`` input
+
+        The input file is only read the first time this is accessed;
+        if neither file can be read, the *conf* given to
+        :class:`DBLineLoad` is used.
+
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check if already read
+        if not self._conf_read:
+            # Only try once
+            self._conf_read = True
+            # Read the configuration from USURP or MIXSUR input file
+            for fcfg in (getattr(self, "usurp", None),
+                         getattr(self, "mixsur", None)):
+                # Check if the file exists
+                if not (fcfg and os.path.isfile(fcfg)):
+                    continue
+                # Try to read it (may not be a valid input file)
+                try:
+                    self._conf = config.ConfigMIXSUR(fcfg)
+                    break
+                except (TypeError, ValueError, IndexError):
+                    pass
+        # Output
+        return self._conf
+
+    @conf.setter
+    def conf(self, conf):
+        # Save fallback configuration and read input file again
+        self._conf = conf
+        self._conf_read = False
+
+    # List of component IDs
+    @property
+    def CompID(self):
+        r"""Component ID numbers, expanded using *conf* on first use
+
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check if already expanded
+        if self._compid is None:
+            # Get configuration (may read file)
+            conf = self.conf
+            # Get all components
+            if conf is None:
+                self._compid = self._compid_opt
+            else:
+                self._compid = conf.GetCompID(self._compid_opt)
+        # Output
+        return self._compid
+
+    @CompID.setter
+    def CompID(self, compID):
+        # Save unexpanded value
+        self._compid_opt = compID
+        self._compid = None
     
     # Get file
     def GetTriqFile(self):
@@ -435,22 +607,19 @@ class DBLineLoad(lineload.DBLineLoad):
                 Last iteration in the averaging
         :Versions:
             * 2016-12-19 ``@ddalle``: Added to the module
+            * 2026-10-17 ``@agent``: v1.1; one :func:`os.stat` per file
         """
         # Get properties of triq file
         fq, n, i0, i1 = casecntl.GetQFile(self.fqi)
         # Get the corresponding .triq file name
         ftriq = os.path.join('lineload', 'grid.i.triq')
-        # Check for 'q.strt'
-        if os.path.isfile(fq):
-            # Source file exists
-            fsrc = os.path.realpath(fq)
-        else:
-            # No source just yet
-            fsrc = None
+        # Status of source Q file (following links) and TRIQ file
+        st_src = _stat(fq)
+        st_triq = _stat(ftriq)
         # Check if the TRIQ file exists
-        if os.path.isfile(ftriq) and fsrc and os.path.isfile(fsrc):
+        if st_triq and st_src:
             # Check modification dates
-            if os.path.getmtime(ftriq) < os.path.getmtime(fsrc):
+            if st_triq.st_mtime_ns < st_src.st_mtime_ns:
                 # 'grid.i.triq' exists, but Q file is newer
                 qpre = True
             else:
@@ -604,6 +773,7 @@ class CaseSeam(lineload.CaseSeam):
     :Versions:
         * 2016-06-09 ``@ddalle``: First version
     """
-    pass
+    # Attributes
+    __slots__ = ()
 # class CaseSeam
             
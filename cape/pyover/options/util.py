@@ -22,21 +22,17 @@ parameter should be is below.
     * :mod:`cape.pyover.options`
 """
 
+# Standard library
+import os
+
 # Import CAPE options utilities
-from ...cfdx.options.util import *
+from ...cfdx.options.util import applyDefaults, rc, getel, getDefaults
 
 
 # Local folders
 PYOVER_OPTS_FOLDER = os.path.dirname(os.path.abspath(__file__))
 PYOVER_FOLDER = os.path.dirname(PYOVER_OPTS_FOLDER)
 
-
-# Get the root directory of the module.
-_fname = os.path.abspath(__file__)
-
-# Saved folder names
-PyOverFolder = os.path.split(os.path.split(_fname)[0])[0]
-
 # Backup default settings
 rc["OverNamelist"]         = "overflow.inp"
 rc["project_rootname"]     = "run"
@@ -102,9 +98,10 @@ def getPyOverDefaults():
     :Versions:
         * 2015-12-29 ``@ddalle``: Version 1.0 (OVERFLOW version)
         * 2021-03-01 ``@ddalle``: Version 2.0; local settings
+        * 2026-10-17 ``@agent``: Version 2.1; reuse unchanged file
     """
     # Fixed default file
     fname = os.path.join(PYOVER_OPTS_FOLDER, "pyOver.default.json")
-    # Process the default input file
-    return loadJSONFile(fname)
+    # Process the default input file (or copy of previous read)
+    return getDefaults(fname)
     
@@ -56,10 +56,18 @@ class SplitZones:
                     overlapping_x_box_idx = overlapping_y_box_idx[overlapping_x_idx]
                     self.zones[(x, y, z)] = overlapping_x_box_idx
 
+    def get_zones(self, pts):
+        """
+        Find the sub-region index of each of several points, shape (N, 3). Points outside the mesh bounding box are
+        assigned to the nearest sub-region.
+        """
+        zone = ((np.asarray(pts) - self.min_corner) / self.bb_size) * self.splits
+        return np.clip(np.floor(np.nan_to_num(zone)), 0, self.splits - 1).astype(int)
+
     def get_near(self, pt):
         """
         Find triangles near a point. This function is guaranteed to return all triangles whose axis-aligned bounding
         box (AABB) encloses the point.
         """
-        zone = ((pt - self.min_corner) / self.bb_size) * self.splits
-        return self.zones[(int(zone[0]), int(zone[1]), int(zone[2]))]
+        zone = self.get_zones(pt)
+        return self.zones[(zone[0], zone[1], zone[2])]
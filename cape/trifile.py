@@ -29,10 +29,17 @@ import shutil
 import subprocess as sp
 import sys
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-party modules
 import numpy as np
 
+# Quasi-optional third-party modules
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
 # Local inputs
 from . import capeio as io
 from . import geom
@@ -42,11 +49,19 @@ from .cfdx import options
 from .cfdx import volcomp
 from .config import ConfigXML, ConfigJSON, ConfigMIXSUR
 from .cgns import CGNS
-from .util import stackcol
 from .splitzones import SplitZones
 
 # Constants
 INT_TYPES = (int, np.int64, np.int32)
+IZERO = np.zeros(0, dtype="int")
+# Coefficients from Triq.GetTriForces(), in order of its stacked sums
+TRIQ_FM_COEFFS = (
+    "CA", "CY", "CN", "CLL", "CLM", "CLN",
+    "CAp", "CYp", "CNp", "CLLp", "CLMp", "CLNp",
+    "CAvac", "CYvac", "CNvac", "CLLvac", "CLMvac", "CLNvac",
+    "CAm", "CYm", "CNm", "CLLm", "CLMm", "CLNm",
+    "CAv", "CYv", "CNv", "CLLv", "CLMv", "CLNv",
+)
 
 # Default tolerances for mapping triangulations
 atoldef = options.rc.get("atoldef", 1e-2)
@@ -104,6 +119,391 @@ def _readline(f, comment='#'):
     return line
 
 
+# Get in-plane distance from point(s) to several triangles
+def _dist2_tris_to_pt_inplane(X, Y, Z, e1, e2, x, y, z):
+    r"""Get square of in-plane distance from point(s) to triangles
+
+    Each triangle and test point is transformed into 2D coordinates
+    aligned with the first edge of the triangle before calling
+    :func:`cape.geom.dist2_tris_to_pt`.
+
+    :Call:
+        >>> DI = _dist2_tris_to_pt_inplane(X, Y, Z, e1, e2, x, y, z)
+    :Inputs:
+        *X*: :class:`np.ndarray`\ [:class:`float`], shape=(n,3)
+            *x*-coords of vertices of *n* tris
+        *Y*: :class:`np.ndarray`\ [:class:`float`], shape=(n,3)
+            *y*-coords of vertices of *n* tris
+        *Z*: :class:`np.ndarray`\ [:class:`float`], shape=(n,3)
+            *z*-coords of vertices of *n* tris
+        *e1*: :class:`np.ndarray`\ [:class:`float`], shape=(n,3)
+            Unit vector along first edge of each tri
+        *e2*: :class:`np.ndarray`\ [:class:`float`], shape=(n,3)
+            In-plane unit vector normal to *e1* for each tri
+        *x*: :class:`float` | :class:`np.ndarray`
+            *x*-coord of test point(s), shape=(n,)
+        *y*: :class:`float` | :class:`np.ndarray`
+            *y*-coord of test point(s), shape=(n,)
+        *z*: :class:`float` | :class:`np.ndarray`
+            *z*-coord of test point(s), shape=(n,)
+    :Outputs:
+        *DI*: :class:`np.ndarray`\ [:class:`float`]
+            Square of in-plane distance from each tri to test point
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0; split from GetNearestTri()
+    """
+    # Deltas from first vertex to test point(s)
+    dP = np.stack(np.broadcast_arrays(
+        x - X[:, 0], y - Y[:, 0], z - Z[:, 0]), axis=1)
+    # Deltas from first vertex to second and third vertices
+    dV = np.stack((
+        X[:, 1:] - X[:, :1],
+        Y[:, 1:] - Y[:, :1],
+        Z[:, 1:] - Z[:, :1]), axis=2)
+    # Convert the test point into coordinates aligned with first edge
+    xi = np.einsum("ij,ij->i", dP, e1)
+    yi = np.einsum("ij,ij->i", dP, e2)
+    # Initialize transformed triangles (first vertex at origin)
+    XI = np.zeros_like(X)
+    YI = np.zeros_like(X)
+    # Convert the second and third vertices (second is on *x*-axis)
+    XI[:, 1:] = np.einsum("ikj,ij->ik", dV, e1)
+    YI[:, 2] = np.einsum("ij,ij->i", dV[:, 1], e2)
+    # Get distance to each triangle within the plane of each triangle
+    return geom.dist2_tris_to_pt(XI, YI, xi, yi)
+
+
+# Convert optional input to typed contiguous array
+def _as_typed_array(x, dtype):
+    r"""Convert an optional input to a C-contiguous array
+
+    :Call:
+        >>> y = _as_typed_array(x, dtype)
+    :Inputs:
+        *x*: ``None`` | :class:`list` | :class:`np.ndarray`
+            Input array or array-like
+        *dtype*: :class:`str`
+            Data type for output, e.g. ``"float"`` or ``"int"``
+    :Outputs:
+        *y*: ``None`` | :class:`np.ndarray`
+            ``None`` if *x* is ``None``; *x* itself if already an
+            array with correct type and layout; else a typed copy
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Pass through missing inputs
+    if x is None:
+        return x
+    # Convert (no copy if not needed)
+    return np.ascontiguousarray(x, dtype=dtype)
+
+
+# Cumulative arc length of piecewise linear curve
+def _get_arc_length(Y):
+    r"""Get cumulative arc length at each point of a curve
+
+    :Call:
+        >>> cumY = _get_arc_length(Y)
+    :Inputs:
+        *Y*: :class:`np.ndarray` shape=(n,3)
+            List of points defining piecewise linear curve
+    :Outputs:
+        *cumY*: :class:`np.ndarray` shape=(n,)
+            Arc length from *Y[0]* to each point; ``cumY[0]`` is ``0``
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Length of each segment
+    L = np.sqrt(np.sum((Y[1:, :] - Y[:-1, :])**2, axis=1))
+    # Cumulative sum
+    return np.hstack(([0.0], np.cumsum(L)))
+
+
+# Viscous force on each tri
+def _viscous_force(VA, G, FTMUJ, nblock=2**16):
+    r"""Apply viscous stress tensor to area vector of each tri
+
+    The stress tensor is
+    ``FTMUJ*(G*VA' + VA*G' - 2/3*dot(VA,G)*I)``, so its product with
+    *VA* simplifies to ``FTMUJ*(|VA|^2*G + dot(VA,G)/3*VA)``.  If the
+    compiled extension provides :func:`_cape.TriViscousForce`, this is
+    evaluated in a single pass without temporary arrays.  Otherwise
+    tris are processed in blocks so that temporaries stay in cache.
+
+    :Call:
+        >>> F = _viscous_force(VA, G, FTMUJ, nblock=2**16)
+    :Inputs:
+        *VA*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 3)
+            Area vector of each tri
+        *G*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 3)
+            Velocity derivatives *UL*, *VL*, *WL* of each tri
+        *FTMUJ*: :class:`np.ndarray`\ [:class:`float`], shape=(n,)
+            Shear stress multiplier of each tri
+        *nblock*: {``2**16``} | :class:`int`
+            Maximum number of tris per block in NumPy fallback
+    :Outputs:
+        *F*: :class:`np.ndarray`\ [:class:`float`], shape=(n, 3)
+            Viscous force on each tri
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0; split from GetTriForces()
+    """
+    # Use fused compiled loop if available
+    if getattr(_cape, "TriViscousForce", None) is not None:
+        return _cape.TriViscousForce(VA, G, FTMUJ)
+    # Initialize output
+    F = np.empty((VA.shape[0], 3), dtype=np.result_type(VA, G, FTMUJ))
+    # Loop through blocks of tris
+    for k0 in range(0, VA.shape[0], nblock):
+        # Slice of tris in this block
+        K = slice(k0, k0 + nblock)
+        VK = VA[K]
+        GK = G[K]
+        FK = F[K]
+        # Squared area and stress flux of each tri
+        AA = np.einsum("ij,ij->i", VK, VK)
+        AG = np.einsum("ij,ij->i", VK, GK)
+        AG *= 1.0/3.0
+        # Stress tensor times area vector, accumulated in place
+        np.multiply(GK, AA[:, None], out=FK)
+        FK += VK * AG[:, None]
+        FK *= FTMUJ[K, None]
+    # Output
+    return F
+
+
+# Process keyword options for Triq force calculations
+def _get_force_opts(kw):
+    r"""Process options for force and skin friction calculations
+
+    All aliases and defaults are resolved in one place so that the
+    force routines only unpack the results.
+
+    :Call:
+        >>> opts = _get_force_opts(kw)
+    :Inputs:
+        *kw*: :class:`dict`
+            Keyword arguments to :func:`Triq.GetTriForces`
+    :Outputs:
+        *opts*: :class:`dict`
+            Options *incm*, *gauge*, *Re*, *mach*, *gamma*, *p*,
+            *Aref*, *Lref*, *bref*, *xMRP*, *yMRP*, *zMRP*,
+            *SMALLVOL*, *SMALLTRI*, and *qdtype* with defaults applied
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0; split from GetTriForces()
+    """
+    # Freestream ratio of specific heats
+    gam = kw.get("gamma", 1.4)
+    # Reference length
+    Lref = kw.get("RefLength", kw.get("Lref", 1.0))
+    # Moment reference point
+    MRP = kw.get("MRP", np.array([0.0, 0.0, 0.0]))
+    # Output
+    return {
+        "incm": kw.get("incm", kw.get("momentum", False)),
+        "gauge": kw.get("gauge", True),
+        "Re": kw.get("Re", kw.get("Rey", 1.0)),
+        "mach": kw.get("RefMach", kw.get("mach", kw.get("m", 1.0))),
+        "gamma": gam,
+        "p": kw.get("p", 1.0/gam),
+        "Aref": kw.get("RefArea", kw.get("Aref", 1.0)),
+        "Lref": Lref,
+        "bref": kw.get("RefSpan", kw.get("bref", Lref)),
+        "xMRP": kw.get("xMRP", MRP[0]),
+        "yMRP": kw.get("yMRP", MRP[1]),
+        "zMRP": kw.get("zMRP", MRP[2]),
+        "SMALLVOL": kw.get("SMALLVOL", 1e-20),
+        "SMALLTRI": kw.get("SMALLTRI", 1e-12),
+        "qdtype": kw.get("qdtype", "float"),
+    }
+
+
+# Sum tri values at each of their nodes
+def _scatter_to_nodes(T, W, nNode, nblock=2**20):
+    r"""Add values of each tri to each of its three nodes
+
+    Uses :func:`_cape.TriNodeSums` (a single pass that releases the
+    GIL) if the compiled extension provides it.  Otherwise tris are
+    processed in blocks, each accumulated with :func:`np.bincount`, so
+    temporary arrays stay bounded for very large triangulations.
+
+    :Call:
+        >>> V = _scatter_to_nodes(T, W, nNode, nblock=2**20)
+    :Inputs:
+        *T*: :class:`np.ndarray`\ [:class:`int`], shape=(n, 3)
+            0-based node indices of each tri
+        *W*: :class:`np.ndarray`\ [:class:`float`], shape=(n, m)
+            Values to add for each tri
+        *nNode*: :class:`int`
+            Number of nodes
+        *nblock*: {``2**20``} | :class:`int`
+            Maximum number of tris per block
+    :Outputs:
+        *V*: :class:`np.ndarray`\ [:class:`float`], shape=(m, nNode)
+            Sum of *W* from all tris that use each node
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Use compiled loop if available
+    if getattr(_cape, "TriNodeSums", None) is not None:
+        return _cape.TriNodeSums(T, W, nNode)
+    # Initialize sums
+    V = np.zeros((W.shape[1], nNode))
+    # Loop through blocks of tris
+    for k0 in range(0, T.shape[0], nblock):
+        # Node index of each corner of each tri in block
+        TI = T[k0:k0+nblock].ravel()
+        # Add each column (including repeated nodes)
+        for j, w in enumerate(W[k0:k0+nblock].T):
+            V[j] += np.bincount(TI, np.repeat(w, 3), minlength=nNode)
+    # Output
+    return V
+
+
+# Sort edges by start node then end node
+def _argsort_edges(E):
+    r"""Get indices that sort edges by start node, then end node
+
+    :Call:
+        >>> I = _argsort_edges(E)
+    :Inputs:
+        *E*: :class:`np.ndarray`\ [:class:`int`], shape=(n, 2+)
+            Nonnegative node indices of start and end of each edge
+    :Outputs:
+        *I*: :class:`np.ndarray`\ [:class:`int`], shape=(n,)
+            Stable sort order, same as ``np.lexsort((E[:,1], E[:,0]))``
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Pack start node in upper 32 bits and end node in lower 32 bits
+    key = E[:, 0].astype("uint64") << np.uint64(32)
+    key |= E[:, 1].astype("uint64")
+    # Single sort on composite key
+    return np.argsort(key, kind="stable")
+
+
+# Add buffers to a bounding box
+def _pad_bbox(bbox, **kw):
+    r"""Add buffers to a bounding box
+
+    :Call:
+        >>> xlim = _pad_bbox(bbox, **kw)
+    :Inputs:
+        *bbox*: :class:`np.ndarray`\ [:class:`float`], shape=(6,)
+            List of *xmin*, *xmax*, *ymin*, *ymax*, *zmin*, *zmax*
+        *pad*, *xpad*, *ypad*, *zpad*: {``0.0``} | :class:`float`
+            Buffer to add in all or one dimension(s)
+        *xp*, *xm*, *yp*, *ym*, *zp*, *zm*: :class:`float`
+            Buffer for the maximum or minimum of one coordinate
+    :Outputs:
+        *xlim*: :class:`np.ndarray`\ [:class:`float`], shape=(6,)
+            Padded bounding box
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0; split from GetCompBBox()
+    """
+    # Get the overall buffer.
+    pad = kw.get('pad', 0.0)
+    # Get the other buffers.
+    xpad = kw.get('xpad', pad)
+    ypad = kw.get('ypad', pad)
+    zpad = kw.get('zpad', pad)
+    # Get the directional buffers.
+    xp = kw.get('xp', xpad)
+    xm = kw.get('xm', xpad)
+    yp = kw.get('yp', ypad)
+    ym = kw.get('ym', ypad)
+    zp = kw.get('zp', zpad)
+    zm = kw.get('zm', zpad)
+    # Return the list.
+    return bbox + np.array([-xm, xp, -ym, yp, -zm, zp])
+
+
+# Sort component IDs for repeated lookups
+def _sort_compids(compID):
+    r"""Sort an array of component IDs for repeated lookups
+
+    :Call:
+        >>> order, compIDs = _sort_compids(compID)
+    :Inputs:
+        *compID*: :class:`np.ndarray`\ [:class:`int`]
+            Component ID of each tri (or quad)
+    :Outputs:
+        *order*: :class:`np.ndarray`\ [:class:`int`]
+            Stable sort order of *compID*
+        *compIDs*: :class:`np.ndarray`\ [:class:`int`]
+            Sorted component IDs, ``compID[order]``
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Sort
+    order = np.argsort(compID, kind="stable")
+    # Output
+    return order, compID[order]
+
+
+# Find indices of sorted component IDs
+def _find_sorted_compids(order, compIDs, comps):
+    r"""Find indices of elements in any of a list of components
+
+    :Call:
+        >>> K = _find_sorted_compids(order, compIDs, comps)
+    :Inputs:
+        *order*, *compIDs*: :class:`np.ndarray`\ [:class:`int`]
+            Outputs of :func:`_sort_compids`
+        *comps*: :class:`list`\ [:class:`int`]
+            List of component IDs to find
+    :Outputs:
+        *K*: :class:`np.ndarray`\ [:class:`int`]
+            Sorted indices of elements in any of *comps*
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Remove duplicates so slices do not overlap
+    comps = np.unique(comps)
+    # Start and end of each component in sorted list
+    ia = np.searchsorted(compIDs, comps, side="left")
+    ib = np.searchsorted(compIDs, comps, side="right")
+    # Check for trivial result
+    if len(ia) == 0:
+        return IZERO
+    # Combine indices from each component
+    return np.sort(np.hstack([order[a:b] for a, b in zip(ia, ib)]))
+
+
+# Map component IDs using sorted lookup table
+def _map_compids(comps, C1, CM):
+    r"""Map component IDs using sorted old and new numbers
+
+    :Call:
+        >>> mask, cmapd = _map_compids(comps, C1, CM)
+    :Inputs:
+        *comps*: :class:`np.ndarray`\ [:class:`int`]
+            Component IDs to map
+        *C1*: :class:`np.ndarray`\ [:class:`int`]
+            Sorted component IDs that have a mapping
+        *CM*: :class:`np.ndarray`\ [:class:`int`]
+            New component ID for each entry of *C1*
+    :Outputs:
+        *mask*: :class:`np.ndarray`\ [:class:`bool`]
+            Whether each entry of *comps* is in *C1*
+        *cmapd*: :class:`np.ndarray`\ [:class:`int`]
+            Mapped component IDs; unchanged where *mask* is ``False``
+    :Versions:
+        * 2026-10-17 ``@agent``: v1.0
+    """
+    # Location of each comp in sorted list
+    J = np.searchsorted(C1, comps)
+    # Check for matches
+    if C1.size == 0:
+        mask = np.zeros(J.size, dtype="bool")
+    else:
+        mask = C1[np.fmin(J, C1.size - 1)] == comps
+    # Apply mapping
+    cmapd = comps.copy()
+    cmapd[mask] = CM[J[mask]]
+    # Output
+    return mask, cmapd
+
+
 # Function to read a single triangulation file
 def ReadTriFile(fname, fmt=None):
     r"""Read a single triangulation file
@@ -217,6 +617,7 @@ class TriBase(object):
         * 2014-05-23 ``@ddalle``: v1.0
         * 2014-06-02 ``@ddalle``: v1.1: Add UH3D reading capability
         * 2015-11-19 ``@ddalle``: v2.0: Add XML reading and AFLR3 surfs
+        * 2026-10-17 ``@agent``: v2.1: ensure typed arrays
         """
         # Save file name
         self.fname = fname
@@ -242,6 +643,10 @@ class TriBase(object):
 
         else:
             # Process inputs.
+            # Ensure typed, contiguous arrays
+            Nodes = _as_typed_array(Nodes, "float")
+            Tris = _as_typed_array(Tris, "int")
+            Quads = _as_typed_array(Quads, "int")
             # Check counts.
             if nNode is None:
                 # Get dimensions if possible.
@@ -859,12 +1264,12 @@ class TriBase(object):
         Nodes = np.fromfile(f, dtype=float, count=nNode*5, sep=" ")
         # Reshape into a matrix.
         Nodes = Nodes.reshape((nNode, 5))
-        # Save nodes
-        self.Nodes = Nodes[:, :3]
+        # Save nodes (contiguous copy of first three columns)
+        self.Nodes = np.ascontiguousarray(Nodes[:, :3])
         # Save boundary layer spacings
-        self.blds = Nodes[:, 3]
+        self.blds = np.ascontiguousarray(Nodes[:, 3])
         # Save boundary layer thicknesses
-        self.bldel = Nodes[:, 4]
+        self.bldel = np.ascontiguousarray(Nodes[:, 4])
    # }
 
    # +++++++++++
@@ -925,7 +1330,7 @@ class TriBase(object):
         self.nTri = nTri
         # Exit if no tris
         if nTri == 0:
-            self.Tris = np.zeros((0, 3))
+            self.Tris = np.zeros((0, 3), dtype=int)
             self.CompID = np.zeros(0, dtype=int)
             self.BCs = np.zeros(0, dtype=int)
             return
@@ -934,11 +1339,11 @@ class TriBase(object):
         # Reshape into a matrix
         Tris = Tris.reshape((nTri, 6))
         # Save the triangles
-        self.Tris = Tris[:, :3]
+        self.Tris = np.ascontiguousarray(Tris[:, :3])
         # Save the component IDs.
-        self.CompID = Tris[:, 3]
+        self.CompID = np.ascontiguousarray(Tris[:, 3])
         # Save the boundary conditions.
-        self.BCs = Tris[:, 5]
+        self.BCs = np.ascontiguousarray(Tris[:, 5])
 
    # }
 
@@ -975,7 +1380,7 @@ class TriBase(object):
         self.nQuad = nQuad
         # Exit if no tris
         if nQuad == 0:
-            self.Quads = np.zeros((0, 3))
+            self.Quads = np.zeros((0, 4), dtype=int)
             self.CompIDQuad = np.zeros(0, dtype=int)
             self.BCsQuad = np.zeros(0, dtype=int)
             return
@@ -983,12 +1388,12 @@ class TriBase(object):
         Quads = np.fromfile(f, dtype=int, count=nQuad*7, sep=" ")
         # Reshape into a matrix
         Quads = Quads.reshape((nQuad, 7))
-        # Save the triangles
-        self.Quads = Quads[:, :4]
+        # Save the quads
+        self.Quads = np.ascontiguousarray(Quads[:, :4])
         # Save the component IDs.
-        self.CompIDQuad = Quads[:, 4]
+        self.CompIDQuad = np.ascontiguousarray(Quads[:, 4])
         # Save the boundary conditions.
-        self.BCsQuad = Quads[:, 6]
+        self.BCsQuad = np.ascontiguousarray(Quads[:, 6])
    # }
 
    # ++++++++
@@ -2686,9 +3091,12 @@ class TriBase(object):
             >>> triq.Write('bjet2.triq')
         :Versions:
             * 2015-09-14 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; convert single-precision *q*
         """
-        # Write the nodes.
-        _cape.WriteTriQ(self.Nodes, self.Tris, self.CompID, self.q)
+        # Write the nodes (states must be double-precision)
+        _cape.WriteTriQ(
+            self.Nodes, self.Tris, self.CompID,
+            _as_typed_array(self.q, "float"))
         # Check the file name.
         if fname != "Components.pyCart.tri":
             # Move the file.
@@ -3415,6 +3823,9 @@ class TriBase(object):
         # Default last index.
         if kc is None:
             kc = np.arange(tric.nTri)
+        # *CompID* is modified in place below
+        self.__dict__.pop("_compid_index", None)
+        self.__dict__.pop("_comp_geom", None)
         # Indices of tris to map.
         K1 = np.where(self.CompID == compID)[0]
         # Check for a single component to map (volume really is one CompID).
@@ -3426,13 +3837,15 @@ class TriBase(object):
         # Make copy of the target indices.
         K0 = kc.copy()
         # Extract target triangle vertices
-        x0 = tric.Nodes[tric.Tris[K0]-1, 0]
-        y0 = tric.Nodes[tric.Tris[K0]-1, 1]
-        z0 = tric.Nodes[tric.Tris[K0]-1, 2]
+        T0 = tric.GetTrisIndex()[K0]
+        x0 = tric.Nodes[T0, 0]
+        y0 = tric.Nodes[T0, 1]
+        z0 = tric.Nodes[T0, 2]
         # Current vertices
-        x1 = self.Nodes[self.Tris[K1]-1, 0]
-        y1 = self.Nodes[self.Tris[K1]-1, 1]
-        z1 = self.Nodes[self.Tris[K1]-1, 2]
+        T1 = self.GetTrisIndex()[K1]
+        x1 = self.Nodes[T1, 0]
+        y1 = self.Nodes[T1, 1]
+        z1 = self.Nodes[T1, 2]
         # Length scale
         tol = 1e-6 * np.sqrt(np.sum(
             (np.max(self.Nodes, 0)-np.min(self.Nodes, 0))**2))
@@ -3488,9 +3901,10 @@ class TriBase(object):
         y0 = np.mean(tric.Nodes[tric.Tris[K0]-1, 1], 1)
         z0 = np.mean(tric.Nodes[tric.Tris[K0]-1, 2], 1)
         # Calculate centroids of current tris.
-        x1 = np.mean(self.Nodes[self.Tris-1, 0], 1)
-        y1 = np.mean(self.Nodes[self.Tris-1, 1], 1)
-        z1 = np.mean(self.Nodes[self.Tris-1, 2], 1)
+        I1 = self.GetTrisIndex()
+        x1 = np.mean(self.Nodes[I1, 0], 1)
+        y1 = np.mean(self.Nodes[I1, 1], 1)
+        z1 = np.mean(self.Nodes[I1, 2], 1)
         # Loop through components.
         for i in K:
             # Find the closest centroid from *tric*.
@@ -3731,6 +4145,8 @@ class TriBase(object):
                 # Assign the new values
                 if len(I1) > 0:
                     self.CompID[I] = cID
+                    self.__dict__.pop("_compid_index", None)
+                    self.__dict__.pop("_comp_geom", None)
                 if len(J1) > 0:
                     self.CompIDQuad[J] = cID
                 # Save it in the Conf, too.
@@ -3927,11 +4343,17 @@ class TriBase(object):
         :Versions:
             * 2014-10-12 ``@ddalle``: v1.0
             * 2017-02-10 ``@ddalle``: v1.1; add fallback to *tri.Conf*
+            * 2026-10-17 ``@agent``: v1.2; skip exception w/o *config*
         """
+        # Get configuration, if any
+        config = getattr(self, "config", None)
+        # Go straight to *tri.Conf* if no config
+        if config is None:
+            return self.GetConfCompID(face)
         # Process input into a list of component IDs.
         try:
             # Best option is to use the Config.xml file
-            return self.config.GetCompID(face)
+            return config.GetCompID(face)
         except Exception:
             # Fall back to *tri.Conf* or just process raw numbers
             return self.GetConfCompID(face)
@@ -4079,13 +4501,13 @@ class TriBase(object):
                 self.Conf[comp] = faces[comp]
 
     # Function to get node indices from component ID(s)
-    def GetNodesFromCompID(self, compID=None):
+    def GetNodesFromCompID(self, compID=None, kTri=None):
         r"""Find node indices from face component ID(s)
 
         :Call:
             >>> i = tri.GetNodesFromCompID(comp)
             >>> i = tri.GetNodesFromCompID(comps)
-            >>> i = tri.GetNodesFromCompID(compID)
+            >>> i = tri.GetNodesFromCompID(compID, kTri=None)
         :Inputs:
             *tri*: :class:`cape.trifile.Tri`
                 Triangulation instance
@@ -4095,11 +4517,14 @@ class TriBase(object):
                 List of component IDs or names
             *compID*: :class:`int`
                 Component number
+            *kTri*: {``None``} | :class:`np.ndarray`\ [:class:`int`]
+                Precomputed ``tri.GetTrisFromCompID(compID)``
         :Outputs:
             *i*: :class:`numpy.array` (:class:`int`)
                 Node indices, 0-based
         :Versions:
             * 2014-09-27 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; add *kTri*
         """
         # Process inputs.
         if compID is None:
@@ -4109,14 +4534,15 @@ class TriBase(object):
             # Return all the tris.
             return np.arange(self.nNode)
         # Get matches from tris and quads
-        kTri  = self.GetTrisFromCompID(compID)
+        if kTri is None:
+            kTri = self.GetTrisFromCompID(compID)
         kQuad = self.GetQuadsFromCompID(compID)
         # Initialize with all false
         I = np.arange(self.nNode) < 0
         # Check for triangular matches
         if len(kTri) > 0:
             # Mark matches
-            I[self.Tris[kTri]-1] = True
+            I[self.GetTrisIndex()[kTri]] = True
         # Check for quadrangle matches
         if len(kQuad) > 0:
             # Mark matches
@@ -4124,6 +4550,40 @@ class TriBase(object):
         # Output
         return np.where(I)[0]
 
+    # Get tri indices sorted by component ID
+    def GetCompIDIndex(self):
+        r"""Get tri indices sorted by component ID
+
+        The result is cached and reused until *tri.CompID* is replaced
+        by a new array.  Functions that modify *tri.CompID* in place
+        should delete *tri._compid_index*.
+
+        :Call:
+            >>> order, compIDs = tri.GetCompIDIndex()
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+        :Outputs:
+            *order*: :class:`np.ndarray` (:class:`int`, shape=(nTri,))
+                Stable sort order of *tri.CompID*
+            *compIDs*: :class:`np.ndarray` (:class:`int`, shape=(nTri,))
+                Sorted component IDs, ``tri.CompID[order]``
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for existing index matching current *CompID*
+        try:
+            C, index = self._compid_index
+            if C is self.CompID:
+                return index
+        except AttributeError:
+            pass
+        # Sort component IDs once
+        index = _sort_compids(self.CompID)
+        self._compid_index = (self.CompID, index)
+        # Output
+        return index
+
     # Function to get tri indices from component ID(s)
     def GetTrisFromCompID(self, compID=None):
         r"""Find indices of triangles with specified component ID(s)
@@ -4146,6 +4606,7 @@ class TriBase(object):
                 List of triangle indices in requested component(s)
         :Versions:
             * 2015-01-23 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; fast path for single int
         """
         # Process inputs.
         if compID is None:
@@ -4154,8 +4615,14 @@ class TriBase(object):
         elif isinstance(compID, str) and (compID == 'entire'):
             # Return all the tris.
             return np.arange(self.nTri)
+        elif isinstance(compID, INT_TYPES):
+            # Single component number; no need to consult config
+            return _find_sorted_compids(*self.GetCompIDIndex(), [compID])
         # Get list of components
         comps = self.GetCompID(compID)
+        # Use sorted *CompID* for numeric components
+        if np.asarray(comps).dtype.kind in "iuf":
+            return _find_sorted_compids(*self.GetCompIDIndex(), comps)
         # Check for single match
         if len(comps) == 1:
             # Get a single component.
@@ -4226,21 +4693,17 @@ class TriBase(object):
                 List of face names (if available) or numbers
         :Versions:
             * 2019-05-14 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; count with ``np.unique()``
         """
         # Component numbers of *K* triangles
         CompID = self.CompID[K]
-        # Get list of component IDs
-        CompIDs = np.unique(CompID)
+        # Get list of component IDs and counts in one pass
+        CompIDs, counts = np.unique(CompID, return_counts=True)
         # Initialize faces
         faces = []
-        # Loop through found component IDs
-        for comp in CompIDs:
-            # Count number of triangles
-            ntri = np.where(CompID == comp)[0].size
-            # Skip if less than *nmin*
-            if ntri < nmin:
-                continue
-            # Otherwise get face name/number
+        # Loop through found component IDs with at least *nmin* entries
+        for comp in CompIDs[counts >= nmin]:
+            # Get face name/number
             face = self.GetCompName(comp)
             # Save it
             if face:
@@ -4270,21 +4733,17 @@ class TriBase(object):
                 List of face names (if available) or numbers
         :Versions:
             * 2019-05-14 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; count with ``np.unique()``
         """
         # Component numbers of *K* triangles
         CompID = self.CompIDQuad[K]
-        # Get list of component IDs
-        CompIDs = np.unique(CompID)
+        # Get list of component IDs and counts in one pass
+        CompIDs, counts = np.unique(CompID, return_counts=True)
         # Initialize faces
         faces = []
-        # Loop through found component IDs
-        for comp in CompIDs:
-            # Count number of triangles
-            ntri = np.where(CompID == comp)[0].size
-            # Skip if less than *nmin*
-            if ntri < nmin:
-                continue
-            # Otherwise get face name/number
+        # Loop through found component IDs with at least *nmin* entries
+        for comp in CompIDs[counts >= nmin]:
+            # Get face name/number
             face = self.GetCompName(comp)
             # Save it
             if face:
@@ -4460,7 +4919,7 @@ class TriBase(object):
                 "Removing %i small triangles (A<=%.2e)"
                 % (nsmall, smalltri))
         # Get the node indices of the small tris
-        I = self.Tris[K] - 1
+        I = self.GetTrisIndex()[K]
         # Get the coordinates of all nodes involved in small triangles
         X = self.Nodes[I, 0]
         Y = self.Nodes[I, 1]
@@ -4536,6 +4995,7 @@ class TriBase(object):
         # Delete area calculations, some of which will need updating
         delattr(self, "Areas")
         delattr(self, "Normals")
+        self.__dict__.pop("AreaVectors", None)
         # Final removal count
         if v:
             print("Removing %i triangles in total" % ndel)
@@ -4567,8 +5027,11 @@ class TriBase(object):
                 Triangulation with alternative component labels
             *compID*: {``None``} | :class:`int` | :class:`str` | :class:`list`
                 Only consider tris in this component(s)
+            *nthreads*: {``1``} | :class:`int`
+                Number of threads for nearest-tri search
         :Versions:
             * 2017-02-09 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; use :func:`GetNearestTriBatch`
         """
         # Check triangulation type
         tt = type(tri).__name__
@@ -4590,20 +5053,22 @@ class TriBase(object):
         cntol = kw.get("cntol", kw.get("CompProjTol", cntoldef))
         # Get scale of the entire triangulation
         L = tri.GetCompScale()
-        # Initialize scales of components
-        LC = {}
         # Put together absolute and relative tols
         tol  = atol   + rtol*L
         ntol = antol  + rntol*L
+        # Bet bounding box from *tri*
+        bbox = tri.GetCompBBox(pad=tol)
+        # Mask of triangles with at least one node in that *BBox*
+        mask = self.FilterTrisBBoxMask(bbox)
         # Filter the triangles that have a chance of intersecting
         if compID is None:
-            # Bet bounding box from *tri*
-            bbox = tri.GetCompBBox(pad=tol)
-            # Get triangles with at least one node in that *BBox*
-            K = self.FilterTrisBBox(bbox)
+            # Use all triangles near *tri*
+            K = np.where(mask)[0]
         else:
             # Get candidate triangles directly
             K = self.GetTrisFromCompID(compID)
+            # Only keep candidates near *tri*
+            K = K[mask[K]]
         # Verbose flag
         v = kw.get("v", False)
         # Ensure the centers are present
@@ -4612,39 +5077,46 @@ class TriBase(object):
         comps = np.unique(self.CompID)
         # Mapping *tri.CompID* to *self.CompID*
         compmap = {}
-        # Loop through columns
-        for i, k in enumerate(K):
-            # Get triangle number
-            k = K[i]
-            # Status update if verbose
-            if v and ((i+1) % (1000*v) == 0):
-                sys.stdout.write("  Mapping triangle %i/%i\r" % (i+1, len(K)))
-                sys.stdout.flush()
-            # Perform search
-            T = tri.GetNearestTri(self.Centers[k, :], n=1)
-            # Get components
-            c1 = T.get("c1")
-            # Make sure component scale is present
-            if c1 not in LC:
-                # Get the component scale
-                LC[c1] = tri.GetCompScale(c1)
-                # Check if the component is already used by *tri*
-                if c1 in comps:
-                    # Need to shift the component number
-                    c = c1 + max(comps)
-                else:
-                    # Already have the component
-                    c = c1
-                # Save the component map
-                compmap[c1] = c
-            # Get overall tolerances
-            toli  = tol + ctol*LC[c1]
-            ntoli = ntol + cntol*LC[c1]
+        # Status update if verbose
+        if v:
+            sys.stdout.write("  Mapping %i triangles\r" % len(K))
+            sys.stdout.flush()
+        # Perform search for all candidates at once
+        T = tri.GetNearestTriBatch(
+            self.Centers[K, :], nthreads=kw.get("nthreads", 1))
+        # Components of *tri* that were matched
+        C1 = np.unique(T["c1"][T["k1"] >= 0])
+        # Index of each match in *C1*
+        J1 = np.searchsorted(C1, T["c1"])
+        # Shift for components already used by *tri*
+        cshift = np.max(comps) if comps.size else 0
+        # Mapped component numbers
+        CM = np.where(np.isin(C1, comps), C1 + cshift, C1)
+        CM = CM.astype(self.CompID.dtype)
+        # Calculate bounding boxes of matched components in one pass
+        tri._CacheCompBBoxes(C1)
+        # Initialize scales of components
+        LC = np.zeros(C1.size)
+        # Loop through matched components
+        for j, c1 in enumerate(C1):
+            # Get the component scale
+            LC[j] = tri.GetCompScale(c1)
+            # Save the component map
+            compmap[c1] = CM[j]
+        # Check for any matches
+        if C1.size > 0:
+            # Index of matched component (valid if ``T["k1"] >= 0``)
+            J1 = np.fmin(J1, C1.size - 1)
+            # Get overall tolerances for each candidate
+            toli  = tol + ctol*LC[J1]
+            ntoli = ntol + cntol*LC[J1]
             # Filter results
-            if (T["t1"] > toli) or (T["z1"] > ntoli):
-                continue
-            # Save new component ID
-            self.CompID[k] = compmap[c1]
+            mask = (T["t1"] > toli) | (T["z1"] > ntoli)
+            mask = (T["k1"] >= 0) & ~mask
+            # Save new component IDs
+            self.CompID[K[mask]] = CM[J1[mask]]
+            self.__dict__.pop("_compid_index", None)
+            self.__dict__.pop("_comp_geom", None)
         # Clean up prompt
         if v:
             sys.stdout.write("%72s\r" % "")
@@ -4655,17 +5127,10 @@ class TriBase(object):
             for face in tri.config.faces:
                 # Get component ID(s); guarantee list
                 comps = np.array(tri.config.faces[face]).flatten()
-                # Get mapped component numbers
-                cmapd = []
-                # Loop through comps
-                for comp in comps:
-                    # Skip if not used
-                    if comp not in compmap:
-                        # Use the existing component number
-                        cmapd.append(comp)
-                    else:
-                        # Save the component from the new guy
-                        cmapd.append(compmap[comp])
+                # Map any component numbers used by the new guy
+                _, cmapd = _map_compids(comps, C1, CM)
+                # Convert to list
+                cmapd = cmapd.tolist()
                 # Check length
                 if len(cmapd) == 0:
                     # No matches
@@ -4698,14 +5163,9 @@ class TriBase(object):
             # Get component ID(s); guarantee list
             comps = np.array(Conf[face]).flatten()
             # Get mapped component numbers
-            cmapd = []
-            # Loop through comps
-            for comp in comps:
-                # Skip if not used
-                if comp not in compmap:
-                    continue
-                # Save the component
-                cmapd.append(compmap[comp])
+            mask, cmapd = _map_compids(comps, C1, CM)
+            # Only keep components that were used
+            cmapd = cmapd[mask].tolist()
             # Check length
             if len(cmapd) == 0:
                 # No matches
@@ -4752,6 +5212,7 @@ class TriBase(object):
                 Single joined triangulation if *join* is ``True``
         :Versions:
             * 2016-02-10 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; fix call to MapTriCompID()
         """
         # Initialize output
         tris = {}
@@ -4777,7 +5238,7 @@ class TriBase(object):
         trik = tric.GetSubTri(comps)
         # Perform mapping
         tri = self.Copy()
-        trifile.MapTriCompID(trik, **kw)
+        tri.MapTriCompID(trik, **kw)
         # Check for joined
         if kw.get("join", False):
             # Extract components
@@ -4805,6 +5266,33 @@ class TriBase(object):
   # AFLR3 Boundary Conditions
   # =========================
   # <
+    # Get nodes from tri and quad indices
+    def _GetNodesFromTrisQuads(self, kTri, kQuad):
+        r"""Find node indices used by specified tris and quads
+
+        :Call:
+            >>> i = tri._GetNodesFromTrisQuads(kTri, kQuad)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+            *kTri*: :class:`np.ndarray`\ [:class:`int`]
+                Tri indices, 0-based
+            *kQuad*: :class:`np.ndarray`\ [:class:`int`]
+                Quad indices, 0-based
+        :Outputs:
+            *i*: :class:`numpy.ndarray`\ [:class:`int`]
+                Node indices, 0-based
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Nodes of tris
+        I = self.Tris[kTri].flatten()
+        # Add nodes of quads
+        if len(kQuad) > 0:
+            I = np.hstack((I, self.Quads[kQuad].flatten()))
+        # Unique 0-based indices
+        return np.unique(I) - 1
+
     # Map boundary condition tags from config
     def MapBCs_ConfigAFLR3(self):
         r"""Map boundary conditions from ``"Config.json"`` file format
@@ -4816,6 +5304,7 @@ class TriBase(object):
                 Triangulation instance
         :Versions:
             * 2016-10-21 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; sort CompIDs once
         """
         # Check for configuration
         self.config
@@ -4834,12 +5323,17 @@ class TriBase(object):
         ntouch = np.ones(self.nNode, dtype=bool)
         ttouch = np.ones(self.nTri,  dtype=bool)
         qtouch = np.ones(self.nQuad, dtype=bool)
+        # Sort tri and quad component IDs once
+        itri = self.GetCompIDIndex()
+        iquad = _sort_compids(self.__dict__.get("CompIDQuad", IZERO))
         # Loop through BCs
         for comp in self.config.comps:
+            # Get component ID numbers
+            compIDs = self.GetCompID(comp)
             # Get the tris, quads, and nodes matching the component ID
-            IT = self.GetTrisFromCompID(comp)
-            IQ = self.GetQuadsFromCompID(comp)
-            IN = self.GetNodesFromCompID(comp)
+            IT = _find_sorted_compids(*itri, compIDs)
+            IQ = _find_sorted_compids(*iquad, compIDs)
+            IN = self._GetNodesFromTrisQuads(IT, IQ)
             # Get the boundary condition for this comp
             BC = self.config.GetProperty(comp, 'aflr3_bc')
             # Fallback
@@ -4882,12 +5376,12 @@ class TriBase(object):
             else:
                 # Status message for ignored component
                 print("  Component '%s' has no nodes" % comp)
+        # Get untouched triangles (one pass over mask)
+        K = np.flatnonzero(ttouch)
+        # Count
+        nK = K.size
         # Check for untouched triangles
-        if np.any(ttouch):
-            # Get said untouched triangles
-            K = np.where(ttouch)[0]
-            # Count
-            nK = K.size
+        if nK > 0:
             # Warning
             print(
                 ("  WARNING [MapBCs_ConfigAFLR3]: ") +
@@ -4898,12 +5392,12 @@ class TriBase(object):
             print("  Faces with at least 10 triangles:")
             for face in faces:
                 print("    %s" % face)
-        # Check for untouched triangles
-        if np.any(qtouch):
-            # Get said untouched triangles
-            K = np.where(qtouch)[0]
-            # Count
-            nK = K.size
+        # Get untouched quads (one pass over mask)
+        K = np.flatnonzero(qtouch)
+        # Count
+        nK = K.size
+        # Check for untouched quads
+        if nK > 0:
             # Warning
             print(
                 ("  WARNING [MapBCs_ConfigAFLR3]: ") +
@@ -4936,6 +5430,7 @@ class TriBase(object):
         :Versions:
             * 2015-11-19 ``@ddalle``: v1.0
             * 2016-04-05 ``@ddalle``: v1.1; add BL spacing and thickness
+            * 2026-10-17 ``@agent``: v1.2; sort CompIDs once
         """
         # Initialize the BCs to -1 (grow boundary layer)
         self.BCs = -1 * np.ones_like(self.CompID)
@@ -4950,23 +5445,36 @@ class TriBase(object):
         # Default keys
         if compID is None:
             compID = BCs.keys()
+        # Sort tri and quad component IDs once
+        itri = self.GetCompIDIndex()
+        iquad = _sort_compids(self.__dict__.get("CompIDQuad", IZERO))
+        # Tris and quads in each component
+        KT = {}
+        KQ = {}
         # Loop through BCs
         for comp in compID:
+            # Get component ID numbers
+            compIDs = self.GetCompID(comp)
             # Get the tris matching the component ID
-            I = self.GetTrisFromCompID(comp)
+            I = KT[comp] = _find_sorted_compids(*itri, compIDs)
             # Modify those BCs
             # Check node count
             if len(I) > 0:
                 self.BCs[I] = BCs[comp]
             # Get the quads from the matching component ID
-            I = self.GetQuadsFromCompID(comp)
+            I = KQ[comp] = _find_sorted_compids(*iquad, compIDs)
             # Modify those BCs.
             if len(I) > 0:
                 self.BCsQuad[I] = BCs[comp]
         # Loop through boundary layer spacings
         for comp in blds:
+            # Get tris and quads (reuse if possible)
+            if comp not in KT:
+                compIDs = self.GetCompID(comp)
+                KT[comp] = _find_sorted_compids(*itri, compIDs)
+                KQ[comp] = _find_sorted_compids(*iquad, compIDs)
             # Get the nodes
-            I = self.GetNodesFromCompID(comp)
+            I = self._GetNodesFromTrisQuads(KT[comp], KQ[comp])
             # Check node count
             if len(I) == 0:
                 print(
@@ -4983,8 +5491,13 @@ class TriBase(object):
             # Make sure not already processed
             if comp in blds:
                 continue
+            # Get tris and quads (reuse if possible)
+            if comp not in KT:
+                compIDs = self.GetCompID(comp)
+                KT[comp] = _find_sorted_compids(*itri, compIDs)
+                KQ[comp] = _find_sorted_compids(*iquad, compIDs)
             # Get the nodes
-            I = self.GetNodesFromCompID(comp)
+            I = self._GetNodesFromTrisQuads(KT[comp], KQ[comp])
             # Check node count
             if len(I) == 0:
                 print("Warning: No nodes mapped for component '%s'" % comp)
@@ -5061,6 +5574,37 @@ class TriBase(object):
    # Tris
    # ++++
    # {
+    # Get 0-based node indices of each triangle
+    def GetTrisIndex(self):
+        r"""Get 0-based node indices of each triangle
+
+        The result is cached and reused until *tri.Tris* is replaced by
+        a new array.  Functions that modify *tri.Tris* in place should
+        delete *tri._tris_idx*.
+
+        :Call:
+            >>> I = tri.GetTrisIndex()
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+        :Outputs:
+            *I*: :class:`np.ndarray` (:class:`int` shape=(nTri,3))
+                Node indices, ``tri.Tris - 1``
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for existing index matching current *Tris*
+        try:
+            if self._tris_src is self.Tris:
+                return self._tris_idx
+        except AttributeError:
+            pass
+        # Calculate 0-based indices once
+        self._tris_idx = np.ascontiguousarray(self.Tris, dtype=np.intp) - 1
+        self._tris_src = self.Tris
+        # Output
+        return self._tris_idx
+
     # Get coordinates of nodes for each triangle
     def GetTriNodes(self):
         r"""Get the nodal coordinates of each triangle
@@ -5088,10 +5632,12 @@ class TriBase(object):
             return
         except AttributeError:
             pass
-        # Calculate the center of each tri, one coordinate at a time
-        self.TriX = self.Nodes[self.Tris-1, 0]
-        self.TriY = self.Nodes[self.Tris-1, 1]
-        self.TriZ = self.Nodes[self.Tris-1, 2]
+        # Extract all vertices of each tri at once
+        V = self.Nodes[self.GetTrisIndex()]
+        # Save each coordinate
+        self.TriX = V[:, :, 0]
+        self.TriY = V[:, :, 1]
+        self.TriZ = V[:, :, 2]
 
     # Get centers of nodes
     def GetCenters(self):
@@ -5114,12 +5660,8 @@ class TriBase(object):
             return
         except AttributeError:
             pass
-        # Calculate the center of each tri, one coordinate at a time
-        x = np.mean(self.Nodes[self.Tris-1, 0], axis=1)
-        y = np.mean(self.Nodes[self.Tris-1, 1], axis=1)
-        z = np.mean(self.Nodes[self.Tris-1, 2], axis=1)
-        # Save the centers
-        self.Centers = stackcol((x, y, z))
+        # Calculate the center of each tri
+        self.Centers = np.mean(self.Nodes[self.GetTrisIndex()], axis=1)
 
     # Get normals and areas
     def GetNormals(self):
@@ -5138,6 +5680,7 @@ class TriBase(object):
         :Versions:
             * 2014-06-12 ``@ddalle``: v1.0
             * 2016-01-23 ``@ddalle``: v1.1; check before calculating
+            * 2026-10-17 ``@agent``: v1.2; use :func:`GetAreaVectors`
         """
         # Check for normals.
         try:
@@ -5145,25 +5688,57 @@ class TriBase(object):
             return
         except AttributeError:
             pass
-        # Extract the vertices of each trifile.
-        x = self.Nodes[self.Tris-1, 0]
-        y = self.Nodes[self.Tris-1, 1]
-        z = self.Nodes[self.Tris-1, 2]
-        # Get the deltas from node 0 to node 1 or node 2
-        x01 = stackcol((x[:, 1]-x[:, 0], y[:, 1]-y[:, 0], z[:, 1]-z[:, 0]))
-        x02 = stackcol((x[:, 2]-x[:, 0], y[:, 2]-y[:, 0], z[:, 2]-z[:, 0]))
-        # Calculate the dimensioned normals
-        n = np.cross(x01, x02)
-        # Calculate the area of each triangle.
-        A = np.fmax(1e-10, np.sqrt(np.sum(n**2, 1)))
-        # Normalize each component.
-        n[:, 0] /= A
-        n[:, 1] /= A
-        n[:, 2] /= A
+        # Get the dimensioned normals
+        self.GetAreaVectors()
+        n = self.AreaVectors
+        # Calculate twice the area of each triangle.
+        A = np.fmax(1e-10, np.sqrt(np.einsum("ij,ij->i", n, n)))
         # Save the areas.
         self.Areas = A/2
         # Save the unit normals.
-        self.Normals = n
+        self.Normals = n / A[:, None]
+
+    # Get normals, areas, centroids, and extents of each tri
+    def GetTriMetrics(self):
+        r"""Compute normals, areas, centers, and extents of all tris
+
+        The vertices of each tri are gathered once and used for all
+        quantities.  The centers and bounding boxes are cached until
+        *tri.Nodes* or *tri.Tris* is replaced or the triangulation is
+        moved.
+
+        :Call:
+            >>> tri.GetTriMetrics()
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+        :Effects:
+            *tri.AreaVectors*: :class:`ndarray`, shape=(tri.nTri,3)
+                Normal of each tri scaled by twice its area
+            *tri.Areas*: :class:`ndarray`, shape=(tri.nTri,)
+                Area of each triangle
+            *tri.Normals*: :class:`ndarray`, shape=(tri.nTri,3)
+                Unit normal for each triangle
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Extract the vertices of each triangle
+        V = self.Nodes[self.GetTrisIndex()]
+        # Calculate the dimensioned normals
+        self.AreaVectors = np.cross(V[:, 1] - V[:, 0], V[:, 2] - V[:, 0])
+        # Update areas and unit normals from those
+        self.__dict__.pop("Normals", None)
+        self.GetNormals()
+        # Center of each tri
+        C = np.mean(V, axis=1)
+        self._tri_centroid = (self.Tris, self.Nodes, C)
+        # Min and max coordinates of each tri
+        vmin = np.min(V, axis=1)
+        vmax = np.max(V, axis=1)
+        # Sort by minimum *x*
+        order = np.argsort(vmin[:, 0], kind="stable")
+        bboxes = (order, vmin[order], vmax[order])
+        self._tri_bbox = (self.Tris, self.Nodes, bboxes)
 
     # Get normals and areas
     def GetAreaVectors(self):
@@ -5189,13 +5764,11 @@ class TriBase(object):
             return
         except AttributeError:
             pass
-        # Extract the vertices of each trifile.
-        x = self.Nodes[self.Tris-1, 0]
-        y = self.Nodes[self.Tris-1, 1]
-        z = self.Nodes[self.Tris-1, 2]
+        # Extract the vertices of each triangle
+        V = self.Nodes[self.GetTrisIndex()]
         # Get the deltas from node 0 to node 1 or node 2
-        x01 = stackcol((x[:, 1]-x[:, 0], y[:, 1]-y[:, 0], z[:, 1]-z[:, 0]))
-        x02 = stackcol((x[:, 2]-x[:, 0], y[:, 2]-y[:, 0], z[:, 2]-z[:, 0]))
+        x01 = V[:, 1] - V[:, 0]
+        x02 = V[:, 2] - V[:, 0]
         # Calculate the dimensioned normals
         n = np.cross(x01, x02)
         # Save the unit normals.
@@ -5217,8 +5790,13 @@ class TriBase(object):
                 Unit vector completing right-handed coordinate system
             *trifile.e3*: :class:`np.ndarray` (:class:`float`, shape=(nTri,3))
                 Unit normal of each triangle
+            *trifile._basis*: :class:`np.ndarray` (shape=(nTri,3,3))
+                Contiguous stack of *e1*, *e2*, *e3* for each tri
+            *trifile._V0*: :class:`np.ndarray` (shape=(nTri,3))
+                Coordinates of first vertex of each tri
         :Versions:
             * 2017-02-09 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; pack basis in one array
         """
         # Check for all the requested attributes
         try:
@@ -5228,37 +5806,35 @@ class TriBase(object):
             return
         except AttributeError:
             pass
-        # Extract the vertices of each trifile.
-        X = self.Nodes[self.Tris-1, 0]
-        Y = self.Nodes[self.Tris-1, 1]
-        Z = self.Nodes[self.Tris-1, 2]
+        # Extract the vertices of each triangle
+        V = self.Nodes[self.GetTrisIndex()]
         # Get the deltas from node 0 to node 1 or node 2
-        X01 = stackcol((X[:, 1]-X[:, 0], Y[:, 1]-Y[:, 0], Z[:, 1]-Z[:, 0]))
-        X02 = stackcol((X[:, 2]-X[:, 0], Y[:, 2]-Y[:, 0], Z[:, 2]-Z[:, 0]))
+        X01 = V[:, 1] - V[:, 0]
+        X02 = V[:, 2] - V[:, 0]
         # Calculate the dimensioned normals
         n = np.cross(X01, X02)
         # Calculate the area of each triangle.
-        A = np.sqrt(np.sum(n**2, 1))
+        A = np.sqrt(np.einsum("ij,ij->i", n, n))
         # Calculate the length of each 0->1 segment
-        L = np.sqrt(np.sum(X01**2, 1))
+        L = np.sqrt(np.einsum("ij,ij->i", X01, X01))
         # Normalize each component
         mask = A > 1e-16
-        e3 = n.copy()
-        e3[mask, 0] /= A[mask]
-        e3[mask, 1] /= A[mask]
-        e3[mask, 2] /= A[mask]
+        e3 = n
+        e3[mask] /= A[mask, None]
         # Normalize 0->1 segment as tangent
         mask = L > 1e-16
-        e1 = X01.copy()
-        e1[mask, 0] /= L[mask]
-        e1[mask, 1] /= L[mask]
-        e1[mask, 2] /= L[mask]
+        e1 = X01
+        e1[mask] /= L[mask, None]
         # Get final axis to complete right-handed system
         e2 = np.cross(e3, e1)
-        # Save basis
-        self.e1 = e1
-        self.e2 = e2
-        self.e3 = e3
+        # Save basis as one array so each tri's basis is contiguous
+        self._basis = np.stack((e1, e2, e3), axis=1)
+        # Save individual axes as views
+        self.e1 = self._basis[:, 0]
+        self.e2 = self._basis[:, 1]
+        self.e3 = self._basis[:, 2]
+        # Save first vertex of each tri
+        self._V0 = V[:, 0].copy()
 
     # Get edge lengths
     def GetLengths(self):
@@ -5280,19 +5856,12 @@ class TriBase(object):
             return
         except AttributeError:
             pass
-        # Extract the vertices of each trifile.
-        x = self.Nodes[self.Tris-1, 0]
-        y = self.Nodes[self.Tris-1, 1]
-        z = self.Nodes[self.Tris-1, 2]
-        # Get the deltas from node 0->1, 1->2, 2->1
-        x01 = np.vstack((x[:, 1]-x[:, 0], y[:, 1]-y[:, 0], z[:, 1]-z[:, 0]))
-        x12 = np.vstack((x[:, 2]-x[:, 1], y[:, 2]-y[:, 1], z[:, 2]-z[:, 1]))
-        x20 = np.vstack((x[:, 0]-x[:, 2], y[:, 0]-y[:, 2], z[:, 0]-z[:, 2]))
+        # Extract the vertices of each triangle
+        V = self.Nodes[self.GetTrisIndex()]
+        # Get the deltas from node 0->1, 1->2, 2->0
+        dV = V[:, [1, 2, 0]] - V
         # Calculate lengths.
-        self.Lengths = stackcol((
-            np.sqrt(np.sum(x01**2, 0)),
-            np.sqrt(np.sum(x12**2, 0)),
-            np.sqrt(np.sum(x20**2, 0))))
+        self.Lengths = np.sqrt(np.sum(dV**2, axis=2))
 
     def GetNearestTri(self, x, n=4, **kw):
         r"""Get the triangle that is nearest to a point, and the distance
@@ -5340,6 +5909,7 @@ class TriBase(object):
             * 2017-02-07 ``@ddalle``: v1.1; search for 2nd comp
             * 2017-02-08 ``@ddalle``: v1.2; 3rd and 4th comp
             * 2024-06-08 ``@sfoxman``: accelerate with SplitZones
+            * 2026-10-17 ``@agent``: v1.4; KD-tree search if *n* > 1
         """
 
         if n == 1:
@@ -5348,6 +5918,43 @@ class TriBase(object):
                 self.GetTriNodes()
                 self._splitzones = SplitZones(self)
             split = self._splitzones.get_near(x)
+        elif cKDTree is not None:
+            # Build KD-tree of triangle centers once
+            if not hasattr(self, '_ctree'):
+                self.GetCenters()
+                self._ctree = cKDTree(self.Centers)
+                # Radius of each tri about its center
+                dV = self.Nodes[self.GetTrisIndex()] - self.Centers[:, None]
+                self._cradius = np.sqrt(np.max(np.sum(dV**2, axis=2), axis=1))
+            # Number of tris to search initially
+            ntri = self.Tris.shape[0]
+            kq = min(64, ntri)
+            # Expand search until *n* components are found
+            while True:
+                # Get tris with *kq* closest centers
+                dq, split = self._ctree.query(x, k=kq)
+                dq = np.atleast_1d(dq)
+                split = np.atleast_1d(split)
+                # Components of those tris
+                cq = self.CompID[split]
+                # Check if enough components (or all tris) are included
+                if kq >= ntri or np.unique(cq).size >= n:
+                    break
+                # Double the search size
+                kq = min(2*kq, ntri)
+            # Check for tris outside *kq* closest centers
+            if kq < ntri:
+                # Closest center in each component (*dq* is sorted)
+                _, iq = np.unique(cq, return_index=True)
+                # Upper bound on distance to *n*th component
+                dn = np.sort(dq[iq])[n - 1]
+                # Get all tris whose radius might reach within *dn*
+                split = np.array(self._ctree.query_ball_point(
+                    x, dn + np.max(self._cradius)), dtype="int")
+                # Distance to each center
+                dq = np.sqrt(np.sum((self.Centers[split] - x)**2, axis=1))
+                # Discard tris whose lower bound on distance exceeds *dn*
+                split = np.sort(split[dq - self._cradius[split] <= dn])
         else:
             # when searching for multiple components, we need to be able to search far,
             # so don't use a subset of triangles
@@ -5356,9 +5963,12 @@ class TriBase(object):
         # Get coordinates
         self.GetBasisVectors()
         # Extract coordinate basis function
-        e1 = self.e1[split, ...]
-        e2 = self.e2[split, ...]
-        e3 = self.e3[split, ...]
+        basis = self._basis[split]
+        e1 = basis[:, 0]
+        e2 = basis[:, 1]
+        # Get the projection distance
+        zj = np.abs(np.einsum(
+            'ij,ij->i', np.asarray(x) - self._V0[split], basis[:, 2]))
         # Extract the vertices of each trifile.
         self.GetTriNodes()
         X = self.TriX[split, ...]
@@ -5366,11 +5976,6 @@ class TriBase(object):
         Z = self.TriZ[split, ...]
         # Extract test point coordinates
         x, y, z = x
-        # Get the projection distance
-        zj = np.abs(
-            (x - X[:, 0])*e3[:, 0] +
-            (y - Y[:, 0])*e3[:, 1] +
-            (z - Z[:, 0])*e3[:, 2])
         # Get minimum projection distance
         kmin = np.nanargmin(zj)
         zmin = zj[kmin]
@@ -5412,27 +6017,9 @@ class TriBase(object):
         else:
             # Keep all points for J
             J = np.arange(K.size)
-        # These operations are tested to run as fast as possible
-        XI0, XI1, XI2 = XI.T
-        YI0, YI1, YI2 = YI.T
-        ZI0, ZI1, ZI2 = ZI.T
-        # Downselect the basis vectors
-        e10, e11, e12 = e1.T
-        e20, e21, e22 = e2.T
-        # Convert the test point into coordinates aligned with first edge
-        xi = (x-XI0)*e10 + (y-YI0)*e11 + (z-ZI0)*e12
-        yi = (x-XI0)*e20 + (y-YI0)*e21 + (z-ZI0)*e22
-        zi = zj[K]
-        # Initialize transformed triangles
-        XI = np.zeros_like(XI)
-        YI = np.zeros_like(XI)
-        # Convert the second and third vertices
-        # The commented line should be all zeros
-        XI[:, 1] = ((XI1-XI0)*e10 + (YI1-YI0)*e11 + (ZI1-ZI0)*e12)
-        XI[:, 2] = ((XI2-XI0)*e10 + (YI2-YI0)*e11 + (ZI2-ZI0)*e12)
-        YI[:, 2] = ((XI2-XI0)*e20 + (YI2-YI0)*e21 + (ZI2-ZI0)*e22)
         # Get distance to each triangle within the plane of each triangle
-        DI = geom.dist2_tris_to_pt(XI, YI, xi, yi)
+        DI = _dist2_tris_to_pt_inplane(XI, YI, ZI, e1, e2, x, y, z)
+        zi = zj[K]
         # Get total distance from point to each triangle
         D = zi*zi + DI**2
         # Get index of minimum distance
@@ -5449,32 +6036,41 @@ class TriBase(object):
             "t1": DI[i1],
             "z1": abs(zi[i1]),
         }
-        # Initialize submask
-        I1 = K != c1
-        C1 = self.CompID[split[I]][J]
-        # Loop through until we find up to *n* components
-        for nj in range(n-1):
+        # Check for additional components
+        if n < 2:
+            return T
+        # Component ID of each candidate
+        C1 = self.CompID[split[K]]
+        # Sort candidates by distance once (NaNs last)
+        order = np.argsort(D, kind="stable")
+        # Components already found
+        seen = {c1}
+        # Tag of next component to find
+        nj = 2
+        # Walk through candidates until we find up to *n* components
+        for j in order:
+            # Check for end of valid candidates
+            if np.isnan(D[j]):
+                break
+            # Skip if component already found
+            c = C1[j]
+            if c in seen:
+                continue
             # Tag
-            sj = str(nj + 2)
-            # Downselect available triangle indices
-            J = np.where(I1)[0]
-            # Check for no remaining triangles
-            if J.size == 0:
-                return T
-            # Find nearest match from remaining triangles
-            i = np.nanargmin(D[J])
-            j = J[i]
-            k_in_split = K[j]
-            k = split[k_in_split]
-            c = self.CompID[k]
+            sj = str(nj)
+            k = split[K[j]]
             # Save parameters
             T["k"+sj] = k
             T["c"+sj] = c
             T["d"+sj] = np.sqrt(D[j])
             T["z"+sj] = zi[j]
             T["t"+sj] = DI[j]
-            # Update mask
-            I1[C1 == c] = False
+            # Update list of components found
+            seen.add(c)
+            nj += 1
+            # Check if *n* components have been found
+            if nj > n:
+                break
         # Output (if 4 components)
         return T
     # Edit default tolerances
@@ -5483,6 +6079,185 @@ class TriBase(object):
     GetNearestTri.__doc__ = GetNearestTri.__doc__.replace(
         "_rztol_", str(rztoldef))
 
+    # Get nearest triangle to each of several points
+    def GetNearestTriBatch(self, X, **kw):
+        r"""Get the triangle that is nearest to each of several points
+
+        This is a vectorized version of :func:`GetNearestTri` for the
+        case *n* = 1. Points are grouped by the sub-region of the
+        triangulation in which they lie, and the distances from each
+        group of points to the candidate triangles of that sub-region
+        are calculated as 2D arrays.
+
+        :Call:
+            >>> T = tri.GetNearestTriBatch(X, **kw)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+            *X*: :class:`np.ndarray` (:class:`float`, shape=(m,3))
+                Array of *x*, *y*, and *z* coordinates of *m* test points
+            *ztol*: {_ztol_} | positive :class:`float`
+                Maximum extra projection distance
+            *rztol*: {_rztol_} | positive :class:`float`
+                Maximum relative projection distance
+            *nthreads*: {``1``} | :class:`int`
+                Number of threads used to process blocks of points
+        :Outputs:
+            *T*: :class:`dict`
+                Dictionary of match parameters
+            *T["k1"]*: :class:`np.ndarray` (:class:`int`, shape=(m,))
+                Index of triangle nearest to each test point
+            *T["c1"]*: :class:`np.ndarray` (:class:`int`, shape=(m,))
+                Component ID of each triangle *k1*
+            *T["d1"]*: :class:`np.ndarray` (:class:`float`, shape=(m,))
+                Distance from each triangle *k1* to test point
+            *T["z1"]*: :class:`np.ndarray` (:class:`float`, shape=(m,))
+                Projection distance of each point to triangle *k1*
+            *T["t1"]*: :class:`np.ndarray` (:class:`float`, shape=(m,))
+                Tangential distance of each point to triangle *k1*
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Ensure 2D array of test points
+        X = np.reshape(X, (-1, 3))
+        # Number of test points
+        npt = X.shape[0]
+        # Initialize outputs
+        k1 = np.zeros(npt, dtype="int")
+        d1 = np.zeros(npt)
+        t1 = np.zeros(npt)
+        z1 = np.zeros(npt)
+        # Pre-calculate sub-regions of triangles
+        if not hasattr(self, '_splitzones'):
+            self.GetTriNodes()
+            self._splitzones = SplitZones(self)
+        # Get coordinates
+        self.GetBasisVectors()
+        self.GetTriNodes()
+        # Process max tol
+        ztol = kw.get("ztol", ztoldef)
+        rztol = kw.get("rztol", rztoldef)
+        # Scale of vehicle
+        bbox = self.GetCompBBox()
+        # Use largest dimension of bbox
+        Lref = np.max(bbox[1::2] - bbox[::2])
+        # Relative tolerance
+        ztol = ztol + rztol*Lref
+        # Number of threads
+        nthreads = kw.get("nthreads", 1)
+        # Blocks of test points and candidate tris
+        blocks = []
+        # Get sub-region of each test point
+        zones, izone = np.unique(
+            self._splitzones.get_zones(X), axis=0, return_inverse=True)
+        izone = izone.flatten()
+        # Loop through sub-regions that contain at least one point
+        for j, zone in enumerate(zones):
+            # Test points in this zone
+            J = np.where(izone == j)[0]
+            # Candidate triangles
+            split = self._splitzones.zones[tuple(zone)]
+            # Number of candidates
+            nsplit = split.size
+            # Check for empty zone
+            if nsplit == 0:
+                k1[J] = -1
+                d1[J] = np.inf
+                t1[J] = np.inf
+                z1[J] = np.inf
+                continue
+            # Limit size of (points x candidates) arrays
+            nmax = max(1, 2**20 // nsplit)
+            # Divide test points into blocks
+            for i0 in range(0, J.size, nmax):
+                blocks.append((J[i0:i0 + nmax], split))
+        # Output arrays
+        T = (k1, d1, t1, z1)
+        # Process blocks; each writes to a distinct set of test points
+        if nthreads > 1 and len(blocks) > 1:
+            # NumPy releases the GIL for the array operations
+            with ThreadPoolExecutor(nthreads) as pool:
+                list(pool.map(
+                    lambda b: self._GetNearestTriBlock(X, b[0], b[1], ztol, T),
+                    blocks))
+        else:
+            for JI, split in blocks:
+                self._GetNearestTriBlock(X, JI, split, ztol, T)
+        # Find the component IDs
+        c1 = self.CompID[k1]
+        c1[k1 < 0] = 0
+        # Output
+        return {
+            "k1": k1,
+            "c1": c1,
+            "d1": d1,
+            "t1": t1,
+            "z1": z1,
+        }
+    # Edit default tolerances
+    GetNearestTriBatch.__doc__ = GetNearestTriBatch.__doc__.replace(
+        "_ztol_", str(ztoldef))
+    GetNearestTriBatch.__doc__ = GetNearestTriBatch.__doc__.replace(
+        "_rztol_", str(rztoldef))
+
+    # Get nearest triangle to one block of points
+    def _GetNearestTriBlock(self, X, JI, split, ztol, T):
+        r"""Find nearest tri for a block of points in one sub-region
+
+        :Call:
+            >>> tri._GetNearestTriBlock(X, JI, split, ztol, T)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+            *X*: :class:`np.ndarray` (:class:`float`, shape=(m,3))
+                Array of coordinates of all test points
+            *JI*: :class:`np.ndarray`\ [:class:`int`]
+                Indices of test points in this block
+            *split*: :class:`np.ndarray`\ [:class:`int`]
+                Indices of candidate tris
+            *ztol*: :class:`float`
+                Maximum extra projection distance
+            *T*: :class:`tuple`\ [:class:`np.ndarray`]
+                Output arrays *k1*, *d1*, *t1*, *z1*; modified in place
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Unpack outputs
+        k1, d1, t1, z1 = T
+        # Extract first vertex and normal of each candidate
+        V0 = self._V0[split]
+        e3 = self.e3[split]
+        # Deltas from first vertex of each candidate to each point
+        dX = X[JI, None, :] - V0[None, :, :]
+        # Get the projection distances
+        zj = np.abs(np.einsum('pmi,mi->pm', dX, e3))
+        # Get minimum projection distance for each point
+        zmin = np.nanmin(zj, axis=1)
+        # Candidates within *zmin* and *ztol*
+        I, K = np.where(zj <= zmin[:, None] + ztol)
+        # Triangle indices and test point of each pair
+        KI = split[K]
+        xi, yi, zi = X[JI[I]].T
+        # Get distance to each triangle within its plane
+        DIK = _dist2_tris_to_pt_inplane(
+            self.TriX[KI], self.TriY[KI], self.TriZ[KI],
+            self.e1[KI], self.e2[KI], xi, yi, zi)
+        # Projection distance of each pair
+        zi = zj[I, K]
+        # Total distance from each point to each candidate
+        D = np.full(zj.shape, np.inf)
+        DI = np.zeros(zj.shape)
+        D[I, K] = zi*zi + DIK**2
+        DI[I, K] = DIK
+        # Get index of minimum distance
+        i1 = np.argmin(D, axis=1)
+        ii = np.arange(JI.size)
+        # Save outputs
+        k1[JI] = split[i1]
+        d1[JI] = np.sqrt(D[ii, i1])
+        t1[JI] = DI[ii, i1]
+        z1[JI] = zj[ii, i1]
+
     # Get tris by bbox
     def FilterTrisBBox(self, bbox):
         r"""Get the list of Tris in a specified rectangular prism
@@ -5500,24 +6275,108 @@ class TriBase(object):
                 List of 1-based tri numbers that intersect BBox
         :Versions:
             * 2017-02-17 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; use :func:`FilterTrisBBoxMask`
+        """
+        # Output
+        return np.flatnonzero(self.FilterTrisBBoxMask(bbox))
+
+    # Get mask of tris by bbox
+    def FilterTrisBBoxMask(self, bbox):
+        r"""Get mask of Tris that intersect a specified rectangular prism
+
+        :Call:
+            >>> mask = tri.FilterTrisBBoxMask(bbox)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+            *bbox*: :class:`list` | :class:`np.ndarray`
+                List of minimum and maximum coordinates
+        :Outputs:
+            *mask*: :class:`np.ndarray` (:class:`bool`, shape=(nTri,))
+                Whether or not each tri intersects BBox
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0; split from FilterTrisBBox()
         """
-        # Compute vertices
-        x = self.Nodes[self.Tris-1, 0]
-        y = self.Nodes[self.Tris-1, 1]
-        z = self.Nodes[self.Tris-1, 2]
+        # Get bounding box of each tri, sorted by minimum *x*
+        order, vmin, vmax = self._GetTriBBoxes()
         # Unpack inputs
         xmin, xmax, ymin, ymax, zmin, zmax = bbox
+        # Only tris starting before *xmax* can intersect
+        n = np.searchsorted(vmin[:, 0], xmax, side="right")
+        # Check min and max coordinates of those tris at once
+        J = np.all(vmin[:n] <= [xmax, ymax, zmax], axis=1)
+        J &= np.all(vmax[:n] >= [xmin, ymin, zmin], axis=1)
         # Initialize array
-        K = (self.CompID > -1)
-        # Go through each coordinate
-        K = np.logical_and(K, np.min(x, axis=1) <= xmax)
-        K = np.logical_and(K, np.max(x, axis=1) >= xmin)
-        K = np.logical_and(K, np.min(y, axis=1) <= ymax)
-        K = np.logical_and(K, np.max(y, axis=1) >= ymin)
-        K = np.logical_and(K, np.min(z, axis=1) <= zmax)
-        K = np.logical_and(K, np.max(z, axis=1) >= zmin)
+        K = np.zeros(self.nTri, dtype="bool")
+        K[order[:n][J]] = True
+        # Skip negative component IDs
+        K &= (self.CompID > -1)
         # Output
-        return np.where(K)[0]
+        return K
+
+    # Get bounding box of each tri
+    def _GetTriBBoxes(self):
+        r"""Get bounding box of each tri, sorted by minimum *x*
+
+        The result is cached until *tri.Nodes* or *tri.Tris* is
+        replaced or the triangulation is moved.
+
+        :Call:
+            >>> order, vmin, vmax = tri._GetTriBBoxes()
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+        :Outputs:
+            *order*: :class:`np.ndarray` (:class:`int`, shape=(nTri,))
+                Tri indices sorted by minimum *x*-coordinate
+            *vmin*: :class:`np.ndarray` (:class:`float`, shape=(nTri,3))
+                Minimum coordinates of each tri, in order of *order*
+            *vmax*: :class:`np.ndarray` (:class:`float`, shape=(nTri,3))
+                Maximum coordinates of each tri, in order of *order*
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for existing boxes matching current *Nodes* and *Tris*
+        try:
+            T, N, bboxes = self._tri_bbox
+            if T is self.Tris and N is self.Nodes:
+                return bboxes
+        except AttributeError:
+            pass
+        # Compute all tri metrics in one pass
+        self.GetTriMetrics()
+        # Output
+        return self._tri_bbox[2]
+
+    # Get center of each tri
+    def _GetTriCentroids(self):
+        r"""Get the center of each tri
+
+        The result is cached until *tri.Nodes* or *tri.Tris* is
+        replaced or the triangulation is moved.
+
+        :Call:
+            >>> C = tri._GetTriCentroids()
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+        :Outputs:
+            *C*: :class:`np.ndarray` (:class:`float`, shape=(nTri,3))
+                Mean of the three vertices of each tri
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for existing centers matching current *Nodes* and *Tris*
+        try:
+            T, N, C = self._tri_centroid
+            if T is self.Tris and N is self.Nodes:
+                return C
+        except AttributeError:
+            pass
+        # Compute all tri metrics in one pass
+        self.GetTriMetrics()
+        # Output
+        return self._tri_centroid[2]
    # }
 
    # +++++
@@ -5538,23 +6397,26 @@ class TriBase(object):
                 Unit normal at each node averaged from neighboring triangles
         :Versions:
             * 2016-01-23 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; sum all tris at each node
         """
-        # Ensure normals are present
-        self.GetNormals()
+        # Dimensioned normals (twice the area-weighted unit normal)
+        self.GetAreaVectors()
+        AV = self.AreaVectors
         # Initialize node normals
         NN = np.zeros((self.nNode, 3))
-        # Get areas
-        TA = np.transpose([self.Areas, self.Areas, self.Areas])
-        # Add in the weighted tri areas for each column of nodes in the tris
-        NN[self.Tris[:, 0]-1, :] += (self.Normals*TA)
-        NN[self.Tris[:, 1]-1, :] += (self.Normals*TA)
-        NN[self.Tris[:, 2]-1, :] += (self.Normals*TA)
+        # Node index of each corner of each tri
+        I = self.GetTrisIndex()
+        # Sum weighted tri normals at each node (including repeats)
+        for j in range(3):
+            # Component *j* of each tri's weighted normal
+            wj = AV[:, j]
+            # Add contribution from each corner
+            for c in range(3):
+                NN[:, j] += np.bincount(I[:, c], wj, minlength=self.nNode)
         # Calculate the length of each of these vectors
-        L = np.fmax(1e-10, np.sqrt(np.sum(NN**2, 1)))
+        L = np.fmax(1e-10, np.sqrt(np.einsum("ij,ij->i", NN, NN)))
         # Normalize.
-        NN[:, 0] /= L
-        NN[:, 1] /= L
-        NN[:, 2] /= L
+        NN /= L[:, None]
         # Save it.
         self.NodeNormals = NN
    # }
@@ -5575,12 +6437,20 @@ class TriBase(object):
         :Effects:
             *trifile.Edges*: :class:`np.ndarray`, shape=(3*nTri, 2)
                 Array of node indices defining each edge
+            *trifile.NodeNbrPtr*: :class:`np.ndarray`, shape=(nNode+1,)
+                Start of each node's edges in *Edges*; node *i*
+                (1-based) has neighbors ``NodeNbrIdx[ia:ib]`` where
+                ``ia, ib = NodeNbrPtr[i-1:i+1]``
+            *trifile.NodeNbrIdx*: :class:`np.ndarray`, shape=(3*nTri,)
+                End node (1-based) of each edge, ``Edges[:, 1]``
         :Versions:
             * 2016-09-29 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; add *NodeNbrPtr*
         """
         # Check for edges
         try:
             self.Edges
+            self.NodeNbrPtr
             return
         except Exception:
             pass
@@ -5589,10 +6459,14 @@ class TriBase(object):
             self.Tris[:, [0, 1]],
             self.Tris[:, [1, 2]],
             self.Tris[:, [2, 0]]))
-        # Sort by end node then start node
-        I = np.lexsort((E[:, 1], E[:, 0]))
+        # Sort by start node then end node
+        I = _argsort_edges(E)
         # Save sorted edges
         self.Edges = E[I, :]
+        # Compressed list of neighbors of each node
+        self.NodeNbrPtr = np.searchsorted(
+            self.Edges[:, 0], np.arange(1, self.nNode + 2))
+        self.NodeNbrIdx = self.Edges[:, 1]
 
     # Get edges
     def GetEdgeTable(self):
@@ -5608,6 +6482,7 @@ class TriBase(object):
                 Array of node indices defining each edge
         :Versions:
             * 2019-06-20 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; sort on packed key
         """
         # Check for edges
         try:
@@ -5636,8 +6511,8 @@ class TriBase(object):
         E[i2:i3, 0] = T[:, 2]
         E[i2:i3, 1] = T[:, 0]
         E[i2:i3, 2] = E[i0:i1, 2]
-        # Sort by end node then start node
-        I = np.lexsort((E[:, 1], E[:, 0]))
+        # Sort by start node then end node
+        I = _argsort_edges(E)
         # Save sorted edges
         self.EdgeTable = E[I, :]
 
@@ -5736,28 +6611,25 @@ class TriBase(object):
                 Area of the component
         :Versions:
             * 2014-06-13 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; projection w/o copy
         """
-        # Check for areas.
-        try:
-            self.Areas
-        except AttributeError:
-            self.GetNormals()
         # Find the indices of tris in the component.
         k = self.GetTrisFromCompID(compID)
         # Check for direction projection.
         if n is None:
+            # Check for areas.
+            try:
+                self.Areas
+            except AttributeError:
+                self.GetNormals()
             # No projection
             return np.sum(self.Areas[k])
-        # Extract the normals and copy to new matrix.
-        N = self.Normals[k].copy()
-        # Dot those normals with the requested vector.
-        N[:, 0] *= n[0]
-        N[:, 1] *= n[1]
-        N[:, 2] *= n[2]
-        # Sum to get the dot product.
-        d = np.sum(N, 1)
-        # Multiply this dot product by the area of each tri
-        return np.sum(self.Areas[k] * d)
+        # Check for dimensioned normals
+        self.GetAreaVectors()
+        # Sum of area vectors (twice the area) dotted with *n*
+        return 0.5 * np.dot(
+            np.sum(self.AreaVectors[k], axis=0),
+            np.asarray(n, dtype="float"))
 
     # Get normals and areas
     def GetCompAreaVector(self, compID, n=None):
@@ -5805,6 +6677,7 @@ class TriBase(object):
                 Area-averaged unit normal
         :Versions:
             * 2014-06-13 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; use :func:`GetTrisFromCompID`
         """
         # Check for areas.
         try:
@@ -5812,18 +6685,11 @@ class TriBase(object):
         except AttributeError:
             self.GetNormals()
         # Find the indices of tris in the component.
-        i = self.CompID == compID
-        # Extract those normals and areas.
-        N = self.Normals[i].copy()
-        A = self.Areas[i].copy()
-        # Weight the normals.
-        N[:, 0] *= A
-        N[:, 1] *= A
-        N[:, 2] *= A
-        # Compute the mean.
-        n = np.mean(N, 0)
+        k = self.GetTrisFromCompID(compID)
+        # Sum the area-weighted normals
+        n = np.sum(self.Normals[k] * self.Areas[k, None], axis=0)
         # Unitize.
-        return n / np.sqrt(np.sum(n**2))
+        return n / np.sqrt(np.dot(n, n))
 
     # Get centroid of component
     def GetCompCentroid(self, compID):
@@ -5846,6 +6712,7 @@ class TriBase(object):
                 Coordinate of the centroid
         :Versions:
             * 2016-03-29 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; gather vertices once
         """
         # Check for areas.
         try:
@@ -5857,35 +6724,14 @@ class TriBase(object):
         # Check for no triangles
         if k.size == 0:
             raise ValueError("Found no tris for comp '%s'" % compID)
-        # Get corresponding nodes
-        i = self.Tris[k, :] - 1
         # Get areas of those components
         A = self.Areas[k]
         # Total area
         AT = np.sum(A)
-        # Dimensions
-        nd = self.Nodes.shape[1]
-        # Get coordinates
-        if nd == 2:
-            # 2D coordinates
-            x = np.mean(self.Nodes[i, 0], axis=1)
-            y = np.mean(self.Nodes[i, 1], axis=1)
-            # Weighting
-            xc = np.sum(x*A) / AT
-            yc = np.sum(y*A) / AT
-            # Output
-            return np.array([xc, yc])
-        else:
-            # 3D coordinates
-            x = np.mean(self.Nodes[i, 0], axis=1)
-            y = np.mean(self.Nodes[i, 1], axis=1)
-            z = np.mean(self.Nodes[i, 2], axis=1)
-            # Weighted averages
-            xc = np.sum(x*A) / AT
-            yc = np.sum(y*A) / AT
-            zc = np.sum(z*A) / AT
-            # Output
-            return np.array([xc, yc, zc])
+        # Center of each tri (2D or 3D)
+        C = self._GetTriCentroids()[k]
+        # Area-weighted average
+        return np.dot(A, C) / AT
 
     # Function to add a bounding box based on a component and buffer
     def GetCompBBox(self, compID=None, **kwargs):
@@ -5929,20 +6775,79 @@ class TriBase(object):
             * 2014-06-16 ``@ddalle``: v1.0
             * 2014-08-03 ``@ddalle``: v1.1; "buff" --> "pad"
             * 2017-02-08 ``@ddalle``: v1.2; CompID=None behavior
+            * 2026-10-17 ``@agent``: v1.3; pad cached BBox; list keys
         """
-        if len(kwargs) > 0:
-            # don't cache if kwargs provided
-            return self.GetCompBBox_uncached(compID, **kwargs)
-
         if not hasattr(self, '_bbox_cache'):
             self._bbox_cache = {}
-        cached_val = self._bbox_cache.get(compID)
-        if cached_val is None:
-            calculated_val = self.GetCompBBox_uncached(compID)
-            self._bbox_cache[compID] = calculated_val
-            return calculated_val
+        # Cache key (lists are not hashable)
+        if isinstance(compID, (list, np.ndarray)):
+            key = tuple(np.asarray(compID).flatten().tolist())
+        else:
+            key = compID
+        # Get unpadded BBox, from cache if possible
+        bbox = self._bbox_cache.get(key)
+        if bbox is None:
+            bbox = self.GetCompBBox_uncached(compID)
+            self._bbox_cache[key] = bbox
+        # Apply padding if requested
+        if len(kwargs) > 0 and bbox is not None:
+            return _pad_bbox(bbox, **kwargs)
         else:
-            return cached_val
+            return bbox
+
+    # Calculate bounding boxes of several components at once
+    def _CacheCompBBoxes(self, compIDs=None):
+        r"""Calculate and cache bounding boxes of several components
+
+        This uses one pass over all tris grouped by *CompID* instead of
+        a separate search for each component.
+
+        :Call:
+            >>> tri._CacheCompBBoxes(compIDs=None)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+            *compIDs*: {``None``} | :class:`np.ndarray`\ [:class:`int`]
+                Component ID numbers; default is all used by *tri*
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Initialize cache
+        if not hasattr(self, '_bbox_cache'):
+            self._bbox_cache = {}
+        # Check for null triangulation
+        if self.nTri == 0:
+            return
+        # Default components
+        if compIDs is None:
+            compIDs = np.unique(self.CompID)
+        # Only calculate components not already cached
+        compIDs = [
+            comp for comp in compIDs
+            if self._bbox_cache.get(comp) is None]
+        # Check for trivial case
+        if len(compIDs) == 0:
+            return
+        # Sort tris by component
+        order, C = self.GetCompIDIndex()
+        # Start of each component in sorted list
+        ia = np.flatnonzero(np.diff(C, prepend=C[0] - 1))
+        # Vertices of each tri
+        V = self.Nodes[self.GetTrisIndex()[order]]
+        # Extrema of each component
+        xmin = np.minimum.reduceat(np.min(V, axis=1), ia)
+        xmax = np.maximum.reduceat(np.max(V, axis=1), ia)
+        # Save requested components that are present
+        for comp in compIDs:
+            # Find component in list
+            j = np.searchsorted(C[ia], comp)
+            if j >= ia.size or C[ia[j]] != comp:
+                continue
+            # Save bounding box
+            self._bbox_cache[comp] = np.array([
+                xmin[j, 0], xmax[j, 0],
+                xmin[j, 1], xmax[j, 1],
+                xmin[j, 2], xmax[j, 2]])
 
     def GetCompBBox_uncached(self, compID=None, **kwargs):
         # List of components; initialize with first.
@@ -5950,32 +6855,15 @@ class TriBase(object):
         # Check for null component
         if i is None or len(i) == 0:
             return
-        # Get the overall buffer.
-        pad = kwargs.get('pad', 0.0)
-        # Get the other buffers.
-        xpad = kwargs.get('xpad', pad)
-        ypad = kwargs.get('ypad', pad)
-        zpad = kwargs.get('zpad', pad)
-        # Get the directional buffers.
-        xp = kwargs.get('xp', xpad)
-        xm = kwargs.get('xm', xpad)
-        yp = kwargs.get('yp', ypad)
-        ym = kwargs.get('ym', ypad)
-        zp = kwargs.get('zp', zpad)
-        zm = kwargs.get('zm', zpad)
-        # Get the coordinates of each vertex of included tris.
-        x = self.Nodes[self.Tris[i, :]-1, 0]
-        y = self.Nodes[self.Tris[i, :]-1, 1]
-        z = self.Nodes[self.Tris[i, :]-1, 2]
-        # Get the extrema
-        xmin = np.min(x) - xm
-        xmax = np.max(x) + xp
-        ymin = np.min(y) - ym
-        ymax = np.max(y) + yp
-        zmin = np.min(z) - zm
-        zmax = np.max(z) + zp
-        # Return the list.
-        return np.array([xmin, xmax, ymin, ymax, zmin, zmax])
+        # Get the nodes used by included tris
+        V = self.Nodes[np.unique(self.Tris[i, :]) - 1]
+        # Get the extrema of all coordinates at once
+        vmin = np.min(V, axis=0)
+        vmax = np.max(V, axis=0)
+        bbox = np.array([
+            vmin[0], vmax[0], vmin[1], vmax[1], vmin[2], vmax[2]])
+        # Apply buffers
+        return _pad_bbox(bbox, **kwargs)
 
     # Get length of diagonal of BBox
     def GetCompScale(self, compID=None, **kw):
@@ -6116,7 +7004,7 @@ class TriBase(object):
         # Get the triangles in *compID*
         K = self.GetTrisFromCompID(compID)
         # Unpack the triangles using zero-based indexing
-        T = self.Tris[K] - 1
+        T = self.GetTrisIndex()[K]
         # Get the edges of the triangles
         xt1 = e1p[T[:, 1]] - e1p[T[:, 0]]
         xt2 = e1p[T[:, 2]] - e1p[T[:, 1]]
@@ -6211,17 +7099,32 @@ class TriBase(object):
                 Value of the distance
         :Versions:
             * 2016-09-29 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; use KD-tree if available
         """
+        # Use KD-tree of nodes if available
+        if cKDTree is not None:
+            # Build KD-tree once for current *Nodes*
+            try:
+                N, tree = self._node_kdtree
+                if N is not self.Nodes:
+                    raise AttributeError
+            except AttributeError:
+                tree = cKDTree(self.Nodes)
+                self._node_kdtree = (self.Nodes, tree)
+            # Find closest node
+            L, i = tree.query(x, k=1)
+            # Output
+            return int(i) + 1, float(L)
         # Get deltas in each axis
         dx = self.Nodes[:, 0] - x[0]
         dy = self.Nodes[:, 1] - x[1]
         dz = self.Nodes[:, 2] - x[2]
-        # Get distances
-        L = np.sqrt(dx*dx + dy*dy + dz*dz)
+        # Get squared distances
+        L2 = dx*dx + dy*dy + dz*dz
         # Find minimum
-        i = np.argmin(L)
+        i = np.argmin(L2)
         # Output
-        return i + 1, L[i]
+        return i + 1, np.sqrt(L2[i])
 
     # Trace a curve
     def TraceCurve(self, Y, **kw):
@@ -6243,9 +7146,12 @@ class TriBase(object):
                 Sequential list of nodes that trace a curve
         :Versions:
             * 2016-09-29 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; precompute arc length
         """
         # Spatial tolerance
         dtol = kw.get('dtol', 0.05)
+        # Cumulative arc length of curve, used for each step
+        kw["cumY"] = _get_arc_length(Y)
         # Find the node closest to the start of the curve
         icur, d0 = self.GetClosestNode(Y[0])
         # Characteristic length of the curve
@@ -6295,6 +7201,8 @@ class TriBase(object):
                 Maximum distance from curve as fraction of reference length
             *atol*: {``60.0``} | :class:`float`
                 Maximum dot product between triangle edge and curve segment
+            *cumY*: {``None``} | :class:`np.ndarray` shape=(n,)
+                Precomputed cumulative arc length at each point of *Y*
         :Outputs:
             *inew*: :class:`int`
                 Index (1-based) of next node along curve
@@ -6302,13 +7210,16 @@ class TriBase(object):
                 Number of curve segments to discount from next search
         :Versions:
             * 2016-09-29 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; vectorize neighbor distances
         """
         # Direction tolerance
         atol = np.cos(kw.get('atol', 60.0) * np.pi/180)
         # Distance tolerance
         dtol = kw.get('dtol', 0.05)
-        # Get the indices of neighboring nodes (leave zero-based)
-        I = self.Edges[self.Edges[:, 0] == icur, 1]
+        # Ensure list of neighbors
+        self.GetEdges()
+        # Get the indices of neighboring nodes (1-based)
+        I = self.NodeNbrIdx[self.NodeNbrPtr[icur-1]:self.NodeNbrPtr[icur]]
         # Get coordinates of neighboring nodes
         X = self.Nodes[I-1, :]
         # Current node
@@ -6321,42 +7232,45 @@ class TriBase(object):
         # Check for last node
         if jcur >= nY:
             return None, None
+        # Cumulative arc length of curve
+        cumY = kw.get("cumY")
+        if cumY is None:
+            cumY = _get_arc_length(Y)
         # Get vector of the first available segment of the curve
         dy0 = Y[jcur+1, :] - Y[jcur, :]
         Ly0 = np.sqrt(dy0[0]**2 + dy0[1]**2 + dy0[2]**2)
+        # Vectors from *x* to each neighbor
+        dX = X - x
+        Lx = np.sqrt(dX[:, 0]**2 + dX[:, 1]**2 + dX[:, 2]**2)
+        # Check if we are going in the right direction
+        mask = ~(np.sum(dX*dy0, axis=1) / (Lx*Ly0) < atol)
+        I = I[mask]
+        X = X[mask]
+        Lx = Lx[mask]
+        # Get distance from each *xi* to the remaining curve points
+        DI, DS, JI = self._TraceCurve_GetDistances(
+            Y[jcur:, :], X, cumY[jcur:])
+        # Normalized distance from curve to each point
+        DI /= Lx
+        # Distance from *x* to *Y[jcur+1]* (same for each point)
+        dy1 = np.sqrt(np.sum((Y[jcur+1]-x)**2))
+        # Distance from *Y[jcur+ji]* to each point
+        DY = np.sqrt(np.sum((X - Y[jcur+JI])**2, axis=1))
+        # Add distance from *x* to each point or through curve
+        DS = np.where(JI == 0, DS + Lx, (DS + dy1) + DY)
         # Loop through nodes
         for i in range(len(X)):
-            # Get new point
-            xi = X[i]
-            # Vector from *x* to current point
-            dxi = xi - x
-            Lxi = np.sqrt(dxi[0]**2 + dxi[1]**2 + dxi[2]**2)
-            # Check if we are going in the right direction
-            if np.sum(dxi*dy0) / (Lxi*Ly0) < atol:
-                # Do not check
-                continue
-            # Get distance from *xi* to the remaining curve points
-            di, dsi, ji = self.TraceCurve_GetDistance(Y[jcur:, :], xi)
-            # Length of edge (from *tri*)
-            Li = np.sqrt(np.sum((xi-x)**2))
-            # Normalized distance from curve to point
-            di /= Li
+            # Get normalized distance
+            di = DI[i]
+            dsi = DS[i]
             # Compare distance to tolerance
             if di > dtol:
                 # Not close enough
                 continue
-            elif ji == 0:
-                # Distance from *x* to *xi*
-                dsi += np.sqrt(np.sum((xi-x)**2))
-            else:
-                # Distance from *x* to *Y[jcur]*
-                dsi += np.sqrt(np.sum((Y[jcur+1]-x)**2))
-                # Distance from *Y[jcur+ji]* to *xi*
-                dsi += np.sqrt(np.sum((xi-Y[jcur+ji])**2))
             # Check distance
             if (dsi < ds) and (di < 1.5*d or di < 1e-5):
                 # Update
-                jnew = jcur + ji
+                jnew = jcur + JI[i]
                 inew = I[i]
                 # Save distances
                 ds = dsi
@@ -6386,6 +7300,8 @@ class TriBase(object):
                 Maximum distance from curve as fraction of reference length
             *atol*: {``60.0``} | :class:`float`
                 Maximum dot product between triangle edge and curve segment
+            *cumY*: {``None``} | :class:`np.ndarray` shape=(n,)
+                Precomputed cumulative arc length at each point of *Y*
         :Outputs:
             *d*: :class:`float`
                 Minimum distance from curve to *x*
@@ -6395,6 +7311,7 @@ class TriBase(object):
                 Index of segment in which closest point is located
         :Versions:
             * 2016-09-29 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; add *cumY*
         """
         # Get distance from point to curve and length of each curve segment
         D = geom.DistancePointToCurve(x, Y)
@@ -6405,18 +7322,58 @@ class TriBase(object):
         if j == 0:
             # No segments cut
             return d, 0.0, j
-        elif j == 1:
-            # One segment cut; no total segments cut
-            ds = 0.0
-        else:
-            # Intervals
-            dX = Y[2:j+1, :] - Y[1:j, :]
-            # Lengths
-            ds = np.sum(np.sqrt(np.sum(dX**2, axis=1)))
+        # Cumulative arc length of curve
+        cumY = kw.get("cumY")
+        if cumY is None:
+            cumY = _get_arc_length(Y)
+        # Arc length from *Y[1]* to *Y[j]*
+        ds = cumY[j] - cumY[1]
         # Add the distance from *Y[j]* to *x*
         ds += np.sqrt(np.sum((Y[j]-x)**2))
         # Output
         return d, ds, j
+
+    # Get distance from curve and arc length for several points
+    def _TraceCurve_GetDistances(self, Y, X, cumY=None):
+        r"""Find distances between a generic curve and several points
+
+        :Call:
+            >>> D, DS, J = tri._TraceCurve_GetDistances(Y, X, cumY=None)
+        :Inputs:
+            *tri*: :class:`cape.trifile.TriBase`
+                Triangulation instance
+            *Y*: :class:`np.ndarray` shape=(n,3)
+                List of points defining piecewise linear curve
+            *X*: :class:`np.ndarray` shape=(m,3)
+                Test points
+            *cumY*: {``None``} | :class:`np.ndarray` shape=(n,)
+                Precomputed cumulative arc length at each point of *Y*
+        :Outputs:
+            *D*: :class:`np.ndarray` shape=(m,)
+                Minimum distance from curve to each point
+            *DS*: :class:`np.ndarray` shape=(m,)
+                Arc length of curve segments before each closest point
+            *J*: :class:`np.ndarray` shape=(m,)
+                Index of segment in which each closest point is located
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Get distance from each point to each curve segment
+        D = geom.DistancePointsToCurve(X, Y)
+        # Find minimum for each point
+        J = np.argmin(D, axis=1)
+        D = D[np.arange(J.size), J]
+        # Cumulative arc length of curve
+        if cumY is None:
+            cumY = _get_arc_length(Y)
+        # Arc length from *Y[1]* to *Y[j]*
+        S = cumY[np.fmax(J, 1)] - cumY[1]
+        # Add distance from *Y[j]* to each point
+        DS = S + np.sqrt(np.sum((Y[J] - X)**2, axis=1))
+        # No segments cut if *j* is 0
+        DS[J == 0] = 0.0
+        # Output
+        return D, DS, J
   # >
 
   # ========
@@ -6603,7 +7560,30 @@ class TriBase(object):
             * 2014-05-23 ``@ddalle``: v1.0
             * 2014-10-08 ``@ddalle``: v1.1
             * 2016-04-08 ``@ddalle``: v1.2; rewrite inputs
-        """
+            * 2026-10-17 ``@agent``: v1.3; fast path for common inputs
+        """
+        # Number of positional inputs
+        na = len(a)
+        # Fast path if no coordinate keywords
+        if all(k == "compID" for k in kw):
+            # Check for common input patterns
+            if na == 3 or na == 4:
+                # Translate(dx, dy, dz [, compID])
+                dx, dy, dz = a[:3]
+                compID = kw.get("compID", a[3] if na == 4 else None)
+                # Apply translation
+                self._apply_translate(dx, dy, dz, compID)
+                return
+            elif na == 1 or na == 2:
+                # Translate(dR [, compID])
+                dR = a[0]
+                # Check for a 3-vector
+                if isinstance(dR, (list, tuple, np.ndarray)) and len(dR) == 3:
+                    dx, dy, dz = dR
+                    compID = kw.get("compID", a[1] if na == 2 else None)
+                    # Apply translation
+                    self._apply_translate(dx, dy, dz, compID)
+                    return
         # Get component ID
         compID = kw.get('compID')
         # Check regular arguments
@@ -6639,7 +7619,7 @@ class TriBase(object):
             # Bad input count
             raise ValueError("Must use exactly 0 to 4 non-keyword inputs")
         # Check length and type of displacements
-        if type(dR).__name__ not in ['list', 'ndarray']:
+        if not isinstance(dR, (list, tuple, np.ndarray)):
             # Not a vector
             raise TypeError("Single input must be a vector")
         elif len(dR) != 3:
@@ -6651,14 +7631,63 @@ class TriBase(object):
         dz = kw.get('dz', dR[2])
         # Process components
         compID = kw.get('compID', compID)
-        # Process the node indices to be rotated.
-        i = self.GetNodesFromCompID(compID)
-        # Extract the points.
-        X = self.Nodes[i, :]
-        # Apply the translation.
-        Y = geom.TranslatePoints(X, [dx, dy, dz])
-        # Save the translated points.
-        self.Nodes[i, :] = Y
+        # Apply translation
+        self._apply_translate(dx, dy, dz, compID)
+
+    # Get nodes to move
+    def _GetNodeSelection(self, compID=None):
+        r"""Get index of nodes in one or more components
+
+        :Call:
+            >>> i = tri._GetNodeSelection(compID=None)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance
+            *compID*: {``None``} | :class:`int` | :class:`str` | :class:`list`
+                Component ID(s)
+        :Outputs:
+            *i*: :class:`slice` | :class:`np.ndarray`\ [:class:`int`]
+                ``slice(None)`` for all nodes, else 0-based node indices
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Check for entire triangulation
+        if compID is None:
+            # Select all nodes w/o an index array
+            return slice(None)
+        # Node indices
+        return self.GetNodesFromCompID(compID)
+
+    # Translate nodes w/o processing inputs
+    def _apply_translate(self, dx, dy, dz, compID=None):
+        r"""Translate the nodes of a triangulation object
+
+        :Call:
+            >>> tri._apply_translate(dx, dy, dz, compID=None)
+        :Inputs:
+            *tri*: :class:`cape.trifile.Tri`
+                Triangulation instance to be translated
+            *dx*: :class:`float`
+                *x*-coordinate offset
+            *dy*: :class:`float`
+                *y*-coordinate offset
+            *dz*: :class:`float`
+                *z*-coordinate offset
+            *compID*: {``None``} | :class:`int` | :class:`str` | :class:`list`
+                Component ID(s) to which to apply translation
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0; split from Translate()
+        """
+        # Process the node indices to be translated
+        i = self._GetNodeSelection(compID)
+        # Apply the translation in place
+        self.Nodes[i] += np.array([dx, dy, dz], dtype="float")
+        # Clear cached bounding boxes, centers, and node search tree
+        self.__dict__.pop("_tri_bbox", None)
+        self.__dict__.pop("_tri_centroid", None)
+        self.__dict__.pop("_bbox_cache", None)
+        self.__dict__.pop("_node_kdtree", None)
+        self.__dict__.pop("_comp_geom", None)
 
     # Function to rotate a triangulation about an arbitrary vector
     def Rotate(self, v1, v2, theta, compID=None):
@@ -6680,15 +7709,21 @@ class TriBase(object):
         :Versions:
             * 2014-05-27 ``@ddalle``: v1.0
             * 2014-10-07 ``@ddalle``: v1.1
+            * 2026-10-17 ``@agent``: v1.2; use rotation matrix
         """
         # Get the node indices.
-        i = self.GetNodesFromCompID(compID)
-        # Extract the points.
-        X = self.Nodes[i, :]
-        # Apply the rotation.
-        Y = geom.RotatePoints(X, v1, v2, theta)
-        # Save the rotated points.
-        self.Nodes[i, :] = Y
+        i = self._GetNodeSelection(compID)
+        # Rotation matrix and origin
+        R = geom.RotationMatrix(v1, v2, theta)
+        x0 = np.asarray(v1, dtype="float")
+        # Shift origin, rotate, and shift back
+        self.Nodes[i] = np.dot(self.Nodes[i] - x0, R.T) + x0
+        # Clear cached bounding boxes, centers, and node search tree
+        self.__dict__.pop("_tri_bbox", None)
+        self.__dict__.pop("_tri_centroid", None)
+        self.__dict__.pop("_bbox_cache", None)
+        self.__dict__.pop("_node_kdtree", None)
+        self.__dict__.pop("_comp_geom", None)
   # >
 
 
@@ -6762,6 +7797,7 @@ class Tri(TriBase):
             * 2014-05-23 ``@ddalle``: v1.0
             * 2014-06-02 ``@ddalle``: v1.1; add UH3D reading capability
             * 2016-04-05 ``@ddalle``: v1.2; add AFLR3, clean up inputs
+            * 2026-10-17 ``@agent``: v1.3; ensure typed arrays
         """
         # Initialize slots
         self.fname = None
@@ -6816,10 +7852,10 @@ class Tri(TriBase):
             Nodes = kw.get('Nodes', np.zeros((0, 3)))
             Tris  = kw.get('Tris',  np.zeros((0, 3), dtype=int))
             Quads = kw.get('Quads', np.zeros((0, 4), dtype=int))
-            # Ensure arrays
-            Nodes = np.array(Nodes)
-            Tris  = np.array(Tris)
-            Quads = np.array(Quads)
+            # Ensure typed arrays (no copy if already correct)
+            Nodes = _as_typed_array(Nodes, "float")
+            Tris  = _as_typed_array(Tris, "int")
+            Quads = _as_typed_array(Quads, "int")
             # Number of nodes
             nNode = kw.get('nNode', Nodes.shape[0])
             nTri  = kw.get('nTri',  Tris.shape[0])
@@ -6831,8 +7867,10 @@ class Tri(TriBase):
             self.BCs = kw.get('BCs')
             self.BCsQuad = kw.get('BCsQuad')
             # BL growth parameters
-            self.blds  = kw.get('blds',  np.zeros(nNode))
-            self.bldel = kw.get('bldel', np.zeros(nNode))
+            self.blds = _as_typed_array(
+                kw.get('blds', np.zeros(nNode)), "float")
+            self.bldel = _as_typed_array(
+                kw.get('bldel', np.zeros(nNode)), "float")
             # Save the nodes
             self.nNode = nNode
             self.Nodes = Nodes
@@ -6906,6 +7944,10 @@ class Triq(TriBase):
             Number of state variables at each node
         *q*: :class:`np.ndarray` (:class:`float`), (*nNode*, *nq*)
             State vector at each node
+        *qdtype*: {``None``} | ``"float32"`` | ``"float"``
+            Storage type for *q*, e.g. ``"float32"`` to halve memory;
+            force and skin friction calculations still use
+            :class:`float64` accumulators
     :Data members:
         *triq.nNode*: :class:`int`
             Number of nodes in triangulation
@@ -6931,12 +7973,14 @@ class Triq(TriBase):
     # Initialization method
     def __init__(
             self, fname=None, n=1, nNode=None, Nodes=None, c=None,
-            nTri=None, Tris=None, CompID=None, nq=None, q=None):
+            nTri=None, Tris=None, CompID=None, nq=None, q=None,
+            qdtype=None):
         r"""Initialization method
 
         :Versions:
             * 2014-05-23 ``@ddalle``: v1.0
             * 2014-06-02 ``@ddalle``: v1.1; add UH3D reading capability
+            * 2026-10-17 ``@agent``: v1.2; ensure typed arrays
         """
         # Save file name
         self.fname = fname
@@ -6944,8 +7988,15 @@ class Triq(TriBase):
         if fname is not None:
             # Read from file.
             self.Read(fname, n=n)
+            # Convert state storage if requested
+            if qdtype is not None:
+                self.q = _as_typed_array(self.q, qdtype)
         else:
             # Process inputs.
+            # Ensure typed, contiguous arrays
+            Nodes = _as_typed_array(Nodes, "float")
+            Tris = _as_typed_array(Tris, "int")
+            q = _as_typed_array(q, "float" if qdtype is None else qdtype)
             # Check counts.
             if nNode is None:
                 # Get dimensions if possible.
@@ -7040,6 +8091,7 @@ class Triq(TriBase):
                 Second triangulation instance
         :Versions:
             * 2015-09-14 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; update *q* in place
         """
         # Check consistency.
         if self.nNode != triq.nNode:
@@ -7048,14 +8100,18 @@ class Triq(TriBase):
             raise ValueError("Triangulations must have same number of tris.")
         elif self.n > 0 and self.nq != triq.nq:
             raise ValueError("Triangulations must have same number of states.")
-        # Degenerate casecntl.
+        # Degenerate case
         if self.n == 0:
-            # Use the second input.
-            self.q = triq.q
+            # Use (a copy of) the second input.
+            self.q = triq.q.copy()
             self.n = triq.n
             self.nq = triq.nq
-        # Weighted average
-        self.q = (self.n*self.q + triq.n*triq.q) / (self.n+triq.n)
+            return
+        # Weight of second triangulation
+        w2 = triq.n / (self.n + triq.n)
+        # Weighted average, in place
+        self.q *= (1.0 - w2)
+        self.q += w2 * triq.q
         # Update count.
         self.n += triq.n
   # >
@@ -7152,6 +8208,72 @@ class Triq(TriBase):
   # Force/Moment
   # ============
   # <
+    # Get tri geometry for a component
+    def _GetCompTriGeometry(self, comp=None, cache=True):
+        r"""Get indices, vertices, area vectors, and centers of *comp* tris
+
+        The most recent result is cached and reused until *triq.Nodes*,
+        *triq.Tris*, or *triq.CompID* is replaced or the triangulation
+        is moved.
+
+        :Call:
+            >>> K, T, XT, N, A, XC = triq._GetCompTriGeometry(comp)
+        :Inputs:
+            *triq*: :class:`cape.trifile.Triq`
+                Annotated surface triangulation
+            *comp*: {``None``} | :class:`str` | :class:`int`
+                Subset component ID or name or list thereof
+            *cache*: {``True``} | ``False``
+                Whether to use and update the cached geometry; use
+                ``False`` when calling from several threads
+        :Outputs:
+            *K*: :class:`np.ndarray` (:class:`int`, shape=(n,))
+                Indices of tris in *comp*
+            *T*: :class:`np.ndarray` (:class:`int`, shape=(n,3))
+                0-based node indices of each tri
+            *XT*: :class:`np.ndarray` (:class:`float`, shape=(n,3,3))
+                Coordinates of the vertices of each tri
+            *N*: :class:`np.ndarray` (:class:`float`, shape=(n,3))
+                Normal of each tri scaled by its area
+            *A*: :class:`np.ndarray` (:class:`float`, shape=(n,))
+                Area of each tri
+            *XC*: :class:`np.ndarray` (:class:`float`, shape=(n,3))
+                Center (mean of vertices) of each tri
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0; split from GetTriForces()
+        """
+        # Hashable version of *comp*
+        if comp is None or isinstance(comp, (str,) + INT_TYPES):
+            key = comp
+        else:
+            key = tuple(np.ravel(comp).tolist())
+        # Check for existing geometry matching *Nodes*, *Tris*, *CompID*
+        if cache:
+            Tris, Nodes, CompID, kcomp, G = self.__dict__.get(
+                "_comp_geom", (None, None, None, None, None))
+            if (
+                    Tris is self.Tris and Nodes is self.Nodes and
+                    CompID is self.CompID and kcomp == key):
+                return G
+        # Component for subsetting
+        K = self.GetTrisFromCompID(comp)
+        # Store node indices for each tri (0-based)
+        T = self.GetTrisIndex()[K]
+        # Extract the vertices of each tri (one gather)
+        XT = self.Nodes[T]
+        # Calculate the dimensioned normals
+        N = 0.5*np.cross(XT[:, 1] - XT[:, 0], XT[:, 2] - XT[:, 0])
+        # Scalar areas of each triangle
+        A = np.sqrt(np.einsum("ij,ij->i", N, N))
+        # Centers of each tri
+        XC = np.mean(XT, axis=1)
+        # Save
+        G = (K, T, XT, N, A, XC)
+        if cache:
+            self._comp_geom = (self.Tris, self.Nodes, self.CompID, key, G)
+        # Output
+        return G
+
     # Calculate forces and moments
     def GetSkinFriction(self, comp=None, **kw):
         r"""Get components of skin friction coeffs
@@ -7189,6 +8311,9 @@ class Triq(TriBase):
                 Reynolds number per grid unit
             *gam*, *gamma*: {``1.4``} | :class:`float` > 1
                 Freestream ratio of specific heats
+            *qdtype*: {``"float"``} | ``None`` | ``"float32"``
+                Type for tri-averaged states; ``None`` to use type of
+                *triq.q*, e.g. to keep single-precision temporaries
         :Utilized Attributes:
             *triq.nNode*: :class:`int`
                 Number of nodes
@@ -7205,143 +8330,82 @@ class Triq(TriBase):
                 *z*-component of skin friction coefficient
         :Versions:
             * 2017-04-03 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; sum all tris at each node
         """
-        # Select nodes
-        I = self.GetNodesFromCompID(comp)
-        # Component for subsetting
-        K = self.GetTrisFromCompID(comp)
-        # Number of nodes and tris
-        nNode = I.shape[0]
-        nTri = K.shape[0]
        # --------------
        # Viscous Forces
        # --------------
-        if self.nq == 9:
-            # Viscous stresses given directly
-            cf_x = self.q[I, 6]
-            cf_y = self.q[I, 7]
-            cf_z = self.q[I, 8]
-            # Output
-            return cf_x, cf_y, cf_z
-        elif self.nq < 13:
-            # TRIQ file only contains inadequate info for viscous forces
-            cf_x = np.zeros(nNode)
-            cf_y = np.zeros(nNode)
-            cf_z = np.zeros(nNode)
+        if self.nq < 13:
+            # Select nodes
+            I = self.GetNodesFromCompID(comp)
+            # Check for direct viscous stresses
+            if self.nq == 9:
+                # Viscous stresses given directly
+                cf_x = np.asarray(self.q[I, 6], dtype="float")
+                cf_y = np.asarray(self.q[I, 7], dtype="float")
+                cf_z = np.asarray(self.q[I, 8], dtype="float")
+            else:
+                # TRIQ file only contains inadequate info for viscous forces
+                nNode = I.shape[0]
+                cf_x = np.zeros(nNode)
+                cf_y = np.zeros(nNode)
+                cf_z = np.zeros(nNode)
             # Output
             return cf_x, cf_y, cf_z
+        # Tri indices, vertices, and area vectors for *comp*
+        K, T, XT, N, A, _ = self._GetCompTriGeometry(comp)
+        # Select nodes
+        I = self.GetNodesFromCompID(comp, kTri=K)
+        # Number of tris
+        nTri = K.shape[0]
        # ------
        # Inputs
        # ------
-        # Get Reynolds number per grid unit
-        REY = kw.get("Re", kw.get("Rey", 1.0))
-        # Freestream mach number
-        mach = kw.get("RefMach", kw.get("mach", kw.get("m", 1.0)))
-        # Volume limiter
-        SMALLVOL = kw.get("SMALLVOL", 1e-20)
-        SMALLTRI = kw.get("SMALLTRI", 1e-12)
+        # Process options
+        opts = _get_force_opts(kw)
+        # Reynolds number per grid unit and freestream Mach number
+        REY = opts["Re"]
+        mach = opts["mach"]
+        # Volume and area limiters
+        SMALLVOL = opts["SMALLVOL"]
+        SMALLTRI = opts["SMALLTRI"]
+        # Precision of averaged states
+        qdtype = opts["qdtype"]
        # --------
        # Geometry
        # --------
-        # Store node indices for each tri
-        T = self.Tris[K, :] - 1
-        v0 = T[:, 0]
-        v1 = T[:, 1]
-        v2 = T[:, 2]
-        # Handle to state variables
-        Q = self.q
-        # Extract the vertices of each trifile.
-        x = self.Nodes[T, 0]
-        y = self.Nodes[T, 1]
-        z = self.Nodes[T, 2]
-        # Get the deltas from node 0->1 and 0->2
-        x01 = stackcol((x[:, 1]-x[:, 0], y[:, 1]-y[:, 0], z[:, 1]-z[:, 0]))
-        x02 = stackcol((x[:, 2]-x[:, 0], y[:, 2]-y[:, 0], z[:, 2]-z[:, 0]))
-        # Calculate the dimensioned normals
-        N = 0.5*np.cross(x01, x02)
-        # Scalar areas of each triangle
-        A = np.sqrt(np.sum(N**2, axis=1))
-       # -----
-       # Areas
-       # -----
+        # Gather only viscous states (*mu*, *UL*, *VL*, *WL*, *DX*, *DY*,
+        # *DZ*) at the vertices of each tri, in one pass
+        QT = self.q[T, 6:13]
+       # --------------
+       # Viscous Stress
+       # --------------
         # Overset grid information
         # Inverted Reynolds number [in]
         REI = mach / REY
-        # Extract coordinates
-        X1 = self.Nodes[v0, 0]
-        Y1 = self.Nodes[v0, 1]
-        Z1 = self.Nodes[v0, 2]
-        X2 = self.Nodes[v1, 0]
-        Y2 = self.Nodes[v1, 1]
-        Z2 = self.Nodes[v1, 2]
-        X3 = self.Nodes[v2, 0]
-        Y3 = self.Nodes[v2, 1]
-        Z3 = self.Nodes[v2, 2]
         # Calculate coordinates of L=2 points
-        xlp1 = X1 + Q[v0, 10]
-        ylp1 = Y1 + Q[v0, 11]
-        zlp1 = Z1 + Q[v0, 12]
-        xlp2 = X2 + Q[v1, 10]
-        ylp2 = Y2 + Q[v1, 11]
-        zlp2 = Z2 + Q[v1, 12]
-        xlp3 = X3 + Q[v2, 10]
-        ylp3 = Y3 + Q[v2, 11]
-        zlp3 = Z3 + Q[v2, 12]
+        XL = XT + QT[:, :, 4:7]
         # Calculate volume of prisms
-        VOL = volcomp.VolTriPrism(
-            X1, Y1, Z1, X2, Y2, Z2, X3, Y3, Z3,
-            xlp1, ylp1, zlp1, xlp2, ylp2, zlp2, xlp3, ylp3, zlp3)
-        # Filter small prisms
-        IV = VOL > SMALLVOL
-        # Filter small areas
-        IV = np.logical_and(IV, A > SMALLTRI)
-        # Downselect areas
-        VAX = N[IV, 0]
-        VAY = N[IV, 1]
-        VAZ = N[IV, 2]
-        # Average dynamic viscosity
-        mu = np.mean(Q[T[IV, :], 6], axis=1)
-        # Velocity derivatives
-        UL = np.mean(Q[T[IV, :], 7], axis=1)
-        VL = np.mean(Q[T[IV, :], 8], axis=1)
-        WL = np.mean(Q[T[IV, :], 9], axis=1)
-        # Sheer stress multiplier
-        FTMUJ = mu*REI/VOL[IV]
-        # Stress flux
-        ZUVW = (1.0/3.0) * (VAX*UL + VAY*VL + VAZ*WL)
-        # Stress tensor
-        TXX = 2.0*FTMUJ * (UL*VAX - ZUVW)
-        TYY = 2.0*FTMUJ * (VL*VAY - ZUVW)
-        TZZ = 2.0*FTMUJ * (WL*VAZ - ZUVW)
-        TXY = FTMUJ * (VL*VAX + UL*VAY)
-        TYZ = FTMUJ * (WL*VAY + VL*VAZ)
-        TXZ = FTMUJ * (UL*VAZ + WL*VAX)
-        # Initialize viscous forces
-        Fv = np.zeros((nTri, 3))
-        # Save results from non-zero volumes
-        Fv[IV, 0] = (TXX*VAX + TXY*VAY + TXZ*VAZ)/A[IV]
-        Fv[IV, 1] = (TXY*VAX + TYY*VAY + TYZ*VAZ)/A[IV]
-        Fv[IV, 2] = (TXZ*VAX + TYZ*VAY + TZZ*VAZ)/A[IV]
-        # Initialize friction coefficients
-        cf_x = np.zeros(self.nNode)
-        cf_y = np.zeros(self.nNode)
-        cf_z = np.zeros(self.nNode)
-        # Initialize areas
-        Af = np.zeros(self.nNode)
-        # Add friction values weighted by areas
-        cf_x[T[:, 0]] += (Fv[:, 0] * A)
-        cf_x[T[:, 1]] += (Fv[:, 0] * A)
-        cf_x[T[:, 2]] += (Fv[:, 0] * A)
-        cf_y[T[:, 0]] += (Fv[:, 1] * A)
-        cf_y[T[:, 1]] += (Fv[:, 1] * A)
-        cf_y[T[:, 2]] += (Fv[:, 1] * A)
-        cf_z[T[:, 0]] += (Fv[:, 2] * A)
-        cf_z[T[:, 1]] += (Fv[:, 2] * A)
-        cf_z[T[:, 2]] += (Fv[:, 2] * A)
-        # Accumulate areas
-        Af[T[:, 0]] += A
-        Af[T[:, 1]] += A
-        Af[T[:, 2]] += A
+        VOL = volcomp.VolTriPrismArray(XT, XL)
+        # Mask of tris w/o small prisms or small areas
+        MV = (VOL > SMALLVOL) & (A > SMALLTRI)
+        # Use views instead of gathers if no tris are filtered
+        IV = slice(None) if MV.all() else np.flatnonzero(MV)
+        # Average dynamic viscosity and velocity derivatives
+        Qv = np.mean(QT[IV, :, :4], axis=1, dtype=qdtype)
+        # Sheer stress multiplier; one reciprocal instead of a divide
+        FTMUJ = np.reciprocal(VOL[IV])
+        FTMUJ *= Qv[:, 0]
+        FTMUJ *= REI
+        # Friction values weighted by areas
+        FA = _viscous_force(N[IV], Qv[:, 1:], FTMUJ)
+        # Expand to all tris (zero for filtered tris)
+        if not isinstance(IV, slice):
+            FA, FAV = np.zeros((nTri, 3)), FA
+            FA[IV] = FAV
+        # Add friction values and areas at each node
+        cf_x, cf_y, cf_z, Af = _scatter_to_nodes(
+            T, np.column_stack((FA, A)), self.nNode)
         # Filter small areas
         Af = Af[I]
         IA = (Af > SMALLTRI)
@@ -7393,6 +8457,11 @@ class Triq(TriBase):
                 Reynolds number per grid unit
             *gam*, *gamma*: {``1.4``} | :class:`float` > 1
                 Freestream ratio of specific heats
+            *qdtype*: {``"float"``} | ``None`` | ``"float32"``
+                Type for tri-averaged states; ``None`` to use type of
+                *triq.q*, e.g. to keep single-precision temporaries
+            *cache*: {``True``} | ``False``
+                Whether to reuse and save the geometry of *comp* tris
         :Utilized Attributes:
             *triq.nNode*: :class:`int`
                 Number of nodes
@@ -7414,72 +8483,60 @@ class Triq(TriBase):
                 Overall axial force coefficient
         :Versions:
             * 2017-02-15 ``@ddalle``: v1.0
+            * 2026-10-17 ``@agent``: v1.1; gather vertices once
         """
        # ------
        # Inputs
        # ------
+        # Process options
+        opts = _get_force_opts(kw)
         # Which things to calculate
-        incm = kw.get("incm", kw.get("momentum", False))
-        gauge = kw.get("gauge", True)
-        # Get Reynolds number per grid unit
-        REY = kw.get("Re", kw.get("Rey", 1.0))
-        # Freestream mach number
-        mach = kw.get("RefMach", kw.get("mach", kw.get("m", 1.0)))
+        incm = opts["incm"]
+        gauge = opts["gauge"]
+        # Reynolds number per grid unit and freestream Mach number
+        REY = opts["Re"]
+        mach = opts["mach"]
         # Freestream pressure and gamma
-        gam  = kw.get("gamma", 1.4)
-        pref = kw.get("p", 1.0/gam)
+        gam = opts["gamma"]
+        pref = opts["p"]
         # Dynamic pressure
         qref = 0.5*gam*pref*mach**2
         # Reference length/area
-        Aref = kw.get("RefArea",   kw.get("Aref", 1.0))
-        Lref = kw.get("RefLength", kw.get("Lref", 1.0))
-        bref = kw.get("RefSpan",   kw.get("bref", Lref))
+        Aref = opts["Aref"]
+        Lref = opts["Lref"]
+        bref = opts["bref"]
         # Moment reference point
-        MRP = kw.get("MRP", np.array([0.0, 0.0, 0.0]))
-        xMRP = kw.get("xMRP", MRP[0])
-        yMRP = kw.get("yMRP", MRP[1])
-        zMRP = kw.get("zMRP", MRP[2])
+        xMRP = opts["xMRP"]
+        yMRP = opts["yMRP"]
+        zMRP = opts["zMRP"]
         # Volume limiter
-        SMALLVOL = kw.get("SMALLVOL", 1e-20)
+        SMALLVOL = opts["SMALLVOL"]
+        # Precision of averaged states
+        qdtype = opts["qdtype"]
        # --------
        # Geometry
        # --------
-        # Component for subsetting
-        K = self.GetTrisFromCompID(comp)
+        # Tri indices, vertices, and area vectors for *comp*
+        K, T, XT, N, A, XC = self._GetCompTriGeometry(
+            comp, cache=kw.get("cache", True))
         # Number of tris
         nTri = K.shape[0]
-        # Store node indices for each tri
-        T = self.Tris[K, :] - 1
-        v0 = T[:, 0]
-        v1 = T[:, 1]
-        v2 = T[:, 2]
-        # Extract the vertices of each trifile.
-        x = self.Nodes[T, 0]
-        y = self.Nodes[T, 1]
-        z = self.Nodes[T, 2]
-        # Get the deltas from node 0->1 and 0->2
-        x01 = stackcol((x[:, 1]-x[:, 0], y[:, 1]-y[:, 0], z[:, 1]-z[:, 0]))
-        x02 = stackcol((x[:, 2]-x[:, 0], y[:, 2]-y[:, 0], z[:, 2]-z[:, 0]))
-        # Calculate the dimensioned normals
-        N = 0.5*np.cross(x01, x02)
-        # Scalar areas of each triangle
-        A = np.sqrt(np.sum(N**2, axis=1))
-       # -----
-       # Areas
-       # -----
-        # Calculate components
-        Avec = np.sum(N, axis=0)
        # ---------------
        # Pressure Forces
        # ---------------
-        # State handle
-        Q = self.q
+        # Gather states at the vertices of each tri once
+        QT = self.q[T]
+        # Average of each state over each tri
+        Qbar = np.mean(QT, axis=1, dtype=qdtype)
         # Calculate average *Cp* (first state variable)
-        Cp = np.sum(Q[T, 0], axis=1)/3
-        # Forces are inward normals
-        Fp = -stackcol((Cp*N[:, 0], Cp*N[:, 1], Cp*N[:, 2]))
+        Cp = Qbar[:, 0]
+        # Normalization factors for pressure and stress-based forces
+        ap = 1.0 / Aref
+        aq = 1.0 / (qref*Aref)
+        # Forces are inward normals (normalized)
+        Fp = N * (-ap*Cp)[:, None]
         # Vacuum
-        Fvac = -2/(gam*mach*mach)*N
+        Fvac = (-2*ap/(gam*mach*mach))*N
        # ---------------
        # Momentum Forces
        # ---------------
@@ -7490,155 +8547,74 @@ class Triq(TriBase):
         elif self.nq == 6:
             # Cart3D style: $\hat{u}=u/a_\infty$
             # Average density
-            rho = np.mean(Q[T, 1], axis=1)
+            rho = Qbar[:, 1]
             # Velocities
-            U = np.mean(Q[T, 2], axis=1)
-            V = np.mean(Q[T, 3], axis=1)
-            W = np.mean(Q[T, 4], axis=1)
-            # Mass flux [kg/s]
-            phi = -rho*(U*N[:, 0] + V*N[:, 1] + W*N[:, 2])
+            UVW = Qbar[:, 2:5]
+            # Mass flux [kg/s] (normalized)
+            phi = (-aq*rho)*np.einsum("ij,ij->i", UVW, N)
             # Force components
-            Fm = stackcol((phi*U, phi*V, phi*W))
+            Fm = UVW * phi[:, None]
         else:
             # Conventional: $\hat{u}=\frac{\rho u}{\rho_\infty a_\infty}$
-            # Average density
-            rho = np.mean(Q[T, 1], axis=1)
-            # Average mass flux components
-            rhoU = np.mean(Q[T, 2], axis=1)
-            rhoV = np.mean(Q[T, 3], axis=1)
-            rhoW = np.mean(Q[T, 4], axis=1)
             # Average mass flux components
-            U = (Q[v0, 2]/Q[v0, 1] + Q[v1, 2]/Q[v1, 1] + Q[v2, 2]/Q[v2, 1])/3
-            V = (Q[v0, 3]/Q[v0, 1] + Q[v1, 3]/Q[v1, 1] + Q[v2, 3]/Q[v2, 1])/3
-            W = (Q[v0, 4]/Q[v0, 1] + Q[v1, 4]/Q[v1, 1] + Q[v2, 4]/Q[v2, 1])/3
+            rhoUVW = Qbar[:, 2:5]
+            # Average velocity components (fused divide and sum)
+            UVW = np.einsum(
+                "ijk,ij->ik", QT[:, :, 2:5], 1.0/QT[:, :, 1], dtype=qdtype) / 3
             # Average mass flux, done wrongly for consistency with `triload`
-            phi = -(U*N[:, 0] + V*N[:, 1] + W*N[:, 2])
+            phi = -aq*np.einsum("ij,ij->i", UVW, N)
             # Force components
-            Fm = stackcol((phi*rhoU, phi*rhoV, phi*rhoW))
+            Fm = rhoUVW * phi[:, None]
        # --------------
        # Viscous Forces
        # --------------
         if self.nq == 9:
-            # Viscous stresses given directly
-            FXV = np.mean(Q[T, 6], axis=1) * A
-            FYV = np.mean(Q[T, 7], axis=1) * A
-            FZV = np.mean(Q[T, 8], axis=1) * A
-            # Force components
-            Fv = stackcol((FXV, FYV, FZV))
+            # Viscous stresses given directly (normalized)
+            Fv = Qbar[:, 6:9] * (aq*A)[:, None]
         elif self.nq >= 13:
             # Overset grid information
             # Inverted Reynolds number [in]
             REI = mach / REY
-            # Extract coordinates
-            X1 = self.Nodes[v0, 0]
-            Y1 = self.Nodes[v0, 1]
-            Z1 = self.Nodes[v0, 2]
-            X2 = self.Nodes[v1, 0]
-            Y2 = self.Nodes[v1, 1]
-            Z2 = self.Nodes[v1, 2]
-            X3 = self.Nodes[v2, 0]
-            Y3 = self.Nodes[v2, 1]
-            Z3 = self.Nodes[v2, 2]
             # Calculate coordinates of L=2 points
-            xlp1 = X1 + Q[v0, 10]
-            ylp1 = Y1 + Q[v0, 11]
-            zlp1 = Z1 + Q[v0, 12]
-            xlp2 = X2 + Q[v1, 10]
-            ylp2 = Y2 + Q[v1, 11]
-            zlp2 = Z2 + Q[v1, 12]
-            xlp3 = X3 + Q[v2, 10]
-            ylp3 = Y3 + Q[v2, 11]
-            zlp3 = Z3 + Q[v2, 12]
+            XL = XT + QT[:, :, 10:13]
             # Calculate volume of prisms
-            VOL = volcomp.VolTriPrism(
-                X1, Y1, Z1, X2, Y2, Z2, X3, Y3, Z3,
-                xlp1, ylp1, zlp1, xlp2, ylp2, zlp2, xlp3, ylp3, zlp3)
-            # Filter small prisms
-            IV = VOL > SMALLVOL
-            # Downselect areas
-            VAX = N[IV, 0]
-            VAY = N[IV, 1]
-            VAZ = N[IV, 2]
-            # Average dynamic viscosity
-            mu = np.mean(Q[T[IV, :], 6], axis=1)
-            # Velocity derivatives
-            UL = np.mean(Q[T[IV, :], 7], axis=1)
-            VL = np.mean(Q[T[IV, :], 8], axis=1)
-            WL = np.mean(Q[T[IV, :], 9], axis=1)
-            # Sheer stress multiplier
-            FTMUJ = mu*REI/VOL[IV]
-            # Stress flux
-            ZUVW = (1.0/3.0) * (VAX*UL + VAY*VL + VAZ*WL)
-            # Stress tensor
-            TXX = 2.0*FTMUJ * (UL*VAX - ZUVW)
-            TYY = 2.0*FTMUJ * (VL*VAY - ZUVW)
-            TZZ = 2.0*FTMUJ * (WL*VAZ - ZUVW)
-            TXY = FTMUJ * (VL*VAX + UL*VAY)
-            TYZ = FTMUJ * (WL*VAY + VL*VAZ)
-            TXZ = FTMUJ * (UL*VAZ + WL*VAX)
-            # Initialize viscous forces
-            Fv = np.zeros((nTri, 3))
-            # Save results from non-zero volumes
-            Fv[IV, 0] = (TXX*VAX + TXY*VAY + TXZ*VAZ)
-            Fv[IV, 1] = (TXY*VAX + TYY*VAY + TYZ*VAZ)
-            Fv[IV, 2] = (TXZ*VAX + TYZ*VAY + TZZ*VAZ)
+            VOL = volcomp.VolTriPrismArray(XT, XL)
+            # Mask of tris w/o small prisms
+            MV = VOL > SMALLVOL
+            # Use views instead of gathers if no tris are filtered
+            IV = slice(None) if MV.all() else np.flatnonzero(MV)
+            # Average dynamic viscosity and velocity derivatives
+            Qv = Qbar[IV, 6:10]
+            # Sheer stress multiplier (normalized)
+            FTMUJ = np.reciprocal(VOL[IV])
+            FTMUJ *= Qv[:, 0]
+            FTMUJ *= aq*REI
+            # Viscous forces on tris with non-zero volumes
+            Fv = _viscous_force(N[IV], Qv[:, 1:], FTMUJ)
+            # Expand to all tris (zero for filtered tris)
+            if not isinstance(IV, slice):
+                Fv, FvV = np.zeros((nTri, 3)), Fv
+                Fv[IV] = FvV
         else:
             # TRIQ file only contains inadequate info for viscous forces
             Fv = np.zeros((nTri, 3))
        # ------------
        # Finalization
        # ------------
-        # Normalize
-        Fp /= (Aref)
-        Fm /= (qref*Aref)
-        Fv /= (qref*Aref)
-        Fvac /= (Aref)
-        # Centers of nodes
-        xc = np.mean(x, axis=1)
-        yc = np.mean(y, axis=1)
-        zc = np.mean(z, axis=1)
-        # Calculate pressure moments
-        Mpx = ((yc-yMRP)*Fp[:, 2] - (zc-zMRP)*Fp[:, 1])/bref
-        Mpy = ((zc-zMRP)*Fp[:, 0] - (xc-xMRP)*Fp[:, 2])/Lref
-        Mpz = ((zc-xMRP)*Fp[:, 1] - (yc-yMRP)*Fp[:, 0])/bref
-        # Calculate vacuum pressure moments
-        Mcx = ((yc-yMRP)*Fvac[:, 2] - (zc-zMRP)*Fvac[:, 1])/bref
-        Mcy = ((zc-zMRP)*Fvac[:, 0] - (xc-xMRP)*Fvac[:, 2])/Lref
-        Mcz = ((zc-xMRP)*Fvac[:, 1] - (yc-yMRP)*Fvac[:, 0])/bref
-        # Calculate momentum moments
-        Mmx = ((yc-yMRP)*Fm[:, 2] - (zc-zMRP)*Fm[:, 1])/bref
-        Mmy = ((zc-zMRP)*Fm[:, 0] - (xc-xMRP)*Fm[:, 2])/Lref
-        Mmz = ((zc-xMRP)*Fm[:, 1] - (yc-yMRP)*Fm[:, 0])/bref
-        # Calculate viscous moments
-        Mvx = ((yc-yMRP)*Fv[:, 2] - (zc-zMRP)*Fv[:, 1])/bref
-        Mvy = ((zc-zMRP)*Fv[:, 0] - (xc-xMRP)*Fv[:, 2])/Lref
-        Mvz = ((zc-xMRP)*Fv[:, 1] - (yc-yMRP)*Fv[:, 0])/bref
-        # Assemble
-        Mp = stackcol((Mpx, Mpy, Mpz))
-        Mvac = stackcol((Mcx, Mcy, Mcz))
-        Mm = stackcol((Mmx, Mmy, Mmz))
-        Mv = stackcol((Mvx, Mvy, Mvz))
+        # Centers of tris relative to moment reference point
+        rc = XC - np.array([xMRP, yMRP, zMRP])
+        # Reference lengths for rolling, pitching, and yawing moments
+        Lmom = np.array([bref, Lref, bref])
+        # Stack pressure, vacuum, momentum, and viscous forces
+        F4 = np.stack((Fp, Fvac, Fm, Fv))
+        # Calculate all four moment types in one cross product
+        M4 = np.cross(rc, F4) / Lmom
+        Mp, Mvac, Mm, Mv = M4
+        # Select force types included in total (vacuum unless *gauge*)
+        I4 = [True, not gauge, incm, True]
         # Add up forces
-        if gauge:
-            # Use *pinf* as reference pressure
-            if incm:
-                # Include all forces
-                F = Fp + Fm + Fv
-                M = Mp + Mm + Mv
-            else:
-                # Include viscous
-                F = Fp + Fv
-                M = Mp + Mv
-        else:
-            # Use p=0 as reference pressure
-            if incm:
-                # Include all forces
-                F = Fp + Fvac + Fm + Fv
-                M = Mp + Mvac + Mm + Mv
-            else:
-                # Disinclude momentum
-                F = Fp + Fvac + Fv
-                M = Mp + Mvac + Mv
+        F = np.sum(F4[I4], axis=0)
+        M = np.sum(M4[I4], axis=0)
         # Save information
         if kw.get("save", False):
             self.F = F
@@ -7650,49 +8626,58 @@ class Triq(TriBase):
             self.Mp = Mp
             self.Mm = Mm
             self.Mv = Mv
-        # Dictionary of results
-        C = {}
-        # Save areas
-        C["Ax"] = Avec[0]
-        C["Ay"] = Avec[1]
-        C["Az"] = Avec[2]
-        # Total forces
-        C["CA"] = np.sum(F[:, 0])
-        C["CY"] = np.sum(F[:, 1])
-        C["CN"] = np.sum(F[:, 2])
-        C["CLL"] = np.sum(M[:, 0])
-        C["CLM"] = np.sum(M[:, 1])
-        C["CLN"] = np.sum(M[:, 2])
-        # Pressure contributions
-        C["CAp"] = np.sum(Fp[:, 0])
-        C["CYp"] = np.sum(Fp[:, 1])
-        C["CNp"] = np.sum(Fp[:, 2])
-        C["CLLp"] = np.sum(Mp[:, 0])
-        C["CLMp"] = np.sum(Mp[:, 1])
-        C["CLNp"] = np.sum(Mp[:, 2])
-        # Vacuum forces
-        C["CAvac"] = np.sum(Fvac[:, 0])
-        C["CYvac"] = np.sum(Fvac[:, 1])
-        C["CNvac"] = np.sum(Fvac[:, 2])
-        C["CLLvac"] = np.sum(Mvac[:, 0])
-        C["CLMvac"] = np.sum(Mvac[:, 1])
-        C["CLNvac"] = np.sum(Mvac[:, 2])
-        # Flow-through contributions
-        C["CAm"] = np.sum(Fm[:, 0])
-        C["CYm"] = np.sum(Fm[:, 1])
-        C["CNm"] = np.sum(Fm[:, 2])
-        C["CLLm"] = np.sum(Mm[:, 0])
-        C["CLMm"] = np.sum(Mm[:, 1])
-        C["CLNm"] = np.sum(Mm[:, 2])
-        # Viscous contributions
-        C["CAv"] = np.sum(Fv[:, 0])
-        C["CYv"] = np.sum(Fv[:, 1])
-        C["CNv"] = np.sum(Fv[:, 2])
-        C["CLLv"] = np.sum(Mv[:, 0])
-        C["CLMv"] = np.sum(Mv[:, 1])
-        C["CLNv"] = np.sum(Mv[:, 2])
+        # Sum each force and moment type over tris in one reduction
+        SF = np.sum(F4, axis=1)
+        SM = np.sum(M4, axis=1)
+        # Totals and per-type sums, force and moment of each type paired
+        FM = np.vstack((
+            np.sum(SF[I4], axis=0), np.sum(SM[I4], axis=0),
+            np.stack((SF, SM), axis=1).reshape(-1, 3)))
+        # Dictionary of results, starting with projected areas
+        C = dict(zip(("Ax", "Ay", "Az"), np.sum(N, axis=0)))
+        # Add all force and moment coefficients at once
+        C.update(zip(TRIQ_FM_COEFFS, FM.ravel()))
         # Output
         return C
+
+    # Calculate forces on several components
+    def GetTriForcesMulti(self, comps, **kw):
+        r"""Calculate forces on tris for each of several components
+
+        :Call:
+            >>> CC = triq.GetTriForcesMulti(comps, **kw)
+        :Inputs:
+            *triq*: :class:`cape.trifile.Triq`
+                Annotated surface triangulation
+            *comps*: :class:`list` (:class:`str` | :class:`int`)
+                List of component IDs or names
+            *nthreads*: {``1``} | :class:`int`
+                Number of threads used to process components
+            *kw*: :class:`dict`
+                Other keyword arguments to :func:`GetTriForces`
+        :Outputs:
+            *CC*: :class:`list` (:class:`dict`)
+                Force/moment coefficients for each component in *comps*
+        :Versions:
+            * 2026-10-17 ``@agent``: v1.0
+        """
+        # Number of threads
+        nthreads = kw.pop("nthreads", 1)
+        # Per-tri forces cannot be saved for multiple components
+        kw.pop("save", None)
+        # Build shared caches before any threads use them
+        self.GetTrisIndex()
+        self.GetCompIDIndex()
+        # Process components
+        if nthreads > 1 and len(comps) > 1:
+            # Don't let threads share the single-entry geometry cache
+            kw["cache"] = False
+            # NumPy releases the GIL for the array operations
+            with ThreadPoolExecutor(nthreads) as pool:
+                return list(pool.map(
+                    lambda comp: self.GetTriForces(comp, **kw), comps))
+        else:
+            return [self.GetTriForces(comp, **kw) for comp in comps]
   # >
 
 
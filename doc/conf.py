@@ -395,26 +395,28 @@ htmlhelp_basename = 'capedoc'
 
 # -- Options for LaTeX output ---------------------------------------------
 
-# Initialize our preamble
-preamble = "\\makeatletter\n"
+# Initialize our preamble (collect lines, then join once)
+lines = ["\\makeatletter"]
 # Loop through the switches
 for key in latex_opts:
     # Initialize the variable
-    preamble += "\\newif\\if@%s\n" % key
+    lines.append("\\newif\\if@%s" % key)
     # Get the value
     v = str(latex_opts[key]).lower()
     # Set it
-    preamble += "\\@%s%s\n" % (key, v)
+    lines.append("\\@%s%s" % (key, v))
 # Loop through the NC parameters
-preamble += "\n"
+lines.append("")
 for key in NC:
-    preamble += "\\newcommand{\\NC@%s}{%s}\n" % (key, NC[key])
+    lines.append("\\newcommand{\\NC@%s}{%s}" % (key, NC[key]))
 # Loop through the TNA parameters
 for key in TNA:
-    preamble += "\\newcommand{\\TNA@%s}{%s}\n" % (key, TNA[key])
-
+    lines.append("\\newcommand{\\TNA@%s}{%s}" % (key, TNA[key]))
 # Append the TM style file as a raw preamble
-preamble += open('nasatm.sty').read()
+with open('nasatm.sty') as fp:
+    lines.append(fp.read())
+# Assemble
+preamble = "\n".join(lines)
 
 latex_elements = {
     # The paper size ('letterpaper' or 'a4paper').
@@ -171,4 +171,46 @@ char doc_WriteTriSTL[] =
 "        Vector of triangle normals\n"
 ":Versions:\n"
 "    * 2015-11-23 ``@ddalle``: First version\n";
+
+PyObject *
+cape_TriNodeSums(PyObject *self, PyObject *args);
+char doc_TriNodeSums[] =
+"Add values of each triangle to each of its three nodes\n"
+"\n"
+":Call:\n"
+"    >>> V = _cape.TriNodeSums(T, W, nNode)\n"
+":Inputs:\n"
+"    *T*: :class:`numpy.ndarray` (:class:`int`) (*nTri*, 3)\n"
+"        Matrix of 0-based nodal indices for each triangle\n"
+"    *W*: :class:`numpy.ndarray` (:class:`float`) (*nTri*, *m*)\n"
+"        Values to add for each triangle\n"
+"    *nNode*: :class:`int`\n"
+"        Number of nodes\n"
+":Outputs:\n"
+"    *V*: :class:`numpy.ndarray` (:class:`float`) (*m*, *nNode*)\n"
+"        Sum of *W* from all triangles that use each node\n"
+":Versions:\n"
+"    * 2026-10-17 ``@agent``: First version\n";
+
+PyObject *
+cape_TriViscousForce(PyObject *self, PyObject *args);
+char doc_TriViscousForce[] =
+"Apply viscous stress tensor to area vector of each triangle\n"
+"\n"
+"The result is ``FTMUJ*(|VA|^2*G + dot(VA,G)/3*VA)`` for each row.\n"
+"\n"
+":Call:\n"
+"    >>> F = _cape.TriViscousForce(VA, G, FTMUJ)\n"
+":Inputs:\n"
+"    *VA*: :class:`numpy.ndarray` (:class:`float`) (*n*, 3)\n"
+"        Area vector of each triangle\n"
+"    *G*: :class:`numpy.ndarray` (:class:`float`) (*n*, 3)\n"
+"        Velocity derivatives *UL*, *VL*, *WL* of each triangle\n"
+"    *FTMUJ*: :class:`numpy.ndarray` (:class:`float`) (*n*)\n"
+"        Shear stress multiplier of each triangle\n"
+":Outputs:\n"
+"    *F*: :class:`numpy.ndarray` (:class:`float`) (*n*, 3)\n"
+"        Viscous force on each triangle\n"
+":Versions:\n"
+"    * 2026-10-17 ``@agent``: First version\n";
 #endif
@@ -29,6 +29,13 @@ static PyMethodDef CapeMethods[] = {
     {"WriteTri_lb4", cape_WriteTri_lb4, METH_VARARGS, doc_WriteTri_lb4},
     {"WriteTri_b8",  cape_WriteTri_b8,  METH_VARARGS, doc_WriteTri_b8},
     {"WriteTri_lb8", cape_WriteTri_lb8, METH_VARARGS, doc_WriteTri_lb8},
+    {"TriNodeSums",  cape_TriNodeSums,  METH_VARARGS, doc_TriNodeSums},
+    {
+        "TriViscousForce",
+        cape_TriViscousForce,
+        METH_VARARGS,
+        doc_TriViscousForce
+    },
     // CSV file utilities
     {
         "CSVFileCountLines",
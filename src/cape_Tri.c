@@ -635,3 +635,220 @@ cape_WriteTriSTL(PyObject *self, PyObject *args)
     Py_INCREF(Py_None);
     return Py_None;
 }
+
+// Function to add values of each tri to each of its nodes
+PyObject *
+cape_TriNodeSums(PyObject *self, PyObject *args)
+{
+    npy_intp k, j, c, i;
+    npy_intp nTri, m, nNode;
+    npy_intp dims[2];
+    int ierr = 0;
+    PyObject *TObj;
+    PyObject *WObj;
+    PyArrayObject *T;
+    PyArrayObject *W;
+    PyArrayObject *V;
+    npy_intp *t;
+    double *w;
+    double *v;
+    
+    // Process the inputs.
+    if (!PyArg_ParseTuple(args, "OOn", &TObj, &WObj, &nNode)) {
+        // Check for failure.
+        PyErr_SetString(PyExc_RuntimeError, \
+            "Could not process inputs to :func:`_cape.TriNodeSums`");
+        return NULL;
+    }
+    
+    // Get C-contiguous index and weight arrays (no copy if already so)
+    T = (PyArrayObject *) PyArray_FROM_OTF(TObj, NPY_INTP, NPY_ARRAY_IN_ARRAY);
+    if (T == NULL) {
+        return NULL;
+    }
+    W = (PyArrayObject *) PyArray_FROM_OTF(WObj, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    if (W == NULL) {
+        Py_DECREF(T);
+        return NULL;
+    }
+    
+    // Check for two-dimensional Nx3 array.
+    if (PyArray_NDIM(T) != 2 || PyArray_DIM(T, 1) != 3) {
+        PyErr_SetString(PyExc_ValueError, \
+            "Nodal indices must be Nx3 array.");
+        Py_DECREF(T);
+        Py_DECREF(W);
+        return NULL;
+    }
+    // Read number of triangles.
+    nTri = PyArray_DIM(T, 0);
+    
+    // Check for one weight row per triangle
+    if (PyArray_NDIM(W) != 2 || PyArray_DIM(W, 0) != nTri) {
+        PyErr_SetString(PyExc_ValueError, \
+            "Tri values must be Nxm array with one row per triangle.");
+        Py_DECREF(T);
+        Py_DECREF(W);
+        return NULL;
+    }
+    // Number of values per tri
+    m = PyArray_DIM(W, 1);
+    
+    // Initialize output
+    dims[0] = m;
+    dims[1] = nNode;
+    V = (PyArrayObject *) PyArray_ZEROS(2, dims, NPY_DOUBLE, 0);
+    if (V == NULL) {
+        Py_DECREF(T);
+        Py_DECREF(W);
+        return NULL;
+    }
+    
+    // Pointers to data
+    t = (npy_intp *) PyArray_DATA(T);
+    w = (double *) PyArray_DATA(W);
+    v = (double *) PyArray_DATA(V);
+    
+    // Loop through tris without holding the GIL
+    Py_BEGIN_ALLOW_THREADS
+    for (k=0; k<nTri; k++) {
+        // Loop through corners
+        for (j=0; j<3; j++) {
+            // Node index
+            i = t[3*k + j];
+            // Check for invalid node
+            if (i < 0 || i >= nNode) {
+                ierr = 1;
+                break;
+            }
+            // Add each value
+            for (c=0; c<m; c++) {
+                v[c*nNode + i] += w[k*m + c];
+            }
+        }
+        // Check for errors
+        if (ierr) break;
+    }
+    Py_END_ALLOW_THREADS
+    
+    // Clean up inputs
+    Py_DECREF(T);
+    Py_DECREF(W);
+    
+    // Check for bad node index
+    if (ierr) {
+        PyErr_SetString(PyExc_IndexError, \
+            "Tri node index out of range");
+        Py_DECREF(V);
+        return NULL;
+    }
+    
+    // Output
+    return (PyObject *) V;
+}
+
+// Function to calculate viscous force on each tri
+PyObject *
+cape_TriViscousForce(PyObject *self, PyObject *args)
+{
+    npy_intp k, n;
+    npy_intp dims[2];
+    double vx, vy, vz, gx, gy, gz;
+    double aa, ag, f;
+    PyObject *VAObj;
+    PyObject *GObj;
+    PyObject *MObj;
+    PyArrayObject *VA;
+    PyArrayObject *G;
+    PyArrayObject *M;
+    PyArrayObject *F;
+    double *va;
+    double *g;
+    double *m;
+    double *v;
+    
+    // Process the inputs.
+    if (!PyArg_ParseTuple(args, "OOO", &VAObj, &GObj, &MObj)) {
+        // Check for failure.
+        PyErr_SetString(PyExc_RuntimeError, \
+            "Could not process inputs to :func:`_cape.TriViscousForce`");
+        return NULL;
+    }
+    
+    // Get C-contiguous double arrays (no copy if already so)
+    VA = (PyArrayObject *) PyArray_FROM_OTF(
+        VAObj, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    G = (PyArrayObject *) PyArray_FROM_OTF(
+        GObj, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    M = (PyArrayObject *) PyArray_FROM_OTF(
+        MObj, NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+    if (VA == NULL || G == NULL || M == NULL) {
+        Py_XDECREF(VA);
+        Py_XDECREF(G);
+        Py_XDECREF(M);
+        return NULL;
+    }
+    
+    // Check dimensions
+    if (PyArray_NDIM(VA) != 2 || PyArray_DIM(VA, 1) != 3 ||
+            PyArray_NDIM(G) != 2 || PyArray_DIM(G, 1) != 3 ||
+            PyArray_NDIM(M) != 1 ||
+            PyArray_DIM(G, 0) != PyArray_DIM(VA, 0) ||
+            PyArray_DIM(M, 0) != PyArray_DIM(VA, 0)) {
+        PyErr_SetString(PyExc_ValueError, \
+            "Area vectors and velocity derivatives must be Nx3 arrays "
+            "and stress multipliers must have length N.");
+        Py_DECREF(VA);
+        Py_DECREF(G);
+        Py_DECREF(M);
+        return NULL;
+    }
+    // Number of triangles
+    n = PyArray_DIM(VA, 0);
+    
+    // Initialize output
+    dims[0] = n;
+    dims[1] = 3;
+    F = (PyArrayObject *) PyArray_EMPTY(2, dims, NPY_DOUBLE, 0);
+    if (F == NULL) {
+        Py_DECREF(VA);
+        Py_DECREF(G);
+        Py_DECREF(M);
+        return NULL;
+    }
+    
+    // Pointers to data
+    va = (double *) PyArray_DATA(VA);
+    g = (double *) PyArray_DATA(G);
+    m = (double *) PyArray_DATA(M);
+    v = (double *) PyArray_DATA(F);
+    
+    // Loop through tris without holding the GIL
+    Py_BEGIN_ALLOW_THREADS
+    for (k=0; k<n; k++) {
+        // Area vector and velocity derivatives
+        vx = va[3*k];
+        vy = va[3*k + 1];
+        vz = va[3*k + 2];
+        gx = g[3*k];
+        gy = g[3*k + 1];
+        gz = g[3*k + 2];
+        // Squared area and stress flux
+        aa = vx*vx + vy*vy + vz*vz;
+        ag = (vx*gx + vy*gy + vz*gz) / 3.0;
+        // Stress tensor times area vector
+        f = m[k];
+        v[3*k]     = f*(gx*aa + vx*ag);
+        v[3*k + 1] = f*(gy*aa + vy*ag);
+        v[3*k + 2] = f*(gz*aa + vz*ag);
+    }
+    Py_END_ALLOW_THREADS
+    
+    // Clean up inputs
+    Py_DECREF(VA);
+    Py_DECREF(G);
+    Py_DECREF(M);
+    
+    // Output
+    return (PyObject *) F;
+}
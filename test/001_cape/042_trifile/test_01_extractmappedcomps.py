@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Two unit squares, tilted so the bounding box is not flat
+NODES = np.array([
+    [0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0],
+    [2.0, 0.0, 0.0], [3.0, 0.0, 0.0], [3.0, 1.0, 1.0], [2.0, 1.0, 1.0]])
+TRIS = np.array([[1, 2, 3], [1, 3, 4], [5, 6, 7], [5, 7, 8]])
+# Component names
+CONF = {"left": 1, "right": 2}
+
+
+# Map names from a template triangulation and extract them
+def test_01_extractmappedcomps():
+    # Template triangulation with labeled components
+    tric = trifile.Tri(Nodes=NODES, Tris=TRIS, CompID=np.array([1, 1, 2, 2]))
+    tric.Conf = dict(CONF)
+    # Same surface with a single unlabeled component
+    tri = trifile.Tri(Nodes=NODES, Tris=TRIS, CompID=np.array([7, 7, 7, 7]))
+    tri.Conf = dict(CONF)
+    # Map and extract each component
+    tris = tri.ExtractMappedComps(tric, ["left", "right"])
+    # Check each component
+    assert sorted(tris.keys()) == ["left", "right"]
+    assert tris["left"].nTri == 2
+    assert tris["right"].nTri == 2
+    assert np.all(tris["left"].CompID == 1)
+    assert np.all(tris["right"].CompID == 2)
+    assert np.all(tris["right"].Nodes[:, 0] >= 2.0)
+    # Original triangulation is unchanged
+    assert np.all(tri.CompID == 7)
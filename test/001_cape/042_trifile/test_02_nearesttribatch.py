@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Number of divisions along each edge of each cube face
+NDIV = 8
+
+
+# Create surface of unit cube with one component per face
+def make_cube(ndiv=NDIV):
+    # Grid of points on one face
+    s = np.linspace(0.0, 1.0, ndiv + 1)
+    u, v = np.meshgrid(s, s, indexing="ij")
+    u = u.flatten()
+    v = v.flatten()
+    # Tris on one face (0-based)
+    i0 = np.arange(ndiv)[:, None]*(ndiv + 1) + np.arange(ndiv)[None, :]
+    i0 = i0.flatten()
+    tris = np.vstack((
+        np.stack((i0, i0 + ndiv + 1, i0 + ndiv + 2), axis=1),
+        np.stack((i0, i0 + ndiv + 2, i0 + 1), axis=1)))
+    # Assemble faces
+    nodes = []
+    Tris = []
+    CompID = []
+    for j in range(3):
+        for w in (0.0, 1.0):
+            # Coordinates of this face
+            X = np.zeros((u.size, 3))
+            X[:, j] = w
+            X[:, (j + 1) % 3] = u
+            X[:, (j + 2) % 3] = v
+            Tris.append(tris + 1 + len(nodes)*u.size)
+            CompID.append(np.full(tris.shape[0], len(nodes) + 1))
+            nodes.append(X)
+    return trifile.Tri(
+        Nodes=np.vstack(nodes), Tris=np.vstack(Tris),
+        CompID=np.hstack(CompID))
+
+
+# Compare batched and per-point searches
+def test_01_nearesttribatch():
+    # Create triangulation
+    tri = make_cube()
+    # Test points near the surface, inside and outside
+    rng = np.random.default_rng(2)
+    X = rng.random((60, 3))
+    j = rng.integers(0, 3, size=X.shape[0])
+    X[np.arange(X.shape[0]), j] = np.where(
+        rng.random(X.shape[0]) < 0.5, -0.02, 1.02)
+    X[::2] = 0.5 + 0.98*(X[::2] - 0.5)
+    # Batched search
+    T = tri.GetNearestTriBatch(X)
+    # Compare to one point at a time
+    for i, x in enumerate(X):
+        Ti = tri.GetNearestTri(x, n=1)
+        assert T["k1"][i] == Ti["k1"]
+        assert T["c1"][i] == Ti["c1"]
+        assert np.isclose(T["d1"][i], Ti["d1"])
+        assert np.isclose(T["z1"][i], Ti["z1"])
+        assert np.isclose(T["t1"][i], Ti["t1"])
+
+
+# Points in sub-regions without any tris
+def test_02_nearesttribatch_empty():
+    # Create triangulation
+    tri = make_cube()
+    # Points near the center of the cube (no tris in those zones)
+    X = np.array([
+        [0.5, 0.5, 0.5],
+        [0.45, 0.55, 0.5],
+        [0.02, 0.5, 0.5],
+        [0.5, 0.35, 0.62]])
+    # Batched search
+    T = tri.GetNearestTriBatch(X)
+    # Central points have no candidates
+    assert np.all(T["k1"][[0, 1, 3]] == -1)
+    assert np.all(T["c1"][[0, 1, 3]] == 0)
+    assert np.all(np.isinf(T["d1"][[0, 1, 3]]))
+    # Point next to the x=0 face is still found
+    assert T["c1"][2] == 1
+    assert np.isclose(T["d1"][2], 0.02)
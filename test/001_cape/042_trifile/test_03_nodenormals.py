@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Square pyramid with an off-center apex (node 5)
+NODES = np.array([
+    [-1.0, -1.0, 0.0],
+    [1.0, -1.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [-1.0, 1.0, 0.0],
+    [0.3, 0.1, 1.0]])
+TRIS = np.array([
+    [1, 2, 5],
+    [2, 3, 5],
+    [3, 4, 5],
+    [4, 1, 5],
+    [1, 3, 2],
+    [1, 4, 3]])
+
+
+# Area-weighted node normals with every tri at a node included
+def test_01_nodenormals():
+    # Create triangulation
+    tri = trifile.Tri(Nodes=NODES, Tris=TRIS, CompID=np.ones(6, dtype="int"))
+    tri.GetNodeNormals()
+    # Sum area vectors of each tri at each node by hand
+    NN = np.zeros((NODES.shape[0], 3))
+    for t in TRIS - 1:
+        x0, x1, x2 = NODES[t]
+        for i in t:
+            NN[i] += 0.5*np.cross(x1 - x0, x2 - x0)
+    NN /= np.sqrt(np.sum(NN**2, axis=1))[:, None]
+    # Compare
+    assert np.allclose(tri.NodeNormals, NN)
+    # The apex touches four tris, not just the last one
+    t = TRIS[3] - 1
+    N4 = np.cross(NODES[t[1]] - NODES[t[0]], NODES[t[2]] - NODES[t[0]])
+    assert not np.allclose(tri.NodeNormals[4], N4/np.linalg.norm(N4))
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.trifile as trifile
+from cape.cfdx import volcomp
+
+
+# Square pyramid with an off-center apex (node 5)
+NODES = np.array([
+    [-1.0, -1.0, 0.0],
+    [1.0, -1.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [-1.0, 1.0, 0.0],
+    [0.3, 0.1, 1.0]])
+TRIS = np.array([
+    [1, 2, 5],
+    [2, 3, 5],
+    [3, 4, 5],
+    [4, 1, 5],
+    [1, 3, 2],
+    [1, 4, 3]])
+# Flow conditions
+MACH = 0.8
+REY = 1e4
+
+
+# Create annotated triangulation with all 13 states
+def make_triq():
+    # Create triangulation
+    triq = trifile.Triq(
+        Nodes=NODES, Tris=TRIS, CompID=np.ones(6, dtype="int"), nq=13)
+    # Random states
+    rng = np.random.default_rng(3)
+    q = rng.random((NODES.shape[0], 13))
+    # Offset to L=2 points away from a point inside the pyramid
+    dX = NODES - [0.0, 0.0, 0.25]
+    q[:, 10:13] = 0.05*dX / np.sqrt(np.sum(dX**2, axis=1))[:, None]
+    triq.q = q
+    return triq
+
+
+# Friction coefficients with every tri at a node included
+def test_01_skinfriction():
+    # Create triangulation
+    triq = make_triq()
+    q = triq.q
+    # Calculate friction
+    cf_x, cf_y, cf_z = triq.GetSkinFriction(mach=MACH, Re=REY)
+    # Sum area-weighted friction at each node by hand
+    FA = np.zeros((NODES.shape[0], 3))
+    AA = np.zeros(NODES.shape[0])
+    for t in TRIS - 1:
+        # Area vector
+        x0, x1, x2 = NODES[t]
+        VA = 0.5*np.cross(x1 - x0, x2 - x0)
+        A = np.linalg.norm(VA)
+        # Prism volume from surface to L=2 points
+        xl0, xl1, xl2 = NODES[t] + q[t, 10:13]
+        VOL = volcomp.VolTriPrism(
+            x0[0], x0[1], x0[2], x1[0], x1[1], x1[2],
+            x2[0], x2[1], x2[2], xl0[0], xl0[1], xl0[2],
+            xl1[0], xl1[1], xl1[2], xl2[0], xl2[1], xl2[2])
+        assert VOL > 0
+        # Viscosity and velocity gradient
+        mu = np.mean(q[t, 6])
+        G = np.mean(q[t, 7:10], axis=0)
+        # Stress tensor
+        tau = mu*MACH/REY/VOL * (
+            np.outer(G, VA) + np.outer(VA, G) -
+            2.0/3.0*np.dot(VA, G)*np.eye(3))
+        # Add to each node
+        for i in t:
+            FA[i] += np.dot(tau, VA)
+            AA[i] += A
+    cf = FA / AA[:, None]
+    # Compare
+    assert np.allclose(cf_x, cf[:, 0])
+    assert np.allclose(cf_y, cf[:, 1])
+    assert np.allclose(cf_z, cf[:, 2])
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Number of divisions along each edge of each cube face
+NDIV = 6
+# Force options
+FORCE_OPTS = {
+    "mach": 0.8,
+    "Re": 1e4,
+    "MRP": [0.2, 0.4, 0.6],
+    "Aref": 2.0,
+    "Lref": 1.5,
+}
+
+
+# Create annotated surface of unit cube with one component per face
+def make_cube(ndiv=NDIV):
+    # Grid of points on one face
+    s = np.linspace(0.0, 1.0, ndiv + 1)
+    u, v = np.meshgrid(s, s, indexing="ij")
+    u = u.flatten()
+    v = v.flatten()
+    # Tris on one face (0-based)
+    i0 = np.arange(ndiv)[:, None]*(ndiv + 1) + np.arange(ndiv)[None, :]
+    i0 = i0.flatten()
+    tris = np.vstack((
+        np.stack((i0, i0 + ndiv + 1, i0 + ndiv + 2), axis=1),
+        np.stack((i0, i0 + ndiv + 2, i0 + 1), axis=1)))
+    # Assemble faces
+    nodes = []
+    Tris = []
+    CompID = []
+    for j in range(3):
+        for w in (0.0, 1.0):
+            # Coordinates of this face
+            X = np.zeros((u.size, 3))
+            X[:, j] = w
+            X[:, (j + 1) % 3] = u
+            X[:, (j + 2) % 3] = v
+            # Outward normals on both faces
+            T = tris if w else tris[:, ::-1]
+            Tris.append(T + 1 + len(nodes)*u.size)
+            CompID.append(np.full(tris.shape[0], len(nodes) + 1))
+            nodes.append(X)
+    Nodes = np.vstack(nodes)
+    # Random states
+    rng = np.random.default_rng(4)
+    q = rng.random((Nodes.shape[0], 13)) + 0.5
+    # Offset to L=2 points away from the center
+    dX = Nodes - 0.5
+    q[:, 10:13] = 0.05*dX / np.sqrt(np.sum(dX**2, axis=1))[:, None]
+    return trifile.Triq(
+        Nodes=Nodes, Tris=np.vstack(Tris), CompID=np.hstack(CompID),
+        nq=13, q=q)
+
+
+# Threaded multi-component forces match one call per component
+def test_01_triforcesmulti():
+    # Create triangulation
+    triq = make_cube()
+    # Components, including a repeat and a list of components
+    comps = [1, 2, 3, 4, 5, 6, 2, [1, 4]]
+    # Calculate all components in threads
+    CC = triq.GetTriForcesMulti(comps, nthreads=4, **FORCE_OPTS)
+    assert len(CC) == len(comps)
+    # Compare to one call for each component
+    for comp, C in zip(comps, CC):
+        # Forces for just this component
+        C0 = triq.GetTriForces(comp, **FORCE_OPTS)
+        # Compare each coefficient
+        assert sorted(C.keys()) == sorted(C0.keys())
+        for k, v in C0.items():
+            assert np.isclose(C[k], v, rtol=1e-12, atol=1e-14), (comp, k)
+    # Faces are different components with different forces
+    assert not np.isclose(CC[0]["CA"], CC[1]["CA"])
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import pytest
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Number of nodes and tris
+NNODE = 200
+NTRI = 1000
+
+
+# Compiled tri-to-node sums match the NumPy fallback
+def test_01_trinodesums(monkeypatch):
+    # Get compiled function
+    fn = getattr(trifile._cape, "TriNodeSums", None)
+    if fn is None:
+        pytest.skip("_cape.TriNodeSums is not available")
+    # Random tris, some with repeated nodes
+    rng = np.random.default_rng(5)
+    T = rng.integers(0, NNODE, size=(NTRI, 3))
+    T[::7, 1] = T[::7, 0]
+    # Random values for each tri
+    W = rng.standard_normal((NTRI, 4))
+    # Compiled sums
+    V = fn(T, W, NNODE)
+    # NumPy fallback, in several blocks
+    monkeypatch.setattr(trifile, "_cape", None)
+    V0 = trifile._scatter_to_nodes(T, W, NNODE, nblock=300)
+    # Compare
+    assert V.shape == (4, NNODE)
+    np.testing.assert_allclose(V, V0, rtol=1e-12, atol=1e-12)
+    # Bad node index
+    T[3, 2] = NNODE
+    with pytest.raises(IndexError):
+        fn(T, W, NNODE)
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Two tris well away from the axes, with different pressures at nodes
+NODES = np.array([
+    [2.0, 3.0, 5.0],
+    [2.5, 3.2, 4.0],
+    [1.8, 4.1, 4.6],
+    [2.9, 4.4, 5.3]])
+TRIS = np.array([
+    [1, 2, 3],
+    [2, 4, 3]])
+CP = np.array([0.6, -0.2, 0.3, 0.9])
+# Reference quantities
+AREF = 2.0
+LREF = 1.5
+BREF = 3.0
+MRP = np.array([0.5, -1.0, 2.0])
+
+
+# Pressure moments are r x F about the MRP
+def test_01_triforces_moments():
+    # Create annotated triangulation with *Cp* only
+    triq = trifile.Triq(
+        Nodes=NODES, Tris=TRIS, CompID=np.ones(2, dtype="int"),
+        nq=1, q=CP[:, None])
+    # Calculate forces and moments
+    C = triq.GetTriForces(Aref=AREF, Lref=LREF, bref=BREF, MRP=list(MRP))
+    # Add up force and moment of each tri by hand
+    F = np.zeros(3)
+    M = np.zeros(3)
+    for t in TRIS - 1:
+        # Vertices, area vector, and center
+        x0, x1, x2 = NODES[t]
+        N = 0.5*np.cross(x1 - x0, x2 - x0)
+        xc = (x0 + x1 + x2) / 3
+        # Pressure force
+        Fk = -np.mean(CP[t]) * N / AREF
+        F += Fk
+        # Moment arm
+        rx, ry, rz = xc - MRP
+        M += [
+            (ry*Fk[2] - rz*Fk[1]) / BREF,
+            (rz*Fk[0] - rx*Fk[2]) / LREF,
+            (rx*Fk[1] - ry*Fk[0]) / BREF]
+    # Compare forces
+    assert np.allclose([C["CA"], C["CY"], C["CN"]], F)
+    assert np.allclose([C["CAp"], C["CYp"], C["CNp"]], F)
+    # Compare moments, including yawing moment
+    assert np.allclose([C["CLL"], C["CLM"], C["CLN"]], M)
+    assert np.allclose([C["CLLp"], C["CLMp"], C["CLNp"]], M)
+    # Check that the test has a nontrivial yawing moment
+    assert abs(M[2]) > 0.01
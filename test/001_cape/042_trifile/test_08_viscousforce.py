@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import pytest
+
+# Local imports
+import cape.trifile as trifile
+
+
+# Number of tris
+NTRI = 1000
+
+
+# Compiled viscous force kernel matches the NumPy fallback
+def test_01_viscousforce(monkeypatch):
+    # Get compiled function
+    fn = getattr(trifile._cape, "TriViscousForce", None)
+    if fn is None:
+        pytest.skip("_cape.TriViscousForce is not available")
+    # Random area vectors, velocity derivatives, and multipliers
+    rng = np.random.default_rng(6)
+    VA = rng.standard_normal((NTRI, 3))
+    G = rng.standard_normal((NTRI, 3))
+    FTMUJ = rng.random(NTRI)
+    # Compiled forces
+    F = fn(VA, G, FTMUJ)
+    # NumPy fallback, in several blocks
+    monkeypatch.setattr(trifile, "_cape", None)
+    F0 = trifile._viscous_force(VA, G, FTMUJ, nblock=300)
+    # Compare
+    assert F.shape == (NTRI, 3)
+    np.testing.assert_allclose(F, F0, rtol=1e-12, atol=1e-12)
+    # Compare to full stress tensor for one tri
+    tau = FTMUJ[5] * (
+        np.outer(G[5], VA[5]) + np.outer(VA[5], G[5]) -
+        2.0/3.0*np.dot(VA[5], G[5])*np.eye(3))
+    np.testing.assert_allclose(F[5], np.dot(tau, VA[5]), rtol=1e-12)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pycart import pointsensor
+
+
+# Coordinates of three point sensors
+COORDS = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.5],
+    [2.0, 1.0, 0.0]])
+
+
+# Create single-iteration point sensor
+def make_ps(i, seed):
+    # Random states
+    rng = np.random.default_rng(seed)
+    # Coordinates, states, refinement levels, iteration
+    data = np.zeros((COORDS.shape[0], 11))
+    data[:, :3] = COORDS
+    data[:, 3:9] = rng.random((COORDS.shape[0], 6))
+    data[:, 9] = 2
+    data[:, 10] = i
+    return pointsensor.PointSensor(data=data)
+
+
+# Iterations from history and individual files
+@testutils.run_sandbox(__file__)
+def test_01_iters():
+    # Start with empty history
+    P = pointsensor.CasePointSensor()
+    assert P.nIter == 0
+    # Add two steady-state iterations
+    P.AppendIterations([make_ps(100, 1), make_ps(200, 2)])
+    P.iSteady = 200
+    assert P.nIter == 2
+    assert np.all(P.i == [100, 200])
+    # Save history
+    P.WriteHist()
+    tic = os.path.getmtime("pointSensors.hist.dat")
+    # Time-accurate outputs after the history was written
+    for i in (5, 10):
+        fname = "pointSensors.%06i.dat" % i
+        make_ps(i, i).Write(fname)
+        os.utime(fname, (tic + i, tic + i))
+    # Read history and new files
+    P = pointsensor.CasePointSensor()
+    assert P.nIter == 4
+    # Iterations must include the appended files
+    assert np.all(P.i == [100, 200, 205, 210])
+    assert np.all(P.i == P.data[0, :, -1])
+    assert P.i.flags.c_contiguous
+    # Statistics up to iteration 205 use samples at 200 and 205
+    s = P.GetStats(1, nStats=2, nLast=205)
+    assert np.isclose(s["dp"], np.mean(P.data[1, 1:3, 4]))
+    assert np.isclose(s["rho"], np.mean(P.data[1, 1:3, 5]))
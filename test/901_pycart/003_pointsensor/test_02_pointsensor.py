@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import pytest
+
+# Local imports
+from cape.pycart import pointsensor
+
+
+# Unsorted coordinates of three point sensors
+COORDS = np.array([
+    [2.0, 1.0, 0.0],
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.5]])
+
+
+# Create single-iteration point sensor
+def make_ps(i=100, n=3):
+    # Random states
+    rng = np.random.default_rng(i)
+    # Coordinates, states, refinement levels, iteration
+    data = np.zeros((n, 11))
+    data[:, :3] = COORDS[:n]
+    data[:, 3:9] = rng.random((n, 6))
+    data[:, 9] = 2
+    data[:, 10] = i
+    return pointsensor.PointSensor(data=data)
+
+
+# Copy a point sensor
+def test_01_copy():
+    # Create point sensor (sorted on creation)
+    PS = make_ps()
+    assert np.all(PS.X == [0.0, 1.0, 2.0])
+    PS.nIter = 3
+    # Copy
+    P2 = PS.copy()
+    # Same data, not shared
+    assert np.all(P2.data == PS.data)
+    assert not np.shares_memory(P2.data, PS.data)
+    assert P2.nIter == 3
+    assert P2.nd == 3
+    assert P2.nPoint == 3
+    # Column attributes refer to copied data
+    P2.data[0, 3] = -1.0
+    assert P2.dp[0] == -1.0
+    assert PS.dp[0] != -1.0
+
+
+# Arithmetic operators
+def test_02_operators():
+    # Create two point sensors
+    P1 = make_ps(100)
+    P2 = make_ps(200)
+    # Multiply by integer; number of iterations is scaled
+    P3 = P1 * 2
+    assert np.allclose(P3.data[:, 3:9], 2*P1.data[:, 3:9])
+    assert np.all(P3.data[:, :3] == P1.data[:, :3])
+    assert P3.nIter == 2
+    # Multiply by float from the left
+    P3 = 0.5 * P1
+    assert np.allclose(P3.data[:, 3:9], 0.5*P1.data[:, 3:9])
+    assert P3.nIter == 1
+    # Divide
+    P3 = P1 / 4
+    assert np.allclose(P3.data[:, 3:9], 0.25*P1.data[:, 3:9])
+    # Add
+    P3 = P1 + P2
+    assert np.allclose(P3.data[:, 3:9], P1.data[:, 3:9] + P2.data[:, 3:9])
+    assert P3.nIter == 2
+    # Average
+    P3 = (P1 + P2) / 2
+    assert np.allclose(
+        P3.data[:, 3:9], 0.5*(P1.data[:, 3:9] + P2.data[:, 3:9]))
+    # Inputs are unchanged
+    assert P1.nIter == 1
+    assert np.allclose(P1.data, make_ps(100).data)
+
+
+# Invalid operands
+def test_03_operator_errors():
+    # Create point sensor
+    P1 = make_ps()
+    # Only scalars can multiply or divide
+    with pytest.raises(TypeError):
+        P1 * "a"
+    with pytest.raises(TypeError):
+        P1 / [2]
+    # Only point sensors can be added
+    with pytest.raises(TypeError):
+        P1 + 1.0
+    # Number of points must match
+    with pytest.raises(IndexError):
+        P1 + make_ps(n=2)
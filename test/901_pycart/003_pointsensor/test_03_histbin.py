@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pycart import pointsensor
+
+
+# Create single-iteration point sensor
+def make_ps(i, nd=3, n=4):
+    # Random states
+    rng = np.random.default_rng(i)
+    # Coordinates, states, refinement levels, iteration
+    data = np.zeros((n, 2*nd + 5))
+    data[:, 0] = np.arange(n)
+    data[:, 1:-2] = rng.standard_normal((n, 2*nd + 2))
+    data[:, -2] = 3
+    data[:, -1] = i
+    return pointsensor.PointSensor(data=data)
+
+
+# Write history and read it back from both formats
+def check_hist(nd):
+    # Create history
+    P = pointsensor.CasePointSensor()
+    P.AppendIterations([make_ps(i, nd) for i in (100, 200, 250)])
+    P.iSteady = 200
+    # Write text and binary files
+    P.WriteHist()
+    assert os.path.isfile("pointSensors.hist.bin")
+    # Read binary file
+    PB = pointsensor.CasePointSensor()
+    PB.ReadHistBin()
+    # Binary history is exact
+    assert (PB.nPoint, PB.nIter, PB.nd, PB.iSteady) == (4, 3, nd, 200)
+    assert np.all(PB.data == P.data)
+    assert np.all(PB.i == [100, 200, 250])
+    # Remove binary file and read text
+    os.remove("pointSensors.hist.bin")
+    PT = pointsensor.CasePointSensor()
+    # Text history matches to print precision
+    assert (PT.nPoint, PT.nIter, PT.nd, PT.iSteady) == (4, 3, nd, 200)
+    assert PT.data.shape == PB.data.shape
+    np.testing.assert_allclose(PT.data, PB.data, rtol=1e-8)
+    assert np.all(PT.i == PB.i)
+
+
+# 3D point sensors
+@testutils.run_sandbox(__file__)
+def test_01_hist3d():
+    check_hist(3)
+
+
+# 2D point sensors
+@testutils.run_sandbox(__file__)
+def test_02_hist2d():
+    check_hist(2)
+
+
+# Incomplete binary file
+@testutils.run_sandbox(__file__)
+def test_03_truncated():
+    # Create and write history
+    P = pointsensor.CasePointSensor()
+    P.AppendIterations([make_ps(i) for i in (100, 200)])
+    P.WriteHist()
+    # Truncate binary file
+    with open("pointSensors.hist.bin", "rb") as f:
+        buf = f.read()
+    with open("pointSensors.hist.bin", "wb") as f:
+        f.write(buf[:-8])
+    # Binary reader rejects it
+    assert not pointsensor.CasePointSensor().ReadHistBin()
+    # Full reader falls back to text file
+    PT = pointsensor.CasePointSensor()
+    assert PT.nIter == 2
+    np.testing.assert_allclose(PT.data, P.data, rtol=1e-8)
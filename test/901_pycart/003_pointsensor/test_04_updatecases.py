@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import json
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.pycart.cntl
+from cape.pycart import pointsensor
+
+
+# Options for a run matrix with one point sensor group
+OPTS = {
+    "DataBook": {
+        "Components": ["P1"],
+        "P1": {
+            "Type": "PointSensor",
+            "Points": ["p1", "p2"]
+        },
+        "nStats": 3,
+        "nMin": 0,
+        "Folder": "data"
+    },
+    "RunMatrix": {
+        "Keys": ["mach", "alpha"],
+        "mach": [0.8, 0.9, 1.1, 1.2, 1.5],
+        "alpha": [0.0, 2.0, 4.0, 2.0, 0.0],
+        "GroupPrefix": "poweroff"
+    }
+}
+
+# Point sensor coordinates
+COORDS = {
+    "p1": [0.0, 0.0, 0.0],
+    "p2": [1.0, 0.0, 0.5],
+}
+
+# Template for ``input.cntl``
+INPUT_CNTL = """$__Case_Information:
+
+Mach     %.2f
+
+$__Post_Processing:
+
+pointSensor p1  0.0 0.0 0.0
+pointSensor p2  1.0 0.0 0.5
+"""
+
+
+# Create a case folder with point sensor history
+def make_case(cntl, i):
+    # Case folder
+    frun = cntl.x.GetFullFolderNames(i)
+    os.makedirs(frun)
+    # Input file for Mach number and point coordinates
+    with open(os.path.join(frun, "input.cntl"), "w") as f:
+        f.write(INPUT_CNTL % cntl.x["mach"][i])
+    # Random states
+    rng = np.random.default_rng(i)
+    # Iterative history
+    nIter = 5 + i
+    P = pointsensor.CasePointSensor(cwd=frun)
+    PSs = []
+    for n in range(nIter):
+        # Coordinates, states, refinement levels, iteration
+        data = np.zeros((2, 11))
+        data[:, :3] = [COORDS["p1"], COORDS["p2"]]
+        data[:, 3:9] = rng.random((2, 6))
+        data[:, 9] = 2
+        data[:, 10] = 100*(n + 1)
+        PSs.append(pointsensor.PointSensor(data=data))
+    P.AppendIterations(PSs)
+    P.WriteHist(os.path.join(frun, "pointSensors.hist.dat"))
+    # Flow solver history for last iteration
+    with open(os.path.join(frun, "history.dat"), "w") as f:
+        f.write("# cycle\n")
+        f.write("   %i  0.0\n" % (100*nIter))
+
+
+# Group data book that records saved case histories
+class RecordGroup(pointsensor.DBPointSensorGroup):
+    def _SaveCase(self, i, P):
+        self.saved.append((i, P.i, P.data))
+
+
+# Point data book that records saved case histories
+class RecordPoint(pointsensor.DBPointSensor):
+    def _SaveCase(self, i, P):
+        self.saved.append((i, P.i, P.data))
+
+
+# Update data book and return saved cases
+def update(DB, I, nthreads):
+    DB.saved = []
+    DB.UpdateCases(I, nthreads=nthreads)
+    return DB.saved
+
+
+# Check that two lists of saved cases are identical
+def check_saved(S1, S2):
+    assert [i for i, _, _ in S1] == [i for i, _, _ in S2]
+    for (_, i1, d1), (_, i2, d2) in zip(S1, S2):
+        assert np.all(i1 == i2)
+        assert np.all(d1 == d2)
+
+
+# Compare serial and threaded updates
+@testutils.run_sandbox(__file__)
+def test_01_updatecases():
+    # Write options
+    with open("pyCart.json", "w") as f:
+        json.dump(OPTS, f)
+    # Read settings
+    cntl = cape.pycart.cntl.Cntl()
+    # Create cases, leaving out one case folder
+    for i in (0, 1, 2, 4):
+        make_case(cntl, i)
+    # Case list, including missing case
+    I = [4, 2, 3, 0, 1]
+    # Group data book: serial and threaded
+    DBG = RecordGroup(cntl.x, cntl.opts, "P1")
+    S1 = update(DBG, I, 1)
+    S2 = update(DBG, I, 4)
+    # Saved in order of *I*, skipping missing case
+    assert [i for i, _, _ in S1] == [4, 2, 0, 1]
+    check_saved(S1, S2)
+    # Case histories were read from the right folders
+    for i, iters, _ in S1:
+        assert np.all(iters == 100*np.arange(1, 6 + i))
+    # Individual point data book
+    DBP = RecordPoint(cntl.x, cntl.opts, "p2", "P1")
+    check_saved(update(DBP, I, 1), update(DBP, I, 3))
+    check_saved(update(DBP, I, 1), S1)
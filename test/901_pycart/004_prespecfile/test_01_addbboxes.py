@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pycart.prespecfile import PreSpecCntl
+
+
+# List of file globs to copy into sandbox
+TEST_FILES = (
+    "preSpec.c3d.cntl",
+)
+
+# Refinement levels and limits of several boxes
+NS = [4, 7, 9]
+XLIMS = [
+    [0.0, 1.0, -0.5, 0.5, -0.25, 0.25],
+    np.array([-2.5, 3.125, -1e-3, 1e-3, 0, 12]),
+    [1, 2, 3, 4, 5, 6],
+]
+
+
+# Batched boxes match one-at-a-time boxes
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_addbboxes():
+    # Add boxes one at a time
+    p1 = PreSpecCntl()
+    for n, xlim in zip(NS, XLIMS):
+        p1.AddBBox(n, xlim)
+    p1.Write("preSpec1.c3d.cntl")
+    # Add boxes all at once
+    p2 = PreSpecCntl()
+    p2.AddBBoxes(NS, XLIMS)
+    p2.Write("preSpec2.c3d.cntl")
+    # Compare files byte for byte
+    with open("preSpec1.c3d.cntl", "rb") as f:
+        b1 = f.read()
+    with open("preSpec2.c3d.cntl", "rb") as f:
+        b2 = f.read()
+    assert b1 == b2
+    # All boxes were added
+    assert b2.count(b"BBox:") == 5
+
+
+# Empty list of boxes
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_02_empty():
+    # Add no boxes
+    p = PreSpecCntl()
+    p.AddBBoxes([], [])
+    p.Write("preSpec1.c3d.cntl")
+    # File is unchanged
+    with open("preSpec.c3d.cntl", "rb") as f:
+        b0 = f.read()
+    with open("preSpec1.c3d.cntl", "rb") as f:
+        b1 = f.read()
+    assert b0 == b1